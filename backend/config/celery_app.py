@@ -5,7 +5,8 @@ from celery import Celery
 # set the default Django settings module for the 'celery' program.
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.local")
 
-app = Celery("shiritori")
+# Every task checks its queries against the budget it declares with `@shared_task(query_budget=...)`.
+app = Celery("shiritori", task_cls="shiritori.utils.query_budget:QueryBudgetTask")
 
 # Using a string here means the worker doesn't have to serialize
 # the configuration object to child processes.
@@ -246,6 +246,17 @@ CELERY_TASK_TIME_LIMIT = 60 * 60 * 20
 CELERY_TASK_SOFT_TIME_LIMIT = 60 * 60 * 24
 # https://docs.celeryq.dev/en/stable/userguide/configuration.html#beat-scheduler
 CELERY_BEAT_SCHEDULER = "django_celery_beat.schedulers:DatabaseScheduler"
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#beat-schedule
+CELERY_BEAT_SCHEDULE = {
+    "supervise-game-leases": {
+        "task": "shiritori.game.tasks.supervise_game_leases_task",
+        "schedule": env.float("GAME_LEASE_SUPERVISOR_INTERVAL", default=2.0),
+    },
+    "flush-hot-games": {
+        "task": "shiritori.game.tasks.flush_hot_games_task",
+        "schedule": env.float("HOT_STATE_FLUSH_INTERVAL", default=2.0),
+    },
+}
 # https://docs.celeryq.dev/en/stable/userguide/configuration.html#worker-send-task-events
 CELERY_WORKER_SEND_TASK_EVENTS = True
 # https://docs.celeryq.dev/en/stable/userguide/configuration.html#std-setting-task_send_sent_event
@@ -288,3 +299,39 @@ SPECTACULAR_SETTINGS = {
 # ------------------------------------------------------------------------------
 SESSION_EXPIRE_AT_BROWSER_CLOSE = True
 LOAD_DICTIONARY_KEY = env("LOAD_DICTIONARY_KEY", default="load_dictionary")
+# Validate words against an in-memory index instead of querying the word table.
+DICTIONARY_INDEX_ENABLED = env.bool("DICTIONARY_INDEX_ENABLED", default=True)
+# Where `manage.py build_dictionary_index` writes the prebuilt, memory-mapped dictionary indexes.
+DICTIONARY_INDEX_DIR = env("DICTIONARY_INDEX_DIR", default=str(BASE_DIR / "dictionaries" / "index"))
+# Reject words that are definitely not in the dictionary with a Bloom filter before the exact lookup.
+DICTIONARY_BLOOM_FILTER_ENABLED = env.bool("DICTIONARY_BLOOM_FILTER_ENABLED", default=False)
+DICTIONARY_BLOOM_FILTER_FALSE_POSITIVE_RATE = env.float("DICTIONARY_BLOOM_FILTER_FALSE_POSITIVE_RATE", default=0.01)
+# How often (in seconds) a process checks whether a dictionary was reloaded elsewhere.
+DICTIONARY_INDEX_REFRESH_INTERVAL = env.int("DICTIONARY_INDEX_REFRESH_INTERVAL", default=30)
+# Run turn timers in the `manage.py run_turn_timers` service instead of one Celery task per game.
+TURN_TIMER_SERVICE_ENABLED = env.bool("TURN_TIMER_SERVICE_ENABLED", default=False)
+# How often (in seconds) the timer service looks for new games and turns taken by players.
+TURN_TIMER_POLL_INTERVAL = env.float("TURN_TIMER_POLL_INTERVAL", default=1.0)
+# How long (in seconds) past its turn deadline a game has to be before another timer service takes it over.
+TURN_TIMER_CLAIM_GRACE = env.int("TURN_TIMER_CLAIM_GRACE", default=30)
+# Run turn timers from the Redis turn queue and `manage.py run_turn_queue` workers.
+# Takes precedence over TURN_TIMER_SERVICE_ENABLED, the two must not run the same games.
+TURN_QUEUE_ENABLED = env.bool("TURN_QUEUE_ENABLED", default=False)
+# The Redis server holding the turn queue, `memory://` keeps it in-process.
+TURN_QUEUE_URL = env("TURN_QUEUE_URL", default=CELERY_BROKER_URL)
+# The longest (in seconds) a turn queue worker sleeps between checking for due games.
+TURN_QUEUE_TICK = env.float("TURN_QUEUE_TICK", default=1.0)
+# How long (in seconds) a worker has to handle the games it claimed before other workers may claim them again.
+TURN_QUEUE_LEASE = env.float("TURN_QUEUE_LEASE", default=2.0)
+# The most games a worker claims in one tick.
+TURN_QUEUE_BATCH = env.int("TURN_QUEUE_BATCH", default=100)
+# How long (in seconds) a turn loop keeps a game's lease without heartbeating, before the supervisor restarts it.
+GAME_LEASE_TTL = env.float("GAME_LEASE_TTL", default=5.0)
+# Play games in progress from Redis and write them to the database in batches.
+HOT_STATE_ENABLED = env.bool("HOT_STATE_ENABLED", default=False)
+# The Redis server holding the hot game state, `memory://` keeps it in-process.
+HOT_STATE_URL = env("HOT_STATE_URL", default=CELERY_BROKER_URL)
+# Raise instead of logging a warning when an HTTP action, websocket handler or Celery task breaks its query budget.
+QUERY_BUDGET_RAISE = env.bool("QUERY_BUDGET_RAISE", default=False)
+# How often one statement may run in a budgeted call before it is reported as an N+1.
+QUERY_BUDGET_REPEAT_LIMIT = env.int("QUERY_BUDGET_REPEAT_LIMIT", default=10)
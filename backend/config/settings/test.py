@@ -28,6 +28,8 @@ EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
 # Your stuff...
 # ------------------------------------------------------------------------------
 CHANNEL_LAYERS = {"default": {"BACKEND": "channels.layers.InMemoryChannelLayer"}}
+# Always build dictionary indexes from the test database
+DICTIONARY_INDEX_DIR = None
 # DATABASES
 # ------------------------------------------------------------------------------
 # https://docs.djangoproject.com/en/dev/ref/settings/#databases
@@ -42,3 +44,5 @@ DATABASES = {
     #     "NAME": env("POSTGRES_DB", default="shiritori"),
     # }
 }
+# Fail tests that break a query budget
+QUERY_BUDGET_RAISE = True
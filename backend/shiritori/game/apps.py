@@ -7,3 +7,4 @@ class GameConfig(AppConfig):
 
     def ready(self) -> None:
         import shiritori.game.signals  # noqa: F401
+        import shiritori.utils.query_budget  # noqa: F401
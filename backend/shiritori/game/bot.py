@@ -0,0 +1,266 @@
+import dataclasses
+import math
+import random
+import time
+from collections.abc import Callable, Collection, Sequence
+
+from shiritori.game.dictionary import LetterIndex
+from shiritori.game.models.text_choices import BotDifficulty
+from shiritori.game.utils import calculate_score
+
+__all__ = (
+    "BOT_THINK_TIME",
+    "SearchResult",
+    "MoveSearch",
+    "choose_word",
+)
+
+# Seconds of turn time a bot waits before answering, capped at half the turn time.
+BOT_THINK_TIME = {
+    BotDifficulty.EASY: 6,
+    BotDifficulty.MEDIUM: 4,
+    BotDifficulty.HARD: 2,
+}
+# How many random candidates a bot looks at before settling on one.
+BOT_SAMPLE_SIZE = {
+    BotDifficulty.EASY: 4,
+    BotDifficulty.MEDIUM: 8,
+}
+# Wall clock seconds the hard bot may search for, well under one tick of the turn loop.
+SEARCH_TIME_BUDGET = 0.05
+SEARCH_MAX_DEPTH = 8
+# The search only considers the best few moves of each letter, one per last letter,
+# picked from the longest words that start with it.
+SEARCH_BRANCHING = 8
+SEARCH_SCAN_LIMIT = 256
+SEARCH_WORDS_PER_LAST_LETTER = 3
+
+
+class _SearchTimeout(Exception):
+    pass
+
+
+@dataclasses.dataclass
+class SearchResult:
+    word: str | None = None
+    value: float = 0.0
+    depth: int = 0
+    nodes: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes / self.elapsed if self.elapsed else 0.0
+
+
+class MoveSearch:
+    """
+    A negamax search with alpha-beta pruning over last-letter states.
+
+    A move is worth the ``calculate_score`` of its word minus what the next player can make of the letter
+    it leaves them, so the search both favours long words that use new letters and steers the next player
+    into letters with few words left. A player without a word scores the missed word penalty for the turn.
+    Leaves are scored with the best word the player to move could play.
+
+    ``search`` deepens one ply at a time until the time budget runs out and returns the best move
+    of the last completed depth, so it never overruns its budget by more than one node.
+    """
+
+    def __init__(
+        self,
+        letter_index: LetterIndex,
+        min_length: int,
+        used_words: Collection[str],
+        used_letters: Collection[str] = (),
+        *,
+        duration: int | float = 0,
+        turn_time: int | float = 60,
+        is_valid: Callable[[str], bool] | None = None,
+    ):
+        self.letter_index = letter_index
+        self.min_length = min_length
+        self.used_words = set(used_words)
+        self.used_letters = set(used_letters)
+        self.duration = duration
+        self.is_valid = is_valid
+        self.miss_penalty = calculate_score(None, turn_time)
+        self.nodes = 0
+        self.deadline = math.inf
+        self._candidates: dict[str, list[str]] = {}
+
+    def _letter_candidates(self, letter: str) -> list[str]:
+        # The longest few words for every last letter, cached per letter for the whole search.
+        if (candidates := self._candidates.get(letter)) is not None:
+            return candidates
+        index, per_last_letter = self.letter_index.index, {}
+        positions = self.letter_index.bucket_positions(letter, self.min_length)
+        for i in range(len(positions) - 1, max(len(positions) - SEARCH_SCAN_LIMIT, 0) - 1, -1):
+            word = index.word_at(positions[i]).decode("utf-8")
+            if len(word) < self.min_length or (self.is_valid and not self.is_valid(word)):
+                continue
+            words = per_last_letter.setdefault(word[-1], [])
+            if len(words) < SEARCH_WORDS_PER_LAST_LETTER:
+                words.append(word)
+        candidates = [word for words in per_last_letter.values() for word in words]
+        self._candidates[letter] = candidates
+        return candidates
+
+    def score(self, word: str) -> int:
+        """
+        Score a word the way the game would if it was played now.
+        :param word: str - The word.
+        :return: int - The score of the word.
+        """
+        return calculate_score(word, self.duration, word[-1] not in self.used_letters)
+
+    def moves(self, letter: str) -> list[str]:
+        """
+        Get the moves the search considers for a letter, best scoring first, one per last letter.
+        :param letter: str - The letter the word must start with.
+        :return: list[str] - The words.
+        """
+        by_last_letter = {}
+        for word in self._letter_candidates(letter):
+            if word not in self.used_words and word[-1] not in by_last_letter:
+                by_last_letter[word[-1]] = word
+        return sorted(by_last_letter.values(), key=self.score, reverse=True)[:SEARCH_BRANCHING]
+
+    def _play(self, word: str, depth: int, alpha: float, beta: float) -> float:
+        new_letter = word[-1] not in self.used_letters
+        value = self.score(word)
+        self.used_words.add(word)
+        if new_letter:
+            self.used_letters.add(word[-1])
+        try:
+            return value - self._negamax(word[-1], depth, -beta, -alpha)
+        finally:
+            self.used_words.discard(word)
+            if new_letter:
+                self.used_letters.discard(word[-1])
+
+    def _negamax(self, letter: str, depth: int, alpha: float, beta: float) -> float:
+        self.nodes += 1
+        if time.perf_counter() > self.deadline:
+            raise _SearchTimeout
+        moves = self.moves(letter)
+        if not moves:
+            return self.miss_penalty
+        if depth == 0:
+            return self.score(moves[0])
+        best = -math.inf
+        for word in moves:
+            best = max(best, self._play(word, depth - 1, alpha, beta))
+            alpha = max(alpha, best)
+            if alpha >= beta:
+                break
+        return best
+
+    def search(
+        self, letter: str, time_budget: float = SEARCH_TIME_BUDGET, max_depth: int = SEARCH_MAX_DEPTH
+    ) -> SearchResult:
+        """
+        Find the best word to play from a letter, deepening until the time budget or the maximum depth is reached.
+        :param letter: str - The letter the word must start with.
+        :param time_budget: float - The seconds the search may take.
+        :param max_depth: int - The maximum number of replies to look ahead.
+        :return: SearchResult - The best word and how deep and how many nodes were searched.
+        """
+        started = time.perf_counter()
+        self.deadline = started + time_budget
+        self.nodes = 0
+        moves = self.moves(letter)
+        result = SearchResult(word=moves[0] if moves else None)
+        for depth in range(1, max_depth + 1):
+            if len(moves) <= 1:
+                break
+            best, best_value, alpha = None, -math.inf, -math.inf
+            try:
+                for word in moves:
+                    value = self._play(word, depth - 1, alpha, math.inf)
+                    if value > best_value:
+                        best, best_value = word, value
+                    alpha = max(alpha, value)
+            except _SearchTimeout:
+                break
+            result.word, result.value, result.depth = best, best_value, depth
+            # Search the best move of this depth first at the next one, it makes the most cutoffs.
+            moves.remove(best)
+            moves.insert(0, best)
+        result.nodes = self.nodes
+        result.elapsed = time.perf_counter() - started
+        return result
+
+
+def _candidate_pool(candidates: Sequence[int], difficulty: str) -> Sequence[int]:
+    # Candidates are sorted shortest first, so the easy bot sticks to the short third.
+    if difficulty == BotDifficulty.EASY:
+        return candidates[: max(len(candidates) // 3, 1)]
+    return candidates
+
+
+def choose_word(
+    letter_index: LetterIndex,
+    last_word: str,
+    min_length: int,
+    used_words: Collection[str],
+    difficulty: str = BotDifficulty.MEDIUM,
+    *,
+    used_letters: Collection[str] = (),
+    duration: int | float = 0,
+    turn_time: int | float = 60,
+    is_valid: Callable[[str], bool] | None = None,
+    rng: random.Random | None = None,
+) -> str | None:
+    """
+    Choose the word a bot plays after ``last_word``.
+
+    The hard bot runs a ``MoveSearch``. The others draw a handful of random candidates from the letter index,
+    so the cost does not depend on how many words start with the letter, and play the first usable one.
+    If no drawn candidate is usable the candidates are scanned in order, so a bot only gives up when
+    there really is no word left.
+    :param letter_index: LetterIndex - The letter index of the game's locale.
+    :param last_word: str - The previous word, the chosen word starts with its last letter.
+    :param min_length: int - The minimum length of the word.
+    :param used_words: Collection[str] - The words already played in the game.
+    :param difficulty: str - The BotDifficulty of the bot.
+    :param used_letters: Collection[str] - The last letters of the words already played in the game.
+    :param duration: int | float - How long the bot takes to answer.
+    :param turn_time: int | float - The turn time of the game.
+    :param is_valid: Callable[[str], bool] | None - An extra check for candidates, e.g. an older dictionary version.
+    :param rng: random.Random | None - The random number generator to draw candidates with.
+    :return: str | None - The chosen word, or None if there is no valid word left.
+    """
+    if not last_word:
+        return None
+    if difficulty == BotDifficulty.HARD:
+        search = MoveSearch(
+            letter_index,
+            min_length,
+            used_words,
+            used_letters,
+            duration=duration,
+            turn_time=turn_time,
+            is_valid=is_valid,
+        )
+        if (word := search.search(last_word[-1]).word) is not None:
+            return word
+
+    rng = rng or random
+    candidates = letter_index.bucket_positions(last_word[-1], min_length)
+    pool = _candidate_pool(candidates, difficulty)
+    if not pool:
+        return None
+
+    def usable(position: int) -> str | None:
+        word = letter_index.index.word_at(position).decode("utf-8")
+        if len(word) < min_length or word in used_words or (is_valid and not is_valid(word)):
+            return None
+        return word
+
+    for _ in range(min(BOT_SAMPLE_SIZE.get(difficulty, 1), len(pool))):
+        if (word := usable(pool[rng.randrange(len(pool))])) is not None:
+            return word
+    for position in candidates:
+        if (word := usable(position)) is not None:
+            return word
+    return None
@@ -7,8 +7,11 @@ from djangorestframework_camel_case.util import camelize
 
 from shiritori.game import tasks
 from shiritori.game.converters import aconvert_game_to_json, adisconnect_player, aget_game, aget_player_from_cookie
+from shiritori.game.events import EncodedEventDict, encode_event
+from shiritori.game.hot_state import get_hot_game_store_for
 from shiritori.game.models import Game, GameStatus, Player
 from shiritori.game.serializers import ShiritoriGameSerializer
+from shiritori.utils.query_budget import QueryBudgetConsumerMixin
 
 __all__ = (
     "GameLobbyConsumer",
@@ -16,12 +19,20 @@ __all__ = (
 )
 
 
-class CamelizedWebSocketConsumer(AsyncJsonWebsocketConsumer):
+class CamelizedWebSocketConsumer(QueryBudgetConsumerMixin, AsyncJsonWebsocketConsumer):
     async def send_json(self, content, close=False):
         return await super().send_json(camelize(content, **api_settings.JSON_UNDERSCOREIZE), close)
 
+    async def send_event(self, event: EncodedEventDict):
+        # Events arrive from the channel layer already encoded, every socket of the group sends the same text.
+        await self.send(text_data=event["text"])
+
 
 class GameLobbyConsumer(CamelizedWebSocketConsumer):
+    # Connecting serializes every waiting game, so it has no fixed budget. The events are only forwarded.
+    query_budgets = {"websocket.connect": None, "websocket.disconnect": 0}
+    default_query_budget = 0
+
     @staticmethod
     def get_all_waiting_games():
         all_waiting_games = Game.objects.filter(status=GameStatus.WAITING)
@@ -41,16 +52,19 @@ class GameLobbyConsumer(CamelizedWebSocketConsumer):
         await self.channel_layer.group_discard("lobby", self.channel_name)
 
     async def game_created(self, event):
-        await self.send_json(event)
+        await self.send_event(event)
 
     async def game_updated(self, event):
-        await self.send_json(event)
+        await self.send_event(event)
 
     async def game_deleted(self, event):
-        await self.send_json(event)
+        await self.send_event(event)
 
 
 class GameConsumer(CamelizedWebSocketConsumer):
+    query_budgets = {"websocket.connect": 25, "websocket.disconnect": 15}
+    default_query_budget = 0
+
     def __init__(self, *args, **kwargs):
         super().__init__(args, kwargs)
         self.game_group_name: str | None = None
@@ -73,20 +87,24 @@ class GameConsumer(CamelizedWebSocketConsumer):
             else None
         )
         self_player.is_connected = True
-        await self_player.asave()  # type: ignore
+        await sync_to_async(tasks.cancel_player_disconnect)(self_player)
+        await self_player.asave(update_fields=["is_connected", "disconnect_task_id"])  # type: ignore
+        hot_game = await sync_to_async(self.set_hot_player_connected)(game_id, self_player.id, True)
         await self.channel_layer.group_add(self.game_group_name, self.channel_name)
 
         await self.channel_layer.group_send(
             game_id,
-            {
-                "type": "player_connected",
-                "data": {
-                    "player_id": self_player.id,
-                },
-            },
+            encode_event(
+                {
+                    "type": "player_connected",
+                    "data": {
+                        "player_id": self_player.id,
+                    },
+                }
+            ),
         )
 
-        game_data = await aconvert_game_to_json(game)
+        game_data = hot_game or await aconvert_game_to_json(game)
 
         await self.send_json(
             {
@@ -98,56 +116,71 @@ class GameConsumer(CamelizedWebSocketConsumer):
             }
         )
 
+    @staticmethod
+    def set_hot_player_connected(game_id: str, player_id: str, connected: bool) -> dict | None:
+        """
+        Keep a hot game's connected players up to date, since its players are not read from the database.
+        :return: dict | None - The hot game, or None if it is played from the database.
+        """
+        if not (hot_game_store := get_hot_game_store_for(game_id)):
+            return None
+        hot_game_store.set_connected(game_id, player_id, connected)
+        state = hot_game_store.get(game_id)
+        return hot_game_store.game_json(state) if state else None
+
     async def disconnect(self, code):
         game_id = self.scope["url_route"]["kwargs"]["game_id"]
         if not self.scope["session"].session_key:
             return
         player = await adisconnect_player(game_id, self.scope["session"].session_key)
         if player:
-            tasks.player_disconnect_task.delay(player.id)
+            await sync_to_async(tasks.schedule_player_disconnect)(player.id)
+            await sync_to_async(self.set_hot_player_connected)(game_id, player.id, False)
             await self.channel_layer.group_send(
                 game_id,
-                {
-                    "type": "player_disconnected",
-                    "data": {
-                        "player_id": player.id,
-                    },
-                },
+                encode_event(
+                    {
+                        "type": "player_disconnected",
+                        "data": {
+                            "player_id": player.id,
+                        },
+                    }
+                ),
             )
         await self.channel_layer.group_discard(self.game_group_name, self.channel_name)
 
     async def game_updated(self, event):
-        await self.send_json(event)
+        await self.send_event(event)
 
     async def game_timer_updated(self, event):
-        await self.send_json(event)
+        await self.send_event(event)
 
     async def player_connected(self, event):
-        await self.send_json(event)
+        await self.send_event(event)
 
     async def player_disconnected(self, event):
-        await self.send_json(event)
+        await self.send_event(event)
 
     async def player_joined(self, event):
-        await self.send_json(event)
+        await self.send_event(event)
 
     async def player_updated(self, event):
-        await self.send_json(event)
+        await self.send_event(event)
 
     async def player_left(self, event):
-        await self.send_json(event)
+        await self.send_event(event)
 
     async def turn_taken(self, event):
-        await self.send_json(event)
+        await self.send_event(event)
 
     async def game_start_countdown_start(self, event):
-        await self.send_json(event)
+        await self.send_event(event)
 
     async def game_start_countdown(self, event):
-        await self.send_json(event)
+        await self.send_event(event)
 
     async def game_start_countdown_cancel(self, event):
-        await self.send_json(event)
+        await self.send_event(event)
 
     async def game_start_countdown_end(self, event):
-        await self.send_json(event)
+        await self.send_event(event)
@@ -1,3 +1,4 @@
+from collections.abc import Collection
 from typing import Any
 
 from asgiref.sync import sync_to_async
@@ -26,8 +27,8 @@ def convert_to_camel(data: ReturnDict[Any]):
     return camelize(data, **api_settings.JSON_UNDERSCOREIZE)
 
 
-def convert_game_to_json(game: Game) -> ReturnDict[Game] | ReturnDict:
-    return ShiritoriGameSerializer(instance=game).data
+def convert_game_to_json(game: Game, fields: Collection[str] | None = None) -> ReturnDict[Game] | ReturnDict:
+    return ShiritoriGameSerializer(instance=game, fields=fields).data
 
 
 def convert_player_to_json(player: Player) -> ReturnDict[Player] | ReturnDict:
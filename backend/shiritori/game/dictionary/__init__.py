@@ -0,0 +1,26 @@
+from .bloom import BloomFilter, get_bloom_filter, get_bloom_filter_stats
+from .index import (
+    DictionaryIndex,
+    build_dictionary_artifact,
+    clear_dictionary_indexes,
+    get_dictionary_index,
+    get_dictionary_index_path,
+    invalidate_dictionary_index,
+    set_dictionary_index,
+)
+from .letters import LetterIndex, get_letter_index
+
+__all__ = (
+    "BloomFilter",
+    "get_bloom_filter",
+    "get_bloom_filter_stats",
+    "DictionaryIndex",
+    "get_dictionary_index_path",
+    "build_dictionary_artifact",
+    "get_dictionary_index",
+    "set_dictionary_index",
+    "invalidate_dictionary_index",
+    "clear_dictionary_indexes",
+    "LetterIndex",
+    "get_letter_index",
+)
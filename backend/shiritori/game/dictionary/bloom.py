@@ -0,0 +1,217 @@
+import hashlib
+import math
+import mmap
+import os
+import struct
+import tempfile
+from collections.abc import Collection
+from pathlib import Path
+
+from django.conf import settings
+
+from shiritori.game.dictionary.registry import LocaleRegistry
+from shiritori.game.utils import normalize_word
+
+__all__ = (
+    "BloomFilter",
+    "get_bloom_filter_path",
+    "build_bloom_filter",
+    "get_bloom_filter",
+    "get_bloom_filter_stats",
+)
+
+# magic, format version, size in bits, hash count, capacity
+ARTIFACT_HEADER = struct.Struct("<4sIQII")
+ARTIFACT_MAGIC = b"SHBF"
+ARTIFACT_VERSION = 1
+
+
+class BloomFilter:
+    """
+    A Bloom filter over normalized words.
+
+    ``might_contain`` never returns False for a word that was added, and returns True for a word
+    that was not added with roughly the false positive rate the filter was sized for.
+    It counts how many lookups it let through (``hits``) and rejected (``misses``),
+    and callers report let-through words that turned out to be missing with ``record_false_positive``.
+    """
+
+    __slots__ = ("bits", "size", "hash_count", "capacity", "hits", "misses", "false_positives")
+
+    def __init__(self, size: int, hash_count: int, capacity: int = 0, bits: memoryview | bytearray | None = None):
+        self.size = size
+        self.hash_count = hash_count
+        self.capacity = capacity
+        self.bits = bits if bits is not None else bytearray((size + 7) // 8)
+        self.hits = 0
+        self.misses = 0
+        self.false_positives = 0
+
+    @classmethod
+    def for_capacity(cls, capacity: int, false_positive_rate: float) -> "BloomFilter":
+        """
+        Create an empty filter sized for a number of words.
+        :param capacity: int - The number of words the filter will hold.
+        :param false_positive_rate: float - The target false positive rate, between 0 and 1.
+        :return: BloomFilter - The empty filter.
+        """
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("False positive rate must be between 0 and 1.")
+        capacity = max(capacity, 1)
+        size = max(8, math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2))
+        hash_count = max(1, round(size / capacity * math.log(2)))
+        return cls(size, hash_count, capacity)
+
+    @classmethod
+    def from_words(cls, words: Collection[str], false_positive_rate: float) -> "BloomFilter":
+        """
+        Build a filter holding the given words.
+        :param words: Collection[str] - The words to add.
+        :param false_positive_rate: float - The target false positive rate, between 0 and 1.
+        :return: BloomFilter - The filled filter.
+        """
+        bloom_filter = cls.for_capacity(len(words), false_positive_rate)
+        for word in words:
+            bloom_filter.add(word)
+        return bloom_filter
+
+    @classmethod
+    def open(cls, path: str | Path) -> "BloomFilter":
+        """
+        Open a filter written by ``write`` without reading it into memory.
+        :param path: str | Path - The path of the filter file.
+        :return: BloomFilter - The memory-mapped filter.
+        :raises ValueError: If the file is not a Bloom filter.
+        """
+        with open(path, "rb") as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(data) < ARTIFACT_HEADER.size:
+            data.close()
+            raise ValueError(f"{path} is not a version {ARTIFACT_VERSION} Bloom filter.")
+        magic, version, size, hash_count, capacity = ARTIFACT_HEADER.unpack_from(data)
+        if magic != ARTIFACT_MAGIC or version != ARTIFACT_VERSION:
+            data.close()
+            raise ValueError(f"{path} is not a version {ARTIFACT_VERSION} Bloom filter.")
+        return cls(size, hash_count, capacity, memoryview(data)[ARTIFACT_HEADER.size :])
+
+    def write(self, path: str | Path) -> None:
+        """
+        Write the filter to a file that can be opened with ``open``, replacing it atomically.
+        :param path: str | Path - The path of the filter file.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(
+                    ARTIFACT_HEADER.pack(ARTIFACT_MAGIC, ARTIFACT_VERSION, self.size, self.hash_count, self.capacity)
+                )
+                f.write(self.bits)
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _positions(self, word: str):
+        digest = hashlib.blake2b(normalize_word(word).encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (first + i * second) % self.size
+
+    def add(self, word: str) -> None:
+        """
+        Add a word to the filter.
+        :param word: str - The word to add.
+        """
+        for position in self._positions(word):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def might_contain(self, word: str) -> bool:
+        """
+        Check whether a word may be in the filter.
+        :param word: str - The word to check.
+        :return: bool - False if the word is definitely absent, True if it may be present.
+        """
+        if word:
+            bits = self.bits
+            for position in self._positions(word):
+                if not bits[position >> 3] & (1 << (position & 7)):
+                    break
+            else:
+                self.hits += 1
+                return True
+        self.misses += 1
+        return False
+
+    def record_false_positive(self) -> None:
+        """
+        Record that a word the filter let through was not in the dictionary.
+        """
+        self.false_positives += 1
+
+    @property
+    def stats(self) -> dict[str, int | float]:
+        lookups = self.hits + self.misses
+        return {
+            "size": self.size,
+            "hash_count": self.hash_count,
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "false_positives": self.false_positives,
+            "false_positive_rate": self.false_positives / lookups if lookups else 0.0,
+        }
+
+
+def get_bloom_filter_path(locale: str) -> Path | None:
+    """
+    Get the path of the prebuilt Bloom filter file for a locale.
+    :param locale: str - The locale of the dictionary.
+    :return: Path | None - The path, or None if prebuilt indexes are disabled.
+    """
+    if not settings.DICTIONARY_INDEX_DIR:
+        return None
+    return Path(settings.DICTIONARY_INDEX_DIR) / f"{locale}.bloom"
+
+
+def build_bloom_filter(locale: str) -> BloomFilter:
+    """
+    Build the Bloom filter for a locale from its dictionary index.
+    :param locale: str - The locale of the dictionary.
+    :return: BloomFilter - The filter, sized for ``DICTIONARY_BLOOM_FILTER_FALSE_POSITIVE_RATE``.
+    """
+    from shiritori.game.dictionary.index import get_dictionary_index
+
+    index = get_dictionary_index(locale)
+    words = [index.word_at(position).decode("utf-8") for position in range(len(index))]
+    return BloomFilter.from_words(words, settings.DICTIONARY_BLOOM_FILTER_FALSE_POSITIVE_RATE)
+
+
+def _load_bloom_filter(locale: str) -> BloomFilter:
+    if (path := get_bloom_filter_path(locale)) and path.exists():
+        return BloomFilter.open(path)
+    return build_bloom_filter(locale)
+
+
+_bloom_filters: LocaleRegistry[BloomFilter] = LocaleRegistry(_load_bloom_filter)
+
+
+def get_bloom_filter(locale: str) -> BloomFilter:
+    """
+    Get the Bloom filter for a locale, loading it on first use from the prebuilt file
+    in ``DICTIONARY_INDEX_DIR`` or, if there is none, building it from the dictionary index.
+    :param locale: str - The locale of the dictionary.
+    :return: BloomFilter - The filter for the locale.
+    """
+    return _bloom_filters.get(locale)
+
+
+def get_bloom_filter_stats() -> dict[str, dict[str, int | float]]:
+    """
+    Get the lookup counters of every Bloom filter loaded in this process, to help size them.
+    :return: dict[str, dict] - The counters keyed by locale.
+    """
+    return {locale: bloom_filter.stats for locale, bloom_filter in _bloom_filters.items()}
@@ -0,0 +1,241 @@
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+
+from django.conf import settings
+
+from shiritori.game.dictionary.registry import LocaleRegistry, bump_dictionary_version
+from shiritori.game.utils import normalize_word
+
+__all__ = (
+    "DictionaryIndex",
+    "get_dictionary_index_path",
+    "build_dictionary_artifact",
+    "get_dictionary_index",
+    "set_dictionary_index",
+    "invalidate_dictionary_index",
+    "clear_dictionary_indexes",
+)
+
+# magic, format version, word count, dictionary version (0 when unknown)
+ARTIFACT_HEADER = struct.Struct("<4sIIQ")
+ARTIFACT_MAGIC = b"SHDI"
+ARTIFACT_VERSION = 2
+
+
+class DictionaryIndex:
+    """
+    A read-only set of normalized words packed into a single sorted byte blob.
+
+    ``offsets[i]`` is where the i-th word starts in ``blob`` and ``offsets[i + 1]`` is where it ends,
+    so a lookup is a binary search over byte slices with no per-word Python objects kept alive.
+
+    The same layout is written to disk by ``write`` (header, offset table, words) with offsets
+    relative to the start of the file, so ``open`` can use a read-only ``mmap`` of the file as
+    the blob and every process on a host shares one page-cache copy of it.
+
+    ``version`` is the id of the dictionary version the words were read from, if known.
+    """
+
+    __slots__ = ("blob", "offsets", "version")
+
+    def __init__(self, blob: bytes, offsets: Sequence[int], version: int | None = None):
+        self.blob = blob
+        self.offsets = offsets
+        self.version = version
+
+    @classmethod
+    def from_words(cls, words: Iterable[str], version: int | None = None) -> "DictionaryIndex":
+        """
+        Build an index from an iterable of words.
+        :param words: Iterable[str] - The words to index, in any order and casing.
+        :param version: int | None - The dictionary version the words were read from.
+        :return: DictionaryIndex - The packed index.
+        """
+        encoded = sorted({normalize_word(word).encode("utf-8") for word in words if word})
+        offsets = array("I", [0])
+        blob = bytearray()
+        for word in encoded:
+            blob += word
+            offsets.append(len(blob))
+        return cls(bytes(blob), offsets, version)
+
+    @classmethod
+    def open(cls, path: str | Path) -> "DictionaryIndex":
+        """
+        Open an index written by ``write`` without reading it into memory.
+        :param path: str | Path - The path of the index file.
+        :return: DictionaryIndex - The memory-mapped index.
+        :raises ValueError: If the file is not a dictionary index.
+        """
+        with open(path, "rb") as f:
+            blob = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(blob) < ARTIFACT_HEADER.size:
+            blob.close()
+            raise ValueError(f"{path} is not a version {ARTIFACT_VERSION} dictionary index.")
+        magic, version, count, dictionary_version = ARTIFACT_HEADER.unpack_from(blob)
+        if magic != ARTIFACT_MAGIC or version != ARTIFACT_VERSION:
+            blob.close()
+            raise ValueError(f"{path} is not a version {ARTIFACT_VERSION} dictionary index.")
+        table = memoryview(blob)[ARTIFACT_HEADER.size : ARTIFACT_HEADER.size + (count + 1) * 4]
+        if sys.byteorder == "little":
+            offsets: Sequence[int] = table.cast("I")
+        else:
+            offsets = array("I", table)
+            offsets.byteswap()
+        return cls(blob, offsets, dictionary_version or None)
+
+    def write(self, path: str | Path) -> None:
+        """
+        Write the index to a file that can be opened with ``open``.
+        The file is replaced atomically, so processes that still map the old file keep working.
+        :param path: str | Path - The path of the index file.
+        """
+        path = Path(path)
+        start, end = self.offsets[0], self.offsets[-1]
+        base = ARTIFACT_HEADER.size + len(self.offsets) * 4
+        offsets = array("I", (offset - start + base for offset in self.offsets))
+        if sys.byteorder != "little":
+            offsets.byteswap()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(ARTIFACT_HEADER.pack(ARTIFACT_MAGIC, ARTIFACT_VERSION, len(self), self.version or 0))
+                f.write(offsets.tobytes())
+                f.write(self.blob[start:end])
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __contains__(self, word: object) -> bool:
+        if not isinstance(word, str) or not word:
+            return False
+        return self.find(normalize_word(word).encode("utf-8")) is not None
+
+    def word_at(self, position: int) -> bytes:
+        """
+        Get the encoded word stored at the given position.
+        :param position: int - The position of the word in sorted order.
+        :return: bytes - The UTF-8 encoded word.
+        """
+        return bytes(self.blob[self.offsets[position] : self.offsets[position + 1]])
+
+    def find(self, target: bytes) -> int | None:
+        """
+        Find the position of an encoded, normalized word.
+        :param target: bytes - The UTF-8 encoded word to look for.
+        :return: int | None - The position of the word, or None if it is not in the index.
+        """
+        blob, offsets = self.blob, self.offsets
+        low, high = 0, len(self)
+        while low < high:
+            middle = (low + high) // 2
+            candidate = blob[offsets[middle] : offsets[middle + 1]]
+            if candidate < target:
+                low = middle + 1
+            elif candidate > target:
+                high = middle
+            else:
+                return middle
+        return None
+
+
+def get_dictionary_index_path(locale: str) -> Path | None:
+    """
+    Get the path of the prebuilt index file for a locale.
+    :param locale: str - The locale of the dictionary.
+    :return: Path | None - The path, or None if prebuilt indexes are disabled.
+    """
+    if not settings.DICTIONARY_INDEX_DIR:
+        return None
+    return Path(settings.DICTIONARY_INDEX_DIR) / f"{locale}.idx"
+
+
+def _build_index(locale: str) -> DictionaryIndex:
+    from shiritori.game.models import Word
+
+    if (path := get_dictionary_index_path(locale)) and path.exists():
+        return DictionaryIndex.open(path)
+    version = Word.get_current_version(locale)
+    words = Word.get_words(locale).values_list("word", flat=True)
+    return DictionaryIndex.from_words(words.iterator(chunk_size=10_000), version)
+
+
+def build_dictionary_artifact(locale: str, words: Iterable[str] | None = None, version: int | None = None) -> Path:
+    """
+    Compile a locale into a prebuilt index file, plus a Bloom filter file when the filter is enabled.
+    :param locale: str - The locale of the dictionary.
+    :param words: Iterable[str] | None - The words to compile, defaults to the latest version in the word table.
+    :param version: int | None - The dictionary version ``words`` are, ignored without them. An index without
+        a version only answers lookups against the latest words, games pinned to a version check the word table.
+    :return: Path - The path of the written file.
+    :raises ValueError: If prebuilt indexes are disabled.
+    """
+    from shiritori.game.models import Word
+
+    if (path := get_dictionary_index_path(locale)) is None:
+        raise ValueError("DICTIONARY_INDEX_DIR is not set.")
+    if words is None:
+        version = Word.get_current_version(locale)
+        words = Word.get_words(locale).values_list("word", flat=True).iterator(chunk_size=10_000)
+    index = DictionaryIndex.from_words(words, version)
+    index.write(path)
+    if settings.DICTIONARY_BLOOM_FILTER_ENABLED:
+        from shiritori.game.dictionary.bloom import BloomFilter, get_bloom_filter_path
+
+        words = [index.word_at(position).decode("utf-8") for position in range(len(index))]
+        bloom_filter = BloomFilter.from_words(words, settings.DICTIONARY_BLOOM_FILTER_FALSE_POSITIVE_RATE)
+        bloom_filter.write(get_bloom_filter_path(locale))
+    return path
+
+
+_indexes: LocaleRegistry[DictionaryIndex] = LocaleRegistry(_build_index)
+
+
+def get_dictionary_index(locale: str) -> DictionaryIndex:
+    """
+    Get the index for a locale, loading it on first use from the prebuilt index file
+    in ``DICTIONARY_INDEX_DIR`` or, if there is none, from the word table.
+    :param locale: str - The locale of the dictionary.
+    :return: DictionaryIndex - The index for the locale.
+    """
+    return _indexes.get(locale)
+
+
+def set_dictionary_index(locale: str, index: DictionaryIndex) -> None:
+    """
+    Replace the index for a locale in this process.
+    :param locale: str - The locale of the dictionary.
+    :param index: DictionaryIndex - The new index.
+    """
+    _indexes.set(locale, index)
+
+
+def invalidate_dictionary_index(locale: str) -> None:
+    """
+    Drop the index and every other structure built for a locale and bump its shared version stamp,
+    so every process rebuilds them on its next refresh check.
+    :param locale: str - The locale of the dictionary.
+    """
+    bump_dictionary_version(locale)
+    for registry in LocaleRegistry.instances:
+        registry.discard(locale)
+
+
+def clear_dictionary_indexes() -> None:
+    """
+    Drop every index and other per-locale structure held by this process.
+    """
+    for registry in LocaleRegistry.instances:
+        registry.clear()
@@ -0,0 +1,183 @@
+from array import array
+from collections.abc import Iterator, Sequence
+
+from shiritori.game.dictionary.index import DictionaryIndex, get_dictionary_index
+from shiritori.game.dictionary.registry import LocaleRegistry
+from shiritori.game.utils import normalize_word
+
+__all__ = (
+    "LetterIndex",
+    "get_letter_index",
+)
+
+# Words of this many characters or more share the last length bucket.
+MAX_LENGTH_BUCKET = 16
+
+
+def _length_bucket(length: int) -> int:
+    return min(max(length, 0), MAX_LENGTH_BUCKET)
+
+
+class LetterIndex:
+    """
+    The words of a dictionary index grouped by first letter and length, plus a count of
+    how many words lead from each first letter to each last letter.
+
+    For every first letter, ``positions`` holds the positions of its words in the dictionary index
+    sorted by length bucket (then alphabetically), and ``bucket_starts[b]`` is where the words of
+    bucket ``b`` or longer start. "Words starting with x that are at least n letters long" is then
+    a single slice, counted in O(1) and listed in O(k).
+
+    The alphabet is every letter that starts or ends a word in the locale, and ``transitions``
+    is a flat ``len(alphabet) ** 2`` matrix of first letter to last letter word counts.
+    """
+
+    __slots__ = ("index", "alphabet", "_letter_ids", "_positions", "_bucket_starts", "_transitions")
+
+    def __init__(
+        self,
+        index: DictionaryIndex,
+        alphabet: tuple[str, ...],
+        positions: dict[str, array],
+        bucket_starts: dict[str, array],
+        transitions: array,
+    ):
+        self.index = index
+        self.alphabet = alphabet
+        self._letter_ids = {letter: i for i, letter in enumerate(alphabet)}
+        self._positions = positions
+        self._bucket_starts = bucket_starts
+        self._transitions = transitions
+
+    @classmethod
+    def from_dictionary_index(cls, index: DictionaryIndex) -> "LetterIndex":
+        """
+        Build the letter index of a dictionary index in a single pass over its words.
+        :param index: DictionaryIndex - The dictionary index to group.
+        :return: LetterIndex - The letter index.
+        """
+        grouped: dict[str, list[list[int]]] = {}
+        pairs: dict[tuple[str, str], int] = {}
+        for position in range(len(index)):
+            word = index.word_at(position).decode("utf-8")
+            first, last = word[0], word[-1]
+            buckets = grouped.get(first)
+            if buckets is None:
+                buckets = grouped[first] = [[] for _ in range(MAX_LENGTH_BUCKET + 1)]
+            buckets[_length_bucket(len(word))].append(position)
+            pairs[first, last] = pairs.get((first, last), 0) + 1
+
+        alphabet = tuple(sorted({letter for pair in pairs for letter in pair}))
+        letter_ids = {letter: i for i, letter in enumerate(alphabet)}
+        transitions = array("I", bytes(4 * len(alphabet) ** 2))
+        for (first, last), count in pairs.items():
+            transitions[letter_ids[first] * len(alphabet) + letter_ids[last]] = count
+
+        positions, bucket_starts = {}, {}
+        for letter, buckets in grouped.items():
+            positions[letter] = letter_positions = array("I")
+            bucket_starts[letter] = starts = array("I")
+            for bucket in buckets:
+                starts.append(len(letter_positions))
+                letter_positions.extend(bucket)
+            starts.append(len(letter_positions))
+        return cls(index, alphabet, positions, bucket_starts, transitions)
+
+    def bucket_positions(self, letter: str, min_length: int = 1) -> Sequence[int]:
+        """
+        Get the dictionary index positions of the words starting with a letter whose length bucket
+        is at least the one of ``min_length``, shortest first, as a view without copying them.
+        Up to ``MAX_LENGTH_BUCKET`` letters every word in the view is at least ``min_length`` letters long.
+        :param letter: str - The first letter of the words.
+        :param min_length: int - The minimum length of the words.
+        :return: Sequence[int] - The positions of the words.
+        """
+        letter = normalize_word(letter)
+        if not letter or (positions := self._positions.get(letter[0])) is None:
+            return ()
+        return memoryview(positions)[self._bucket_starts[letter[0]][_length_bucket(min_length)] :]
+
+    def count(self, letter: str, min_length: int = 1) -> int:
+        """
+        Count the words starting with a letter that are at least ``min_length`` letters long.
+        Exact in O(1) up to ``MAX_LENGTH_BUCKET`` letters, longer minimums check the words of the last bucket.
+        :param letter: str - The first letter of the words.
+        :param min_length: int - The minimum length of the words.
+        :return: int - The number of words.
+        """
+        if min_length > MAX_LENGTH_BUCKET:
+            return sum(1 for _ in self.positions(letter, min_length))
+        return len(self.bucket_positions(letter, min_length))
+
+    def positions(self, letter: str, min_length: int = 1) -> Iterator[int]:
+        """
+        Iterate over the dictionary index positions of the words starting with a letter
+        that are at least ``min_length`` letters long, shortest first.
+        :param letter: str - The first letter of the words.
+        :param min_length: int - The minimum length of the words.
+        :return: Iterator[int] - The positions of the words.
+        """
+        for position in self.bucket_positions(letter, min_length):
+            if min_length <= MAX_LENGTH_BUCKET or self.length_at(position) >= min_length:
+                yield position
+
+    def length_at(self, position: int) -> int:
+        """
+        Get the length in letters of the word at a dictionary index position.
+        :param position: int - The position of the word.
+        :return: int - The length of the word.
+        """
+        return len(self.index.word_at(position).decode("utf-8"))
+
+    def words(self, letter: str, min_length: int = 1) -> Iterator[str]:
+        """
+        Iterate over the words starting with a letter that are at least ``min_length`` letters long, shortest first.
+        :param letter: str - The first letter of the words.
+        :param min_length: int - The minimum length of the words.
+        :return: Iterator[str] - The words.
+        """
+        for position in self.positions(letter, min_length):
+            yield self.index.word_at(position).decode("utf-8")
+
+    def transitions(self, first: str, last: str) -> int:
+        """
+        Count the words that start with one letter and end with another.
+        :param first: str - The first letter of the words.
+        :param last: str - The last letter of the words.
+        :return: int - The number of words.
+        """
+        first_id, last_id = self._letter_ids.get(first), self._letter_ids.get(last)
+        if first_id is None or last_id is None:
+            return 0
+        return self._transitions[first_id * len(self.alphabet) + last_id]
+
+    def transitions_from(self, first: str) -> dict[str, int]:
+        """
+        Count the words starting with a letter by their last letter.
+        :param first: str - The first letter of the words.
+        :return: dict[str, int] - The number of words keyed by last letter, without letters no word ends with.
+        """
+        if (first_id := self._letter_ids.get(first)) is None:
+            return {}
+        size = len(self.alphabet)
+        row = self._transitions[first_id * size : (first_id + 1) * size]
+        return {letter: count for letter, count in zip(self.alphabet, row) if count}
+
+
+_letter_indexes: LocaleRegistry[LetterIndex] = LocaleRegistry(
+    lambda locale: LetterIndex.from_dictionary_index(get_dictionary_index(locale))
+)
+
+
+def get_letter_index(locale: str) -> LetterIndex:
+    """
+    Get the letter index for a locale, building it on first use from the locale's dictionary index
+    and again whenever that index is replaced.
+    :param locale: str - The locale of the dictionary.
+    :return: LetterIndex - The letter index for the locale.
+    """
+    letter_index = _letter_indexes.get(locale)
+    if letter_index.index is not (index := get_dictionary_index(locale)):
+        letter_index = LetterIndex.from_dictionary_index(index)
+        _letter_indexes.set(locale, letter_index)
+    return letter_index
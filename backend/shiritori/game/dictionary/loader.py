@@ -0,0 +1,109 @@
+import itertools
+from collections.abc import Iterable, Iterator
+
+from django.db import connection, transaction
+
+__all__ = (
+    "WordCopyStream",
+    "stage_words",
+    "insert_staged_words",
+    "remove_unstaged_words",
+)
+
+STAGING_TABLE = "word_staging"
+STAGING_BATCH_SIZE = 10_000
+
+
+class WordCopyStream:
+    """
+    A file-like object that feeds words to ``COPY ... FROM STDIN`` in text format,
+    pulling them from an iterator only as the database asks for more.
+    """
+
+    def __init__(self, words: Iterable[str]):
+        self.words = iter(words)
+        self.buffer = ""
+
+    def read(self, size: int = -1) -> str:
+        chunks = [self.buffer]
+        length = len(self.buffer)
+        while size < 0 or length < size:
+            if (word := next(self.words, None)) is None:
+                break
+            line = word.replace("\\", "\\\\") + "\n"
+            chunks.append(line)
+            length += len(line)
+        data = "".join(chunks)
+        if size < 0:
+            self.buffer = ""
+            return data
+        self.buffer = data[size:]
+        return data[:size]
+
+
+def _batched(iterable: Iterable[str], size: int) -> Iterator[list[str]]:
+    iterator = iter(iterable)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+
+def stage_words(words: Iterable[str]) -> None:
+    """
+    Stream words into a temporary staging table that lives until the end of the transaction.
+    On PostgreSQL this is a single ``COPY``, other databases get batched inserts.
+    The words must already be normalized.
+    :param words: Iterable[str] - The words to stage.
+    """
+    if not transaction.get_connection().in_atomic_block:
+        raise transaction.TransactionManagementError("Words can only be staged inside a transaction.")
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            cursor.execute(f"CREATE TEMPORARY TABLE {STAGING_TABLE} (word varchar(255) NOT NULL) ON COMMIT DROP")
+            cursor.copy_expert(f"COPY {STAGING_TABLE} (word) FROM STDIN", WordCopyStream(words))
+        else:
+            cursor.execute(f"DROP TABLE IF EXISTS {STAGING_TABLE}")
+            cursor.execute(f"CREATE TEMPORARY TABLE {STAGING_TABLE} (word varchar(255) NOT NULL)")
+            for batch in _batched(words, STAGING_BATCH_SIZE):
+                cursor.executemany(f"INSERT INTO {STAGING_TABLE} (word) VALUES (%s)", [(word,) for word in batch])
+        # Indexed after loading, it's what lets remove_unstaged_words run as an anti-join.
+        cursor.execute(f"CREATE INDEX {STAGING_TABLE}_word ON {STAGING_TABLE} (word)")
+        if connection.vendor == "postgresql":
+            cursor.execute(f"ANALYZE {STAGING_TABLE}")
+
+
+def insert_staged_words(locale: str, version_id: int) -> int:
+    """
+    Insert the staged words that are not in the word table yet, and restore staged words that were removed.
+    A restored word keeps the version it was first added in, so games pinned to that version still see it,
+    and records the versions it was missing from, so games pinned to those don't.
+    :param locale: str - The locale of the words.
+    :param version_id: int - The dictionary version adding the words.
+    :return: int - The number of words added.
+    """
+    with connection.cursor() as cursor:
+        # "WHERE true" keeps SQLite from parsing ON CONFLICT as a join constraint.
+        cursor.execute(
+            "INSERT INTO word (word, locale, added_in_id) "
+            f"SELECT DISTINCT word, %s, %s FROM {STAGING_TABLE} WHERE true "
+            "ON CONFLICT (word, locale) DO UPDATE SET previously_removed_in_id = word.removed_in_id, "
+            "restored_in_id = excluded.added_in_id, removed_in_id = NULL "
+            "WHERE word.removed_in_id IS NOT NULL",
+            [locale, version_id],
+        )
+        return max(cursor.rowcount, 0)
+
+
+def remove_unstaged_words(locale: str, version_id: int) -> int:
+    """
+    Mark the words of a locale that are not staged as removed.
+    :param locale: str - The locale of the words.
+    :param version_id: int - The dictionary version removing the words.
+    :return: int - The number of words removed.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"UPDATE word SET removed_in_id = %s WHERE locale = %s AND removed_in_id IS NULL "
+            f"AND NOT EXISTS (SELECT 1 FROM {STAGING_TABLE} WHERE {STAGING_TABLE}.word = word.word)",
+            [version_id, locale],
+        )
+        return max(cursor.rowcount, 0)
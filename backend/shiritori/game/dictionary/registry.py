@@ -0,0 +1,113 @@
+import threading
+import time
+import typing
+from collections.abc import Callable
+
+from django.conf import settings
+from django.core.cache import cache
+
+__all__ = (
+    "LocaleRegistry",
+    "get_dictionary_version",
+    "bump_dictionary_version",
+)
+
+VERSION_CACHE_KEY = "dictionary_index_version:{locale}"
+
+T = typing.TypeVar("T")
+
+
+def get_dictionary_version(locale: str) -> str | None:
+    """
+    Get the shared version stamp of a locale's dictionary.
+    :param locale: str - The locale of the dictionary.
+    :return: str | None - The version stamp, or None if the dictionary was never reloaded.
+    """
+    return cache.get(VERSION_CACHE_KEY.format(locale=locale))
+
+
+def bump_dictionary_version(locale: str) -> None:
+    """
+    Change the shared version stamp of a locale's dictionary,
+    so every process reloads its per-locale structures on its next refresh check.
+    :param locale: str - The locale of the dictionary.
+    """
+    cache.set(VERSION_CACHE_KEY.format(locale=locale), str(time.time_ns()), timeout=None)
+
+
+class _Entry(typing.Generic[T]):
+    __slots__ = ("value", "version", "checked_at")
+
+    def __init__(self, value: T, version: str | None):
+        self.value = value
+        self.version = version
+        self.checked_at = time.monotonic()
+
+
+class LocaleRegistry(typing.Generic[T]):
+    """
+    A per-process cache of one structure per locale, loaded on first use.
+
+    Every ``DICTIONARY_INDEX_REFRESH_INTERVAL`` seconds the shared version stamp is compared against
+    the one the structure was loaded with, so a dictionary reload in one process is picked up by every other process.
+    """
+
+    instances: list["LocaleRegistry"] = []
+
+    def __init__(self, loader: Callable[[str], T]):
+        self.loader = loader
+        self._entries: dict[str, _Entry[T]] = {}
+        self._lock = threading.Lock()
+        LocaleRegistry.instances.append(self)
+
+    def get(self, locale: str) -> T:
+        """
+        Get the structure for a locale, loading it if it is missing or out of date.
+        :param locale: str - The locale of the dictionary.
+        :return: T - The structure for the locale.
+        """
+        entry = self._entries.get(locale)
+        if entry is not None:
+            if time.monotonic() - entry.checked_at < settings.DICTIONARY_INDEX_REFRESH_INTERVAL:
+                return entry.value
+            if entry.version == get_dictionary_version(locale):
+                entry.checked_at = time.monotonic()
+                return entry.value
+        with self._lock:
+            if (current := self._entries.get(locale)) is not None and current is not entry:
+                return current.value
+            version = get_dictionary_version(locale)
+            value = self.loader(locale)
+            self._entries[locale] = _Entry(value, version)
+            return value
+
+    def set(self, locale: str, value: T) -> None:
+        """
+        Replace the structure for a locale in this process.
+        :param locale: str - The locale of the dictionary.
+        :param value: T - The new structure.
+        """
+        with self._lock:
+            self._entries[locale] = _Entry(value, get_dictionary_version(locale))
+
+    def discard(self, locale: str) -> None:
+        """
+        Drop the structure for a locale in this process.
+        :param locale: str - The locale of the dictionary.
+        """
+        with self._lock:
+            self._entries.pop(locale, None)
+
+    def items(self) -> list[tuple[str, T]]:
+        """
+        Get every structure held by this registry.
+        :return: list[tuple[str, T]] - The structures keyed by locale.
+        """
+        return [(locale, entry.value) for locale, entry in self._entries.items()]
+
+    def clear(self) -> None:
+        """
+        Drop every structure held by this registry.
+        """
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,306 @@
+"""
+The rules of a game of shiritori, as pure functions over a ``GameState``.
+
+Nothing in here touches the database, the channel layer or the clock: the models load a ``GameState``,
+hand it to these functions with the current time and persist what changed,
+and the hot game store does the same against Redis. That keeps a turn an in-memory step
+that can be benchmarked and fuzzed on its own, without Django set up.
+The model layer raises a broken rule as a ``ValidationError``, see ``shiritori.game.models.game.engine_rules``.
+"""
+
+import dataclasses
+import random
+from collections.abc import Callable
+
+from shiritori.game.utils import calculate_score, case_insensitive_equal, normalize_word
+
+__all__ = (
+    "WAITING",
+    "PLAYING",
+    "FINISHED",
+    "GameRuleError",
+    "PlayerState",
+    "GameState",
+    "Turn",
+    "join",
+    "leave",
+    "shuffle_order",
+    "start",
+    "next_player",
+    "skip_turn",
+    "turn_time_left",
+    "check_word",
+    "take_turn",
+    "apply_turn",
+    "end_turn",
+    "finish",
+    "winner",
+)
+
+
+# The values of GameStatus.
+WAITING, PLAYING, FINISHED = "WAITING", "PLAYING", "FINISHED"
+
+
+class GameRuleError(Exception):
+    """
+    A move the rules do not allow, the message says why.
+    """
+
+
+@dataclasses.dataclass(slots=True)
+class PlayerState:
+    id: str
+    is_connected: bool = True
+    bot_difficulty: str | None = None
+    score: float = 0
+
+
+@dataclasses.dataclass(slots=True)
+class GameState:
+    """
+    A game as the rules see it. ``players`` are in turn order once the game started,
+    ``deadline`` is a timestamp in seconds and ``max_turns`` counts the turns of all players.
+    """
+
+    players: list[PlayerState] = dataclasses.field(default_factory=list)
+    status: str = WAITING
+    current: str | None = None
+    turn: int = 0
+    round: int = 0
+    last_word: str | None = None
+    deadline: float | None = None
+    turn_time: int = 60
+    max_turns: int = 0
+    word_length: int = 3
+    used_words: set[str] = dataclasses.field(default_factory=set)
+    used_letters: set[str] = dataclasses.field(default_factory=set)
+
+    def get_player(self, player_id: str) -> PlayerState | None:
+        for player in self.players:
+            if player.id == player_id:
+                return player
+        return None
+
+
+@dataclasses.dataclass(slots=True)
+class Turn:
+    player_id: str
+    word: str | None
+    score: float
+    duration: float
+
+
+def join(state: GameState, player: PlayerState) -> None:
+    """
+    Add a player to a game that has not started yet.
+    :param state: GameState - The game.
+    :param player: PlayerState - The player.
+    :raises GameRuleError: If the game has started or is finished.
+    """
+    if state.status != WAITING:
+        raise GameRuleError("Game has already started or is finished.")
+    state.players.append(player)
+
+
+def leave(state: GameState, player_id: str) -> None:
+    """
+    Remove a player. A game in progress moves on to the next player, and finishes once fewer than 2 are left.
+    :param state: GameState - The game.
+    :param player_id: str - The id of the player.
+    """
+    state.players = [player for player in state.players if player.id != player_id]
+    if state.status != PLAYING:
+        return
+    try:
+        state.current = next_player(state)
+    except GameRuleError:
+        state.status = FINISHED
+
+
+def shuffle_order(state: GameState, rng: random.Random | None = None) -> None:
+    """
+    Shuffle the turn order of a game that has not started yet.
+    :param state: GameState - The game.
+    :param rng: random.Random - The random number generator, the ``random`` module by default.
+    :raises GameRuleError: If the game has started or is finished, or has less than 2 players.
+    """
+    if state.status == PLAYING:
+        raise GameRuleError("Cannot shuffle player order when game has started.")
+    if state.status == FINISHED:
+        raise GameRuleError("Cannot shuffle player order when game is finished.")
+    if len(state.players) < 2:
+        raise GameRuleError("Cannot shuffle player order when there are less than 2 players.")
+    (rng or random).shuffle(state.players)
+
+
+def start(state: GameState, now: float) -> None:
+    """
+    Start a game with its players in their current order. The first turn starts now.
+    :param state: GameState - The game.
+    :param now: float - The current timestamp.
+    :raises GameRuleError: If the game is not waiting or has less than 2 players.
+    """
+    if state.status != WAITING:
+        raise GameRuleError("Cannot start a game that is not waiting.")
+    if len(state.players) < 2:
+        raise GameRuleError("Cannot start a game with less than 2 players.")
+    state.current = next_player(state)
+    state.status = PLAYING
+    state.deadline = now + state.turn_time
+
+
+def next_player(state: GameState) -> str:
+    """
+    Whose turn ``state.turn`` is. A disconnected player's turn goes to the connected player after the current one.
+    :param state: GameState - The game.
+    :return: str - The id of the player.
+    :raises GameRuleError: If the game has less than 2 players.
+    """
+    if not state.players:
+        raise GameRuleError("Cannot calculate current player when there are no players.")
+    if len(state.players) == 1:
+        raise GameRuleError("Cannot calculate current player when there is only 1 player.")
+    player = state.players[state.turn % len(state.players)]
+    if player.is_connected:
+        return player.id
+    connected = [player.id for player in state.players if player.is_connected]
+    if state.current not in connected:
+        # Nobody to skip from, the turn goes to the first connected player after the scheduled one.
+        index = state.players.index(player)
+        for candidate in state.players[index + 1 :] + state.players[:index]:
+            if candidate.is_connected:
+                return candidate.id
+        return player.id
+    if len(connected) < 2:
+        return state.current
+    return connected[(connected.index(state.current) + 1) % len(connected)]
+
+
+def skip_turn(state: GameState) -> None:
+    """
+    Hand the turn to the next connected player without a penalty, e.g. because the current one disconnected.
+    :param state: GameState - The game.
+    :raises GameRuleError: If the current player is not connected.
+    """
+    connected = [player.id for player in state.players if player.is_connected]
+    if state.current not in connected:
+        raise GameRuleError("Current player is not connected.")
+    if len(connected) >= 2:
+        state.current = connected[(connected.index(state.current) + 1) % len(connected)]
+
+
+def turn_time_left(state: GameState, now: float) -> float:
+    if state.deadline is None:
+        return 0
+    # Rounded to the microsecond precision of the datetimes the timestamps come from.
+    return round(max(state.deadline - now, 0), 6)
+
+
+def check_word(state: GameState, word: str, is_in_dictionary: Callable[[str], bool] | None = None) -> None:
+    """
+    Check a normalized word against the rules. When several rules are broken, the last one checked is reported.
+    :param state: GameState - The game.
+    :param word: str - The word.
+    :param is_in_dictionary: Callable[[str], bool] - Whether the word is in the game's dictionary, skipped if None.
+    :raises GameRuleError: If the word is invalid.
+    """
+    error_message = None
+    if state.last_word and not case_insensitive_equal(word[0], state.last_word[-1]):
+        error_message = "Word must start with the last letter of the previous word."
+    if word in state.used_words:
+        error_message = "Word already used."
+    if len(word) < state.word_length:
+        error_message = f"Word must be at least {state.word_length} characters long."
+    if is_in_dictionary is not None and not is_in_dictionary(word):
+        error_message = "Word not found in dictionary."
+    if error_message:
+        raise GameRuleError(error_message)
+
+
+def take_turn(
+    state: GameState,
+    player_id: str,
+    word: str | None,
+    now: float,
+    is_in_dictionary: Callable[[str], bool] | None = None,
+) -> Turn:
+    """
+    Take a player's turn, the same checks as ``Game.take_turn``.
+    :param state: GameState - The game.
+    :param player_id: str - The id of the player taking the turn.
+    :param word: str | None - The word the player submitted, None to pass.
+    :param now: float - The current timestamp.
+    :param is_in_dictionary: Callable[[str], bool] - Whether a word is in the game's dictionary.
+    :return: Turn - The turn taken.
+    :raises GameRuleError: If the player cannot take a turn or the word is invalid.
+    """
+    if state.status != PLAYING:
+        raise GameRuleError("Game is not in progress.")
+    if state.current != player_id:
+        raise GameRuleError("It is not your turn.")
+    if turn_time_left(state, now) <= 0:
+        raise GameRuleError("Turn time has expired.")
+    if word := normalize_word(word):
+        check_word(state, word, is_in_dictionary)
+    return apply_turn(state, word, now)
+
+
+def apply_turn(state: GameState, word: str | None, now: float) -> Turn:
+    """
+    Record the current player's turn and move on to the next one. The word is not checked.
+    :param state: GameState - The game.
+    :param word: str | None - The normalized word, None for a turn that timed out.
+    :param now: float - The current timestamp.
+    :return: Turn - The turn taken.
+    """
+    duration = state.turn_time - turn_time_left(state, now)
+    score = calculate_score(word, duration, bool(word) and word[-1] not in state.used_letters)
+    player_id = state.current
+    if player := state.get_player(player_id):
+        player.score += score
+    if word:
+        state.used_words.add(word)
+        state.used_letters.add(word[-1])
+        state.last_word = word
+    if state.turn + 1 > state.max_turns:
+        state.status = FINISHED
+    # The round ends with the last connected player.
+    for player in reversed(state.players):
+        if player.is_connected:
+            if player.id == player_id:
+                state.round += 1
+            break
+    state.turn += 1
+    state.current = next_player(state)
+    state.deadline = now + state.turn_time
+    return Turn(player_id=player_id, word=word, score=score, duration=duration)
+
+
+def end_turn(state: GameState, now: float) -> Turn:
+    """
+    End the current turn once its time ran out, with the penalty for a missed word.
+    :param state: GameState - The game.
+    :param now: float - The current timestamp.
+    :return: Turn - The turn taken.
+    """
+    return apply_turn(state, None, now)
+
+
+def finish(state: GameState) -> str | None:
+    """
+    Finish a game.
+    :param state: GameState - The game.
+    :return: str | None - The id of the winner.
+    """
+    state.status = FINISHED
+    return winner(state)
+
+
+def winner(state: GameState) -> str | None:
+    """
+    The player with the highest score, the earliest in turn order on a tie.
+    :param state: GameState - The game.
+    :return: str | None - The id of the player, or None if the game has no players.
+    """
+    return max(state.players, key=lambda player: player.score).id if state.players else None
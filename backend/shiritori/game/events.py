@@ -1,6 +1,15 @@
+import json
 import typing
+from collections.abc import Collection
 
-from shiritori.game.converters import convert_game_to_json, convert_gameword_to_json, convert_player_to_json
+from django.core.serializers.json import DjangoJSONEncoder
+
+from shiritori.game.converters import (
+    convert_game_to_json,
+    convert_gameword_to_json,
+    convert_player_to_json,
+    convert_to_camel,
+)
 from shiritori.game.utils import send_message_to_layer
 
 if typing.TYPE_CHECKING:
@@ -8,7 +17,11 @@ if typing.TYPE_CHECKING:
 
 __all__ = (
     "EventDict",
+    "EncodedEventDict",
+    "encode_event",
+    "publish_event",
     "send_lobby_update",
+    "get_game_update_fields",
     "send_game_updated",
     "send_game_timer_updated",
     "send_game_start_countdown_start",
@@ -23,6 +36,16 @@ __all__ = (
 )
 
 
+# The fields of a game_updated event that change along with a model field, besides the field itself.
+# Players and words are left out, they have their own events.
+GAME_FIELD_DEPENDENCIES = {
+    "current_turn": ("current_player", "word_count", "longest_word"),
+    "turn_deadline": ("turn_time_left",),
+    "settings": ("max_turns",),
+    "status": ("is_finished", "winner"),
+}
+
+
 class EventDict(typing.TypedDict):
     type: typing.Literal[
         "game_created",
@@ -42,13 +65,37 @@ class EventDict(typing.TypedDict):
     data: typing.Any
 
 
+class EncodedEventDict(typing.TypedDict):
+    type: str
+    text: str
+
+
+def encode_event(event: EventDict) -> EncodedEventDict:
+    """
+    Camelize and JSON-encode an event once, so the consumers send the same text to every socket of a group
+    instead of each encoding it again.
+    :param event: EventDict - The event.
+    :return: EncodedEventDict - The type of the event, for the consumers to dispatch on, and its text.
+    """
+    return {"type": event["type"], "text": json.dumps(convert_to_camel(event), cls=DjangoJSONEncoder)}
+
+
+def publish_event(group: str, event: EventDict):
+    """
+    Encode an event and send it to a group of the channel layer.
+    :param group: str - The group, a game id or the lobby.
+    :param event: EventDict - The event.
+    """
+    send_message_to_layer(group, encode_event(event))
+
+
 def send_lobby_update(game: typing.Union["Game", dict]):
     if game is None:
         return
 
     if not isinstance(game, dict):
         game = convert_game_to_json(game)
-    send_message_to_layer(
+    publish_event(
         "lobby",
         {
             "type": "game_created",
@@ -57,13 +104,33 @@ def send_lobby_update(game: typing.Union["Game", dict]):
     )
 
 
-def send_game_updated(game: typing.Union["Game", dict]):
+def get_game_update_fields(changed: Collection[str]) -> set[str]:
+    """
+    Get the fields of a game_updated event for the model fields that changed.
+    :param changed: Collection[str] - The names of the model fields that changed.
+    :return: set[str] - The names of the fields to send, always with the id and the revision.
+    """
+    fields = {"id", "revision"}
+    for name in changed:
+        fields.add(name)
+        fields.update(GAME_FIELD_DEPENDENCIES.get(name, ()))
+    return fields
+
+
+def send_game_updated(game: typing.Union["Game", dict], fields: Collection[str] | None = None):
+    """
+    Send the changes of a game to its players, as the next revision of the game.
+    A client that missed a revision fetches the whole game again.
+    :param game: Game | dict - The game, or its changes already serialized with their revision.
+    :param fields: Collection[str] | None - The fields to send, from ``get_game_update_fields``, None for all of them.
+    """
     if game is None:
         return
 
     if not isinstance(game, dict):
-        game = convert_game_to_json(game)
-    send_message_to_layer(
+        game.bump_revision()
+        game = convert_game_to_json(game, fields)
+    publish_event(
         game["id"],
         {
             "type": "game_updated",
@@ -73,7 +140,7 @@ def send_game_updated(game: typing.Union["Game", dict]):
 
 
 def send_game_timer_updated(game_id: str, turn_time_left: int):
-    send_message_to_layer(
+    publish_event(
         game_id,
         {
             "type": "game_timer_updated",
@@ -86,7 +153,7 @@ def send_player_joined(game_id: str, player: typing.Union["Player", dict]):
     if not isinstance(player, dict):
         player = convert_player_to_json(player)
 
-    send_message_to_layer(
+    publish_event(
         game_id,
         {
             "type": "player_joined",
@@ -99,7 +166,7 @@ def send_player_updated(game_id: str, player: typing.Union["Player", dict]):
     if not isinstance(player, dict):
         player = convert_player_to_json(player)
 
-    send_message_to_layer(
+    publish_event(
         game_id,
         {
             "type": "player_updated",
@@ -109,7 +176,7 @@ def send_player_updated(game_id: str, player: typing.Union["Player", dict]):
 
 
 def send_player_left(game_id: str, player_id: str):
-    send_message_to_layer(
+    publish_event(
         game_id,
         {
             "type": "player_left",
@@ -122,7 +189,7 @@ def send_turn_taken(game_id: str, word: typing.Union["GameWord", dict]):
     if not isinstance(word, dict):
         word = convert_gameword_to_json(word)
 
-    send_message_to_layer(
+    publish_event(
         game_id,
         {
             "type": "turn_taken",
@@ -132,7 +199,7 @@ def send_turn_taken(game_id: str, word: typing.Union["GameWord", dict]):
 
 
 def send_player_disconnected(game_id: str, player_id: str):
-    send_message_to_layer(
+    publish_event(
         game_id,
         {
             "type": "player_disconnected",
@@ -142,7 +209,7 @@ def send_player_disconnected(game_id: str, player_id: str):
 
 
 def send_game_start_countdown_start(game_id: str):
-    send_message_to_layer(
+    publish_event(
         game_id,
         {
             "type": "game_start_countdown_start",
@@ -152,7 +219,7 @@ def send_game_start_countdown_start(game_id: str):
 
 
 def send_game_start_countdown(game_id: str, time_left: int):
-    send_message_to_layer(
+    publish_event(
         game_id,
         {
             "type": "game_start_countdown",
@@ -162,7 +229,7 @@ def send_game_start_countdown(game_id: str, time_left: int):
 
 
 def send_game_start_countdown_cancel(game_id: str):
-    send_message_to_layer(
+    publish_event(
         game_id,
         {
             "type": "game_start_countdown_cancel",
@@ -172,7 +239,7 @@ def send_game_start_countdown_cancel(game_id: str):
 
 
 def send_game_start_countdown_end(game_id: str):
-    send_message_to_layer(
+    publish_event(
         game_id,
         {
             "type": "game_start_countdown_end",
@@ -0,0 +1,23 @@
+from django.db import models
+
+from shiritori.game.utils import normalize_word
+
+__all__ = ("NormalizedWordField",)
+
+
+class NormalizedWordField(models.CharField):
+    """
+    A CharField that stores words normalized with ``normalize_word`` (NFKC + lowercase)
+    and normalizes lookup values the same way, so case-insensitive matches are plain equality on the index.
+    """
+
+    def get_prep_value(self, value):
+        value = super().get_prep_value(value)
+        return normalize_word(value) if isinstance(value, str) and value else value
+
+    def pre_save(self, model_instance, add):
+        value = getattr(model_instance, self.attname)
+        if isinstance(value, str) and value:
+            value = normalize_word(value)
+            setattr(model_instance, self.attname, value)
+        return value
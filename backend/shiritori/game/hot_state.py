@@ -0,0 +1,731 @@
+import copy
+import dataclasses
+import functools
+import json
+import threading
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+
+import redis
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.db.models import F, Value
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from shiritori.game import engine
+from shiritori.game.bot import BOT_THINK_TIME, choose_word
+from shiritori.game.converters import convert_game_to_json
+from shiritori.game.dictionary import get_letter_index
+from shiritori.game.events import send_game_timer_updated, send_game_updated, send_turn_taken
+from shiritori.game.models import Game, GameStatus, GameWord, Player, Word
+from shiritori.game.models.game import engine_rules
+from shiritori.utils import generate_id
+
+__all__ = (
+    "HOT_GAMES_KEY",
+    "HotGameState",
+    "RedisHotGameBackend",
+    "MemoryHotGameBackend",
+    "HotGameStore",
+    "get_hot_game_store",
+    "get_hot_game_store_for",
+)
+
+HOT_GAMES_KEY = "shiritori:hot-games"
+
+# Applies a planned turn if the turn it was planned for is still the current one, and counts its game_updated event.
+# Returns the new revision of the game, or 0 or -1 if the turn changed or the word was used.
+# KEYS: state hash, used words, used letters, scores, history
+# ARGV: expected turn, word ('' for a timed out turn), its last letter, player id, score, history entry,
+#       then field/value pairs of the state hash.
+APPLY_TURN_SCRIPT = """
+if redis.call('HGET', KEYS[1], 'turn') ~= ARGV[1] then
+    return 0
+end
+if ARGV[2] ~= '' then
+    if redis.call('SADD', KEYS[2], ARGV[2]) == 0 then
+        return -1
+    end
+    redis.call('SADD', KEYS[3], ARGV[3])
+end
+redis.call('HINCRBYFLOAT', KEYS[4], ARGV[4], ARGV[5])
+redis.call('RPUSH', KEYS[5], ARGV[6])
+for i = 7, #ARGV, 2 do
+    redis.call('HSET', KEYS[1], ARGV[i], ARGV[i + 1])
+end
+return redis.call('HINCRBY', KEYS[1], 'revision', 1)
+"""
+
+# Counts a game_updated event sent from the database, unless the game left the store.
+BUMP_REVISION_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return false
+end
+return redis.call('HINCRBY', KEYS[1], 'revision', 1)
+"""
+
+MARK_FLUSHED_SCRIPT = """
+if redis.call('HGET', KEYS[1], 'flushed') ~= ARGV[1] then
+    return 0
+end
+redis.call('HSET', KEYS[1], 'flushed', ARGV[2])
+return 1
+"""
+
+TURN_CHANGED, WORD_USED = 0, -1
+
+_INT_FIELDS = ("turn", "round", "turn_time", "max_turns", "word_length", "flushed", "revision")
+_JSON_FIELDS = ("order", "sessions", "bots", "snapshot")
+
+
+@dataclasses.dataclass
+class HotGameState:
+    """
+    The live state of a game in progress, as kept in the hot game store.
+    The turns taken since the game was loaded are kept next to it, the first ``flushed`` of them are in the database.
+    ``revision`` counts every game_updated event while the game is hot, those of its turns and those sent from
+    the database alike, and is written back to the game when it is flushed.
+    """
+
+    game_id: str
+    status: str
+    turn: int
+    round: int
+    current: str
+    last_word: str
+    deadline: float | None
+    turn_time: int
+    max_turns: int
+    word_length: int
+    locale: str
+    version: int | None
+    order: list[str]
+    sessions: dict[str, str]
+    bots: dict[str, str]
+    flushed: int
+    revision: int
+    snapshot: dict
+    used_words: set[str] = dataclasses.field(default_factory=set)
+    used_letters: set[str] = dataclasses.field(default_factory=set)
+    scores: dict[str, float] = dataclasses.field(default_factory=dict)
+    away: set[str] = dataclasses.field(default_factory=set)
+
+    @property
+    def deadline_at(self) -> datetime | None:
+        return datetime.fromtimestamp(self.deadline, tz=dt_timezone.utc) if self.deadline is not None else None
+
+    def turn_time_left(self, now: datetime) -> float:
+        if self.deadline is None:
+            return 0
+        return max(self.deadline - now.timestamp(), 0)
+
+    def bot_turn_at(self, now: datetime) -> datetime | None:
+        if (difficulty := self.bots.get(self.current)) is None or self.deadline is None:
+            return None
+        think_time = min(BOT_THINK_TIME.get(difficulty, 0), self.turn_time // 2)
+        return self.deadline_at - timedelta(seconds=self.turn_time - think_time)
+
+    def next_timer_at(self, now: datetime) -> datetime | None:
+        if self.status != GameStatus.PLAYING:
+            return None
+        if self.deadline is None:
+            return now
+        if (bot_turn_at := self.bot_turn_at(now)) is not None and bot_turn_at > now:
+            return bot_turn_at
+        return self.deadline_at
+
+    def to_engine_state(self) -> engine.GameState:
+        return engine.GameState(
+            players=[
+                engine.PlayerState(
+                    id=player_id,
+                    is_connected=player_id not in self.away,
+                    bot_difficulty=self.bots.get(player_id),
+                    score=self.scores.get(player_id, 0),
+                )
+                for player_id in self.order
+            ],
+            status=self.status,
+            current=self.current,
+            turn=self.turn,
+            round=self.round,
+            last_word=self.last_word,
+            deadline=self.deadline,
+            turn_time=self.turn_time,
+            max_turns=self.max_turns,
+            word_length=self.word_length,
+            used_words=set(self.used_words),
+            used_letters=set(self.used_letters),
+        )
+
+    def to_fields(self) -> dict[str, str]:
+        fields = {}
+        for field in dataclasses.fields(self):
+            if field.name in ("used_words", "used_letters", "scores", "away"):
+                continue
+            value = getattr(self, field.name)
+            if field.name in _JSON_FIELDS:
+                value = json.dumps(value, cls=DjangoJSONEncoder)
+            fields[field.name] = "" if value is None else str(value)
+        return fields
+
+    @classmethod
+    def from_fields(
+        cls, fields: dict[str, str], used_words: set[str], used_letters: set[str], scores: dict, away: set[str]
+    ) -> "HotGameState":
+        values = {}
+        for field in dataclasses.fields(cls):
+            if field.name not in fields:
+                continue
+            value = fields[field.name]
+            if field.name in _INT_FIELDS:
+                value = int(value)
+            elif field.name in _JSON_FIELDS:
+                value = json.loads(value)
+            elif field.name == "deadline":
+                value = float(value) if value else None
+            elif field.name == "version":
+                value = int(value) if value else None
+            values[field.name] = value
+        return cls(
+            **values,
+            used_words=set(used_words),
+            used_letters=set(used_letters),
+            scores={player_id: float(score) for player_id, score in scores.items()},
+            away=set(away),
+        )
+
+
+class RedisHotGameBackend:
+    """
+    Keeps each hot game in a hash, with sets of its used words, used last letters and disconnected players,
+    a hash of scores and a list of the turns taken since it was loaded.
+    """
+
+    def __init__(self, client: redis.Redis):
+        self.client = client
+        self._apply = client.register_script(APPLY_TURN_SCRIPT)
+        self._mark_flushed = client.register_script(MARK_FLUSHED_SCRIPT)
+        self._bump_revision = client.register_script(BUMP_REVISION_SCRIPT)
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisHotGameBackend":
+        return cls(redis.Redis.from_url(url, decode_responses=True))
+
+    @staticmethod
+    def _keys(game_id: str) -> list[str]:
+        key = f"shiritori:hot:{game_id}"
+        return [key, f"{key}:words", f"{key}:letters", f"{key}:scores", f"{key}:history", f"{key}:away"]
+
+    def create(self, state: HotGameState) -> None:
+        state_key, words_key, letters_key, scores_key, _, away_key = keys = self._keys(state.game_id)
+        with self.client.pipeline() as pipe:
+            pipe.delete(*keys)
+            pipe.hset(state_key, mapping=state.to_fields())
+            if state.used_words:
+                pipe.sadd(words_key, *state.used_words)
+            if state.used_letters:
+                pipe.sadd(letters_key, *state.used_letters)
+            if state.scores:
+                pipe.hset(scores_key, mapping=state.scores)
+            if state.away:
+                pipe.sadd(away_key, *state.away)
+            pipe.sadd(HOT_GAMES_KEY, state.game_id)
+            pipe.execute()
+
+    def exists(self, game_id: str) -> bool:
+        return bool(self.client.sismember(HOT_GAMES_KEY, game_id))
+
+    def read(self, game_id: str) -> HotGameState | None:
+        state_key, words_key, letters_key, scores_key, _, away_key = self._keys(game_id)
+        with self.client.pipeline(transaction=True) as pipe:
+            pipe.hgetall(state_key)
+            pipe.smembers(words_key)
+            pipe.smembers(letters_key)
+            pipe.hgetall(scores_key)
+            pipe.smembers(away_key)
+            fields, used_words, used_letters, scores, away = pipe.execute()
+        if not fields:
+            return None
+        return HotGameState.from_fields(fields, used_words, used_letters, scores, away)
+
+    def apply(
+        self,
+        game_id: str,
+        expected_turn: int,
+        word: str | None,
+        player_id: str,
+        score: float,
+        entry: dict,
+        fields: dict[str, str],
+    ) -> int:
+        args = [expected_turn, word or "", word[-1] if word else "", player_id, score, json.dumps(entry)]
+        for field, value in fields.items():
+            args += [field, value]
+        return self._apply(keys=self._keys(game_id)[:5], args=args)
+
+    def bump_revision(self, game_id: str) -> int | None:
+        return self._bump_revision(keys=self._keys(game_id)[:1])
+
+    def set_away(self, game_id: str, player_id: str, away: bool) -> None:
+        away_key = self._keys(game_id)[5]
+        if away:
+            self.client.sadd(away_key, player_id)
+        else:
+            self.client.srem(away_key, player_id)
+
+    def history(self, game_id: str, start: int = 0) -> list[dict]:
+        return [json.loads(entry) for entry in self.client.lrange(self._keys(game_id)[4], start, -1)]
+
+    def mark_flushed(self, game_id: str, flushed: int, new_flushed: int) -> bool:
+        return bool(self._mark_flushed(keys=self._keys(game_id)[:1], args=[flushed, new_flushed]))
+
+    def delete(self, game_id: str) -> None:
+        with self.client.pipeline() as pipe:
+            pipe.delete(*self._keys(game_id))
+            pipe.srem(HOT_GAMES_KEY, game_id)
+            pipe.execute()
+
+    def game_ids(self) -> set[str]:
+        return self.client.smembers(HOT_GAMES_KEY)
+
+
+class MemoryHotGameBackend:
+    """
+    An in-process stand-in for ``RedisHotGameBackend`` that keeps the same string fields,
+    for tests and single process development servers.
+    """
+
+    def __init__(self):
+        self._games: dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def create(self, state: HotGameState) -> None:
+        with self._lock:
+            self._games[state.game_id] = {
+                "fields": state.to_fields(),
+                "words": set(state.used_words),
+                "letters": set(state.used_letters),
+                "scores": {player_id: str(score) for player_id, score in state.scores.items()},
+                "history": [],
+                "away": set(state.away),
+            }
+
+    def exists(self, game_id: str) -> bool:
+        return game_id in self._games
+
+    def read(self, game_id: str) -> HotGameState | None:
+        with self._lock:
+            if (game := self._games.get(game_id)) is None:
+                return None
+            return HotGameState.from_fields(
+                dict(game["fields"]), game["words"], game["letters"], game["scores"], game["away"]
+            )
+
+    def apply(
+        self,
+        game_id: str,
+        expected_turn: int,
+        word: str | None,
+        player_id: str,
+        score: float,
+        entry: dict,
+        fields: dict[str, str],
+    ) -> int:
+        with self._lock:
+            game = self._games.get(game_id)
+            if game is None or game["fields"]["turn"] != str(expected_turn):
+                return TURN_CHANGED
+            if word:
+                if word in game["words"]:
+                    return WORD_USED
+                game["words"].add(word)
+                game["letters"].add(word[-1])
+            game["scores"][player_id] = str(float(game["scores"].get(player_id, 0)) + score)
+            game["history"].append(json.dumps(entry))
+            game["fields"].update(fields)
+            game["fields"]["revision"] = str(int(game["fields"]["revision"]) + 1)
+            return int(game["fields"]["revision"])
+
+    def bump_revision(self, game_id: str) -> int | None:
+        with self._lock:
+            if (game := self._games.get(game_id)) is None:
+                return None
+            game["fields"]["revision"] = str(int(game["fields"]["revision"]) + 1)
+            return int(game["fields"]["revision"])
+
+    def set_away(self, game_id: str, player_id: str, away: bool) -> None:
+        with self._lock:
+            if game := self._games.get(game_id):
+                if away:
+                    game["away"].add(player_id)
+                else:
+                    game["away"].discard(player_id)
+
+    def history(self, game_id: str, start: int = 0) -> list[dict]:
+        with self._lock:
+            return [json.loads(entry) for entry in self._games.get(game_id, {}).get("history", [])[start:]]
+
+    def mark_flushed(self, game_id: str, flushed: int, new_flushed: int) -> bool:
+        with self._lock:
+            game = self._games.get(game_id)
+            if game is None or game["fields"]["flushed"] != str(flushed):
+                return False
+            game["fields"]["flushed"] = str(new_flushed)
+            return True
+
+    def delete(self, game_id: str) -> None:
+        with self._lock:
+            self._games.pop(game_id, None)
+
+    def game_ids(self) -> set[str]:
+        return set(self._games)
+
+
+class HotGameStore:
+    """
+    Runs games in progress from the hot game store instead of the database.
+
+    A turn is validated against the state read in one round trip, and applied with one atomic script
+    that only succeeds if no other turn was applied in the meantime. The database is caught up in batches
+    by ``flush_hot_games_task``, and once more when the game finishes, so turns never wait on it.
+    """
+
+    def __init__(self, backend: RedisHotGameBackend | MemoryHotGameBackend):
+        self.backend = backend
+
+    def is_hot(self, game_id: str) -> bool:
+        return self.backend.exists(game_id)
+
+    def get(self, game_id: str) -> HotGameState | None:
+        return self.backend.read(game_id)
+
+    def load(self, game: Game) -> HotGameState:
+        """
+        Copy a game in progress into the store, after which it is only played there until it finishes.
+        :param game: Game - The game.
+        :return: HotGameState - The state of the game.
+        """
+        game_state = game.to_state()
+        players = list(game.players)
+        state = HotGameState(
+            game_id=game.id,
+            status=game_state.status,
+            turn=game_state.turn,
+            round=game_state.round,
+            current=game_state.current or game_state.players[0].id,
+            last_word=game_state.last_word or "",
+            deadline=game_state.deadline,
+            turn_time=game_state.turn_time,
+            max_turns=game_state.max_turns,
+            word_length=game_state.word_length,
+            locale=game.settings.locale,
+            version=game.dictionary_version_id,
+            order=[player.id for player in game_state.players],
+            sessions={player.session_key: player.id for player in players if player.session_key and not player.is_bot},
+            bots={player.id: player.bot_difficulty for player in game_state.players if player.bot_difficulty},
+            flushed=0,
+            revision=game.revision,
+            snapshot=json.loads(json.dumps(convert_game_to_json(game), cls=DjangoJSONEncoder)),
+            used_words=game_state.used_words,
+            used_letters=game_state.used_letters,
+            scores={player.id: float(player.score) for player in game_state.players},
+            away={player.id for player in game_state.players if not player.is_connected},
+        )
+        self.backend.create(state)
+        return state
+
+    def _get_playing(self, game_id: str) -> HotGameState:
+        state = self.get(game_id)
+        if state is None or state.status != GameStatus.PLAYING:
+            raise ValidationError("Game is not in progress.")
+        return state
+
+    def take_turn(self, game_id: str, session_key: str, word: str | None) -> HotGameState:
+        """
+        Take a turn in a hot game, with the same checks as ``Game.take_turn``.
+        :param game_id: str - The id of the game.
+        :param session_key: str - The session key of the player taking the turn.
+        :param word: str | None - The word the player submitted.
+        :return: HotGameState - The state of the game after the turn.
+        :raises ValidationError: If the player cannot take a turn or the word is invalid.
+        """
+        state = self._get_playing(game_id)
+        game_state = state.to_engine_state()
+
+        def is_in_dictionary(word: str) -> bool:
+            return Word.validate(word, state.locale, state.version)
+
+        now = timezone.now()
+        with engine_rules():
+            turn = engine.take_turn(
+                game_state, state.sessions.get(session_key), word, now.timestamp(), is_in_dictionary
+            )
+        return self._save_turn(state, game_state, turn, now)
+
+    def _apply_turn(self, state: HotGameState, word: str | None, now: datetime) -> HotGameState:
+        game_state = state.to_engine_state()
+        with engine_rules():
+            turn = engine.apply_turn(game_state, word, now.timestamp())
+        return self._save_turn(state, game_state, turn, now)
+
+    def _save_turn(
+        self, state: HotGameState, game_state: engine.GameState, turn: engine.Turn, now: datetime
+    ) -> HotGameState:
+        # Writes a turn the engine played on a copy of ``state``, unless another turn was saved first.
+        entry = {
+            "id": generate_id(),
+            "word": turn.word,
+            "score": turn.score,
+            "duration": turn.duration,
+            "player_id": turn.player_id,
+        }
+        new_state = dataclasses.replace(
+            state,
+            status=game_state.status,
+            turn=game_state.turn,
+            round=game_state.round,
+            current=game_state.current,
+            last_word=game_state.last_word,
+            deadline=game_state.deadline,
+            used_words=game_state.used_words,
+            used_letters=game_state.used_letters,
+            scores={player.id: player.score for player in game_state.players},
+        )
+        fields = {
+            field: value
+            for field, value in new_state.to_fields().items()
+            if field in ("status", "turn", "round", "current", "last_word", "deadline")
+        }
+        result = self.backend.apply(state.game_id, state.turn, turn.word, turn.player_id, turn.score, entry, fields)
+        if result == TURN_CHANGED:
+            raise ValidationError("It is not your turn.")
+        if result == WORD_USED:
+            raise ValidationError("Word already used.")
+        new_state.revision = result
+
+        send_turn_taken(
+            state.game_id,
+            GameWord(
+                id=entry["id"],
+                game_id=state.game_id,
+                player_id=turn.player_id,
+                word=turn.word,
+                score=turn.score,
+                duration=turn.duration,
+            ),
+        )
+        if new_state.status == GameStatus.FINISHED:
+            send_game_updated(self.game_json(new_state))
+        else:
+            send_game_updated(self.game_changes(new_state, now))
+        send_game_timer_updated(state.game_id, new_state.turn_time_left(now))
+        if new_state.status == GameStatus.FINISHED:
+            from shiritori.game.tasks import flush_hot_game_task
+
+            flush_hot_game_task.delay(state.game_id)
+        return new_state
+
+    def choose_bot_word(self, state: HotGameState, now: datetime) -> str | None:
+        letter_index = get_letter_index(state.locale)
+        is_valid = None
+        if state.version not in (None, letter_index.index.version):
+
+            def is_valid(word: str) -> bool:
+                return Word.validate(word, state.locale, state.version)
+
+        return choose_word(
+            letter_index,
+            state.last_word,
+            state.word_length,
+            state.used_words,
+            state.bots[state.current],
+            used_letters=state.used_letters,
+            duration=state.turn_time - state.turn_time_left(now),
+            turn_time=state.turn_time,
+            is_valid=is_valid,
+        )
+
+    def run_timers(self, game_id: str) -> datetime | None:
+        """
+        Run whatever is due in a hot game's current turn, the same way ``Game.run_timers`` does.
+        :param game_id: str - The id of the game.
+        :return: datetime | None - When the game next needs its timers run, or None if it is not in progress.
+        """
+        state = self.get(game_id)
+        if state is None or state.status != GameStatus.PLAYING:
+            return None
+        now = timezone.now()
+        word = None
+        if state.turn_time_left(now) > 0:
+            if (bot_turn_at := state.bot_turn_at(now)) is None or bot_turn_at > now:
+                return state.next_timer_at(now)
+            if (word := self.choose_bot_word(state, now)) is None:
+                return state.deadline_at
+        try:
+            state = self._apply_turn(state, word, now)
+        except ValidationError:
+            # Another timer or a player got to the turn first.
+            if (state := self.get(game_id)) is None:
+                return None
+        return state.next_timer_at(now)
+
+    def set_connected(self, game_id: str, player_id: str, connected: bool) -> None:
+        self.backend.set_away(game_id, player_id, not connected)
+
+    def bump_revision(self, game_id: str) -> int | None:
+        """
+        Count a game_updated event sent from the database for a hot game, see ``Game.bump_revision``.
+        :param game_id: str - The id of the game.
+        :return: int | None - The revision the event brings clients to, or None if the game is no longer hot.
+        """
+        return self.backend.bump_revision(game_id)
+
+    def game_changes(self, state: HotGameState, now: datetime) -> dict:
+        """
+        Serialize what a turn changed in a hot game, like ``get_game_update_fields`` picks it for a turn.
+        The longest word is left out, it is sent with the whole game once the game finishes.
+        :param state: HotGameState - The state of the game after the turn.
+        :param now: datetime - The current time.
+        :return: dict - The changes.
+        """
+        return {
+            "id": state.game_id,
+            "revision": state.revision,
+            "current_turn": state.turn,
+            "current_round": state.round,
+            "current_player": state.current,
+            "last_word": state.last_word,
+            "turn_deadline": state.deadline_at.isoformat() if state.deadline_at else None,
+            "turn_time_left": state.turn_time_left(now),
+            "word_count": state.snapshot["word_count"] + state.turn - state.snapshot["current_turn"],
+        }
+
+    def game_json(self, state: HotGameState) -> dict:
+        """
+        Serialize a hot game like ``convert_game_to_json``, from the snapshot taken when it was loaded
+        and the turns taken since.
+        :param state: HotGameState - The state of the game.
+        :return: dict - The game.
+        """
+        data = copy.deepcopy(state.snapshot)
+        history = self.backend.history(state.game_id)
+        longest = max((len(word["word"] or "") for word in data["words"]), default=0)
+        for entry in history:
+            if entry["word"] and len(entry["word"]) > longest:
+                longest, data["longest_word"] = len(entry["word"]), entry["id"]
+        data["words"] += [{key: entry[key] for key in ("word", "score", "duration", "player_id")} for entry in history]
+        for player in data["players"]:
+            player["score"] = int(round(state.scores.get(player["id"], 0), 0))
+            player["is_current"] = player["id"] == state.current
+            player["is_connected"] = player["id"] not in state.away
+        data.update(
+            revision=state.revision,
+            status=state.status,
+            is_finished=state.status == GameStatus.FINISHED,
+            current_turn=state.turn,
+            current_round=state.round,
+            current_player=state.current,
+            last_word=state.last_word,
+            turn_deadline=state.deadline_at.isoformat() if state.deadline_at else None,
+            turn_time_left=state.turn_time_left(timezone.now()),
+            word_count=len(data["words"]),
+        )
+        if state.status == GameStatus.FINISHED and state.scores:
+            data["winner"] = max(state.order, key=lambda player_id: state.scores.get(player_id, 0))
+        return data
+
+    def flush(self, game_id: str) -> int:
+        """
+        Write the turns taken since the last flush to the database, and finish the game there once it finished.
+        The store only counts the turns as flushed once the transaction commits, so a flush that fails is retried whole.
+        :param game_id: str - The id of the game.
+        :return: int - The number of turns written.
+        """
+        with transaction.atomic():
+            # Flushes of a game take turns on its row, so each one reads the state after the last one committed.
+            if not Game.objects.select_for_update().filter(id=game_id).exists():
+                return 0
+            if (state := self.get(game_id)) is None:
+                return 0
+            history = self.backend.history(game_id, state.flushed)
+            # ``flushed`` only moves once a flush committed, turns a flush wrote before it moved are skipped here.
+            written = set(
+                GameWord.objects.filter(id__in=[entry["id"] for entry in history]).values_list("id", flat=True)
+            )
+            entries = [entry for entry in history if entry["id"] not in written]
+            # A player removed since their turn keeps their words, like GameWord.player's SET_NULL.
+            players = set(Player.objects.filter(game_id=game_id).values_list("id", flat=True))
+            for entry in entries:
+                if entry["player_id"] not in players:
+                    entry["player_id"] = None
+            GameWord.objects.bulk_create(
+                GameWord(
+                    id=entry["id"],
+                    game_id=game_id,
+                    player_id=entry["player_id"],
+                    word=entry["word"],
+                    score=entry["score"],
+                    duration=entry["duration"],
+                )
+                for entry in entries
+            )
+            # bulk_create skips GameWord.save, so the scores are added to the players here.
+            scores = {}
+            for entry in entries:
+                if entry["player_id"]:
+                    scores[entry["player_id"]] = scores.get(entry["player_id"], 0) + entry["score"]
+            for player_id, score in scores.items():
+                Player.objects.filter(id=player_id).update(total_score=F("total_score") + score)
+            Game.objects.filter(id=game_id).update(
+                current_turn=state.turn,
+                current_round=state.round,
+                last_word=state.last_word,
+                turn_deadline=state.deadline_at,
+                used_last_letters="".join(sorted(state.used_letters)),
+                revision=Greatest("revision", Value(state.revision)),
+            )
+            Player.objects.filter(game_id=game_id, is_current=True).exclude(id=state.current).update(is_current=False)
+            Player.objects.filter(id=state.current).update(is_current=True)
+            if state.status == GameStatus.FINISHED:
+                Game.objects.get(id=game_id).finish()
+            transaction.on_commit(
+                functools.partial(self._flushed, game_id, state.flushed, state.flushed + len(history), state.status)
+            )
+        return len(entries)
+
+    def _flushed(self, game_id: str, flushed: int, new_flushed: int, status: str) -> None:
+        # Runs once a flush committed, a game that finished is in the database for good and leaves the store.
+        if status == GameStatus.FINISHED:
+            self.backend.delete(game_id)
+        else:
+            self.backend.mark_flushed(game_id, flushed, new_flushed)
+
+    def discard(self, game_id: str) -> None:
+        self.backend.delete(game_id)
+
+
+@functools.cache
+def get_hot_game_store() -> HotGameStore:
+    """
+    Get the hot game store of this process, set by ``HOT_STATE_URL``. ``memory://`` keeps games in-process.
+    :return: HotGameStore - The store.
+    """
+    if settings.HOT_STATE_URL == "memory://":
+        return HotGameStore(MemoryHotGameBackend())
+    return HotGameStore(RedisHotGameBackend.from_url(settings.HOT_STATE_URL))
+
+
+def get_hot_game_store_for(game_id: str) -> HotGameStore | None:
+    """
+    Get the hot game store if hot state is enabled and the game is in it.
+    :param game_id: str - The id of the game.
+    :return: HotGameStore | None - The store, or None if the game is played from the database.
+    """
+    if not settings.HOT_STATE_ENABLED:
+        return None
+    store = get_hot_game_store()
+    return store if store.is_hot(game_id) else None
@@ -0,0 +1,47 @@
+from django.conf import settings
+from django.core.management import BaseCommand
+
+from shiritori.game.bot import SEARCH_MAX_DEPTH, SEARCH_TIME_BUDGET, MoveSearch, SearchResult
+from shiritori.game.dictionary import DictionaryIndex, LetterIndex, get_letter_index
+
+
+class Command(BaseCommand):
+    help = "Runs the hard bot's move search from every letter and reports how many nodes it searches per second"
+
+    def add_arguments(self, parser):
+        parser.add_argument("locale", nargs="?", type=str, default="en")
+        parser.add_argument("--budget", type=float, default=SEARCH_TIME_BUDGET, help="Seconds per search.")
+        parser.add_argument("--depth", type=int, default=SEARCH_MAX_DEPTH, help="Maximum search depth.")
+        parser.add_argument("--word-length", type=int, default=3, help="Minimum word length.")
+        parser.add_argument(
+            "--from-file",
+            action="store_true",
+            help="Search dictionaries/<locale>.txt instead of the word table, no database required.",
+        )
+
+    def handle(self, *args, **options):
+        locale = options["locale"]
+        if options["from_file"]:
+            with open(f"{settings.BASE_DIR}/dictionaries/{locale}.txt", encoding="utf-8") as f:
+                letter_index = LetterIndex.from_dictionary_index(DictionaryIndex.from_words(line.strip() for line in f))
+        else:
+            letter_index = get_letter_index(locale)
+
+        results: list[SearchResult] = []
+        for letter in letter_index.alphabet:
+            search = MoveSearch(letter_index, options["word_length"], ())
+            result = search.search(letter, options["budget"], options["depth"])
+            results.append(result)
+            self.stdout.write(
+                f"  {letter}: {result.word or '-'} at depth {result.depth}, "
+                f"{result.nodes} nodes in {result.elapsed * 1000:.1f}ms"
+            )
+
+        nodes = sum(result.nodes for result in results)
+        elapsed = sum(result.elapsed for result in results)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Searched {len(results)} letters: {nodes} nodes in {elapsed:.2f}s, "
+                f"{nodes / elapsed if elapsed else 0:.0f} nodes per second"
+            )
+        )
@@ -0,0 +1,44 @@
+import itertools
+import string
+import time
+
+from django.core.management import BaseCommand
+
+from shiritori.game import engine
+
+
+class Command(BaseCommand):
+    help = "Plays turns with the game engine in memory and reports how many it applies per second, no database required"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--turns", type=int, default=1_000_000, help="Turns to play.")
+        parser.add_argument("--players", type=int, default=4, help="Players per game.")
+        parser.add_argument("--max-turns", type=int, default=20, help="Turns per player before a game finishes.")
+
+    def handle(self, *args, **options):
+        # Words are made up from the previous word's last letter, the engine does not look them up.
+        suffixes = itertools.cycle("".join(letters) for letters in itertools.product(string.ascii_lowercase, repeat=3))
+        turns = games = 0
+        elapsed = 0.0
+        while turns < options["turns"]:
+            state = engine.GameState(
+                players=[engine.PlayerState(id=str(index)) for index in range(options["players"])],
+                turn_time=60,
+                max_turns=options["max_turns"] * options["players"],
+                last_word="a",
+            )
+            engine.start(state, now=0)
+            words = [next(suffixes) for _ in range(state.max_turns + 1)]
+            started_at = time.perf_counter()
+            for now, suffix in enumerate(words, start=1):
+                engine.apply_turn(state, state.last_word[-1] + suffix if now % 5 else None, now)
+            elapsed += time.perf_counter() - started_at
+            turns += len(words)
+            games += 1
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Played {turns} turns of {games} games in {elapsed:.2f}s, "
+                f"{turns / elapsed if elapsed else 0:.0f} turns per second"
+            )
+        )
@@ -0,0 +1,54 @@
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+from django.db import DatabaseError
+
+from shiritori.game.dictionary import build_dictionary_artifact, invalidate_dictionary_index
+from shiritori.game.models import DictionaryVersion
+
+
+class Command(BaseCommand):
+    help = "Compiles word dictionaries into read-only index files that workers memory-map"
+
+    def add_arguments(self, parser):
+        parser.add_argument("locale", nargs="+", type=str, default=["en"])
+        parser.add_argument(
+            "--from-file",
+            action="store_true",
+            help="Compile from dictionaries/<locale>.txt instead of the word table, no database required.",
+        )
+
+    @staticmethod
+    def get_file_version(locale: str) -> int | None:
+        """
+        Get the dictionary version a locale's dictionary file was loaded as.
+        :param locale: str - The locale of the dictionary.
+        :return: int | None - The latest version if it was loaded from this very file,
+            None if it was not or there is no database to ask.
+        """
+        try:
+            current = DictionaryVersion.get_current(locale)
+        except DatabaseError:
+            return None
+        if current is None or current.content_hash != DictionaryVersion.hash_dictionary_file(locale):
+            return None
+        return current.id
+
+    def handle(self, *args, **options):
+        if not settings.DICTIONARY_INDEX_DIR:
+            raise CommandError("DICTIONARY_INDEX_DIR is not set.")
+        for locale in options["locale"]:
+            self.stdout.write(f"Building {locale} dictionary index")
+            if options["from_file"]:
+                if (version := self.get_file_version(locale)) is None:
+                    self.stdout.write(
+                        self.style.WARNING(
+                            f"dictionaries/{locale}.txt is not the latest loaded {locale} dictionary, "
+                            "the index is unversioned and games pinned to a version check the word table"
+                        )
+                    )
+                with open(f"{settings.BASE_DIR}/dictionaries/{locale}.txt", encoding="utf-8") as f:
+                    path = build_dictionary_artifact(locale, (line.strip() for line in f), version)
+            else:
+                path = build_dictionary_artifact(locale)
+            invalidate_dictionary_index(locale)
+            self.stdout.write(self.style.SUCCESS(f"Successfully built {locale} dictionary index at {path}"))
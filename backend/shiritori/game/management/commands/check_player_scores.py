@@ -0,0 +1,26 @@
+from django.core.management import BaseCommand
+
+from shiritori.game.models import Player
+
+
+class Command(BaseCommand):
+    help = "Recomputes every player's total score from the game_word table and reports the players it differs for"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--fix", action="store_true", help="Overwrite the mismatched total scores.")
+
+    def handle(self, *args, **options):
+        mismatches = list(Player.get_score_mismatches())
+        for player in mismatches:
+            self.stdout.write(
+                f"  {player.id} ({player.name}, game {player.game_id}): "
+                f"stored {player.total_score}, words add up to {player.word_score}"
+            )
+            if options["fix"]:
+                player.recompute_total_score()
+        if not mismatches:
+            self.stdout.write(self.style.SUCCESS("Every total score matches its words"))
+        elif options["fix"]:
+            self.stdout.write(self.style.SUCCESS(f"Fixed the total score of {len(mismatches)} players"))
+        else:
+            self.stdout.write(self.style.WARNING(f"{len(mismatches)} players have a mismatched total score"))
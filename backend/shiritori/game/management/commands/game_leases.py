@@ -0,0 +1,15 @@
+from django.core.management import BaseCommand
+
+from shiritori.game.models import GameLease
+
+
+class Command(BaseCommand):
+    help = "Shows how the turn loops of games in progress are spread across workers, and how many are orphaned"
+
+    def handle(self, *args, **options):
+        total = 0
+        for row in GameLease.get_worker_counts():
+            total += row["games"]
+            self.stdout.write(f"  {row['worker'] or '-'}: {row['games']} games")
+        orphaned = GameLease.get_orphaned_games().count()
+        self.stdout.write(f"{total} games have a live turn loop, {orphaned} are waiting for the supervisor")
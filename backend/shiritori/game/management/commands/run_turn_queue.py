@@ -0,0 +1,19 @@
+import signal
+import threading
+
+from django.core.management import BaseCommand
+
+from shiritori.game.turn_queue import TurnQueueWorker
+
+
+class Command(BaseCommand):
+    help = "Runs a turn queue worker, start as many as needed to share the games in the turn queue"
+
+    def handle(self, *args, **options):
+        worker = TurnQueueWorker()
+        stop = threading.Event()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(sig, lambda *_: stop.set())
+        self.stdout.write(f"Running turn queue worker {worker.name}")
+        worker.run(stop)
+        self.stdout.write(self.style.SUCCESS("Stopped turn queue worker"))
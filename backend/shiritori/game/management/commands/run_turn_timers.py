@@ -0,0 +1,27 @@
+import asyncio
+import signal
+
+from django.core.management import BaseCommand
+
+from shiritori.game.timers import TurnTimerService
+
+
+class Command(BaseCommand):
+    help = "Runs the turn timers of every game from one process, instead of one Celery task per game"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--token", type=str, help="The id the service claims games with, random by default.")
+
+    def handle(self, *args, **options):
+        service = TurnTimerService(options["token"])
+        self.stdout.write(f"Running turn timers as {service.token}")
+        asyncio.run(self.run(service))
+        self.stdout.write(self.style.SUCCESS("Stopped turn timers and released their games"))
+
+    @staticmethod
+    async def run(service: TurnTimerService):
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stop.set)
+        await service.run(stop)
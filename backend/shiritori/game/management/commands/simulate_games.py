@@ -0,0 +1,74 @@
+import os
+
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+
+from shiritori.game.models import BotDifficulty
+from shiritori.game.simulation import SimulationSettings, describe, run_simulation
+
+
+def _duration_modifiers(value: str) -> dict[int, float]:
+    try:
+        return {int(bucket): float(modifier) for bucket, modifier in (pair.split(":") for pair in value.split(","))}
+    except ValueError as error:
+        raise CommandError(f"Invalid duration modifiers {value!r}, expected e.g. 5:1.8,10:1.5,15:1.2") from error
+
+
+class Command(BaseCommand):
+    help = (
+        "Plays bot-vs-bot games across a process pool with a real dictionary and no database, "
+        "and reports turns per second, scores, game lengths and dead ends"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("locale", nargs="?", type=str, default="en")
+        parser.add_argument("--games", type=int, default=100, help="Games to play.")
+        parser.add_argument("--processes", type=int, default=os.cpu_count() or 1, help="0 plays in this process.")
+        parser.add_argument(
+            "--bots",
+            type=str,
+            default=f"{BotDifficulty.MEDIUM},{BotDifficulty.MEDIUM}",
+            help="The difficulty of every bot in a game, comma separated.",
+        )
+        parser.add_argument(
+            "--dictionary", type=str, help="A word list or .idx file, dictionaries/<locale>.txt by default."
+        )
+        parser.add_argument("--turn-time", type=int, default=60)
+        parser.add_argument("--max-turns", type=int, default=10, help="Turns per player.")
+        parser.add_argument("--word-length", type=int, default=3)
+        parser.add_argument("--seed", type=int)
+        parser.add_argument("--duration-modifiers", type=_duration_modifiers, help="Replaces DURATION_MODIFIERS.")
+        parser.add_argument("--missed-word-penalty", type=float, help="Replaces MISSED_WORD_PENALTY.")
+
+    def handle(self, *args, **options):
+        difficulties = tuple(difficulty.strip().upper() for difficulty in options["bots"].split(","))
+        if len(difficulties) < 2 or any(difficulty not in BotDifficulty.values for difficulty in difficulties):
+            raise CommandError(f"--bots needs at least 2 of {', '.join(BotDifficulty.values)}")
+        simulation = SimulationSettings(
+            dictionary=options["dictionary"] or f"{settings.BASE_DIR}/dictionaries/{options['locale']}.txt",
+            difficulties=difficulties,
+            turn_time=options["turn_time"],
+            max_turns=options["max_turns"],
+            word_length=options["word_length"],
+            seed=options["seed"],
+            duration_modifiers=options["duration_modifiers"],
+            missed_word_penalty=options["missed_word_penalty"],
+        )
+        report = run_simulation(simulation, options["games"], options["processes"])
+
+        self.stdout.write(f"Game length (turns): {describe(report.game_turns)}")
+        self.stdout.write(f"Game length (seconds of play): {describe(report.game_times)}")
+        for difficulty, scores in sorted(report.scores.items()):
+            self.stdout.write(f"{difficulty} score: {describe(scores)}")
+        for difficulty, wins in sorted(report.wins.items()):
+            self.stdout.write(f"{difficulty} wins: {wins} ({wins / report.games:.0%})")
+        self.stdout.write(
+            f"Dead ends: {report.dead_ends} turns ({report.dead_end_rate:.2%}), "
+            f"in {report.dead_end_games} of {report.games} games"
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Played {report.games} games, {report.turns} turns in {report.elapsed:.2f}s, "
+                f"{report.turns_per_second:.0f} turns per second"
+            )
+        )
@@ -13,5 +13,9 @@ class Command(BaseCommand):
     def handle(self, *args, **options):
         for locale in options["locale"]:
             self.stdout.write(f"Updating {locale} dictionary")
-            Word.load_dictionary(locale)
-            self.stdout.write(self.style.SUCCESS(f"Successfully updated {locale} dictionary"))
+            result = Word.load_dictionary(locale, progress=lambda read: self.stdout.write(f"  {read} words read"))
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Successfully updated {locale} dictionary: {result.read} words read, {result.created} new"
+                )
+            )
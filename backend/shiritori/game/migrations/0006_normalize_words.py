@@ -0,0 +1,55 @@
+# Generated by Django 4.2.30 on 2026-10-17 18:48
+
+import unicodedata
+
+from django.db import migrations
+
+import shiritori.game.fields
+
+
+def normalize_word(word):
+    # Frozen copy of shiritori.game.utils.normalize_word
+    return unicodedata.normalize("NFKC", word.lower()) if word else None
+
+
+def normalize_model_words(model, scope_field, delete_duplicates):
+    # Only rows whose stored word changes are touched. A row whose normalized word already exists in the same scope
+    # is a duplicate under the new rules: duplicate words of the dictionary are interchangeable, so they're removed,
+    # while a duplicate turn keeps its original spelling, so no turn or score is lost.
+    changed = [
+        (pk, scope, normalized)
+        for pk, scope, word in model.objects.values_list("pk", scope_field, "word").iterator(chunk_size=10_000)
+        if word and (normalized := normalize_word(word)) != word
+    ]
+    for pk, scope, normalized in changed:
+        qs = model.objects.filter(pk=pk)
+        if model.objects.filter(**{scope_field: scope}).filter(word=normalized).exclude(pk=pk).exists():
+            if delete_duplicates:
+                qs.delete()
+        else:
+            qs.update(word=normalized)
+
+
+def normalize_words(apps, _):
+    normalize_model_words(apps.get_model("game", "Word"), "locale", delete_duplicates=True)
+    normalize_model_words(apps.get_model("game", "GameWord"), "game_id", delete_duplicates=False)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("game", "0005_game_current_round_player_order_player_unique_order"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="gameword",
+            name="word",
+            field=shiritori.game.fields.NormalizedWordField(blank=True, max_length=255, null=True),
+        ),
+        migrations.AlterField(
+            model_name="word",
+            name="word",
+            field=shiritori.game.fields.NormalizedWordField(max_length=255),
+        ),
+        migrations.RunPython(normalize_words, migrations.RunPython.noop),
+    ]
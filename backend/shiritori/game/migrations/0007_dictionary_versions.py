@@ -0,0 +1,60 @@
+# Generated by Django 4.2.30 on 2026-10-17 18:51
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("game", "0006_normalize_words"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DictionaryVersion",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("locale", models.CharField(choices=[("en", "English")], default="en", max_length=10)),
+                ("content_hash", models.CharField(max_length=64)),
+                ("word_count", models.IntegerField(default=0)),
+                ("added_count", models.IntegerField(default=0)),
+                ("removed_count", models.IntegerField(default=0)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "db_table": "dictionary_version",
+                "ordering": ("-id",),
+                "indexes": [models.Index(fields=["locale", "-id"], name="dictionary__locale_84a3d9_idx")],
+            },
+        ),
+        migrations.AddField(
+            model_name="game",
+            name="dictionary_version",
+            field=models.ForeignKey(
+                blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to="game.dictionaryversion"
+            ),
+        ),
+        migrations.AddField(
+            model_name="word",
+            name="added_in",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="added_words",
+                to="game.dictionaryversion",
+            ),
+        ),
+        migrations.AddField(
+            model_name="word",
+            name="removed_in",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="removed_words",
+                to="game.dictionaryversion",
+            ),
+        ),
+    ]
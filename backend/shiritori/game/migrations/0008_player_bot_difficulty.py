@@ -0,0 +1,20 @@
+# Generated by Django 4.2.30 on 2026-10-17 18:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("game", "0007_dictionary_versions"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="player",
+            name="bot_difficulty",
+            field=models.CharField(
+                blank=True, choices=[("EASY", "Easy"), ("MEDIUM", "Medium"), ("HARD", "Hard")], max_length=10, null=True
+            ),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.30 on 2026-10-17 19:03
+
+from datetime import timedelta
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def turn_time_left_to_deadline(apps, _):
+    Game = apps.get_model("game", "Game")
+    now = timezone.now()
+    for game in Game.objects.filter(status="PLAYING", turn_time_left__gt=0).only("turn_time_left"):
+        game.turn_deadline = now + timedelta(seconds=game.turn_time_left)
+        game.save(update_fields=["turn_deadline"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("game", "0008_player_bot_difficulty"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="game",
+            name="turn_deadline",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(turn_time_left_to_deadline, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name="game",
+            name="turn_time_left",
+        ),
+    ]
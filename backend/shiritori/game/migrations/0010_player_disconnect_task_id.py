@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-17 20:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("game", "0009_turn_deadline"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="player",
+            name="disconnect_task_id",
+            field=models.CharField(blank=True, max_length=255, null=True),
+        ),
+    ]
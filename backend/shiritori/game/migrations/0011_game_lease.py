@@ -0,0 +1,38 @@
+# Generated by Django 4.2.30 on 2026-10-17 19:17
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("game", "0010_player_disconnect_task_id"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="GameLease",
+            fields=[
+                (
+                    "game",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="lease",
+                        serialize=False,
+                        to="game.game",
+                    ),
+                ),
+                ("owner", models.CharField(max_length=255)),
+                ("worker", models.CharField(blank=True, default="", max_length=255)),
+                ("token", models.PositiveBigIntegerField(default=0)),
+                ("acquired_at", models.DateTimeField()),
+                ("heartbeat_at", models.DateTimeField()),
+                ("expires_at", models.DateTimeField(db_index=True)),
+            ],
+            options={
+                "db_table": "game_lease",
+            },
+        ),
+    ]
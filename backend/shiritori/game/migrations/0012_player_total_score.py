@@ -0,0 +1,29 @@
+# Generated by Django 4.2.30 on 2026-10-17 21:02
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+
+def backfill_total_score(apps, _):
+    Player = apps.get_model("game", "Player")
+    GameWord = apps.get_model("game", "GameWord")
+    word_scores = (
+        GameWord.objects.filter(player=OuterRef("pk")).values("player").annotate(total=Sum("score")).values("total")
+    )
+    Player.objects.update(total_score=Coalesce(Subquery(word_scores), 0.0))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("game", "0011_game_lease"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="player",
+            name="total_score",
+            field=models.FloatField(default=0),
+        ),
+        migrations.RunPython(backfill_total_score, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.30 on 2026-10-17 21:40
+
+from django.db import migrations, models
+
+
+def backfill_used_last_letters(apps, _):
+    Game = apps.get_model("game", "Game")
+    GameWord = apps.get_model("game", "GameWord")
+    letters = {}
+    for game_id, word in GameWord.objects.exclude(word=None).values_list("game_id", "word").iterator():
+        letters.setdefault(game_id, set()).add(word[-1])
+    for game_id, game_letters in letters.items():
+        Game.objects.filter(id=game_id).update(used_last_letters="".join(sorted(game_letters)))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("game", "0012_player_total_score"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="game",
+            name="used_last_letters",
+            field=models.TextField(blank=True, default=""),
+        ),
+        migrations.RunPython(backfill_used_last_letters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-17 22:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("game", "0013_game_used_last_letters"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="game",
+            name="revision",
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 4.2.30 on 2026-10-17 20:17
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("game", "0014_game_revision"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="word",
+            name="previously_removed_in",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="game.dictionaryversion",
+            ),
+        ),
+        migrations.AddField(
+            model_name="word",
+            name="restored_in",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="restored_words",
+                to="game.dictionaryversion",
+            ),
+        ),
+    ]
@@ -1,17 +1,23 @@
+from .dictionary_version import DictionaryVersion
 from .game import Game
+from .game_lease import GameLease
 from .game_settings import GameSettings
 from .game_word import GameWord
 from .player import Player
-from .text_choices import GameLocales, GameStatus, PlayerType
-from .word import Word
+from .text_choices import BotDifficulty, GameLocales, GameStatus, PlayerType
+from .word import DictionaryLoadResult, Word
 
 __all__ = (
     "Game",
+    "GameLease",
     "Player",
     "Word",
+    "DictionaryLoadResult",
+    "DictionaryVersion",
     "GameWord",
     "GameSettings",
     "GameStatus",
     "GameLocales",
     "PlayerType",
+    "BotDifficulty",
 )
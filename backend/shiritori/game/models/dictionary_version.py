@@ -0,0 +1,44 @@
+import hashlib
+
+from django.conf import settings
+from django.db import models
+
+from shiritori.game.models.text_choices import GameLocales
+
+
+class DictionaryVersion(models.Model):
+    locale = models.CharField(max_length=10, choices=GameLocales.choices, default=GameLocales.EN)
+    content_hash = models.CharField(max_length=64)
+    word_count = models.IntegerField(default=0)
+    added_count = models.IntegerField(default=0)
+    removed_count = models.IntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "dictionary_version"
+        ordering = ("-id",)
+        indexes = [
+            models.Index(fields=["locale", "-id"]),
+        ]
+
+    def __str__(self):
+        return f"{self.locale} v{self.id} ({self.content_hash[:8]})"
+
+    @classmethod
+    def get_current(cls, locale: GameLocales | str) -> "DictionaryVersion | None":
+        """
+        Get the latest version of a locale's dictionary.
+        :param locale: GameLocales | str - The locale of the dictionary.
+        :return: DictionaryVersion | None - The latest version, or None if it was never loaded.
+        """
+        return cls.objects.filter(locale=locale).first()
+
+    @staticmethod
+    def hash_dictionary_file(locale: GameLocales | str) -> str:
+        """
+        Hash the contents of a locale's dictionary file.
+        :param locale: GameLocales | str - The locale of the dictionary.
+        :return: str - The SHA-256 hex digest of the file.
+        """
+        with open(f"{settings.BASE_DIR}/dictionaries/{locale}.txt", "rb") as f:
+            return hashlib.file_digest(f, "sha256").hexdigest()
@@ -1,21 +1,51 @@
-import random
-from collections.abc import Iterable
+import contextlib
+import itertools
+from collections.abc import Callable, Iterable
+from datetime import datetime, timedelta
 from typing import Optional, Union
 
 from django.core.exceptions import ValidationError
-from django.db import models, transaction
-from django.db.models import Count, F, Q, QuerySet, Sum
-from django.db.models.functions import Length, Right
-
+from django.db import connection, models, transaction
+from django.db.models import Case, Count, OuterRef, Q, QuerySet, Subquery, Value, When
+from django.db.models.functions import Concat, Greatest, Length
+from django.utils import timezone
+
+from shiritori.game import engine
+from shiritori.game.bot import BOT_THINK_TIME, choose_word
+from shiritori.game.dictionary import get_letter_index
+from shiritori.game.models.game_lease import GameLease
 from shiritori.game.models.game_settings import GameSettings
 from shiritori.game.models.game_word import GameWord
 from shiritori.game.models.player import Player
-from shiritori.game.models.text_choices import GameStatus, PlayerType
-from shiritori.game.utils import generate_random_letter, wait
+from shiritori.game.models.text_choices import BotDifficulty, GameStatus, PlayerType
+from shiritori.game.models.word import Word
+from shiritori.game.utils import TURN_LOOP_INTERVAL, generate_random_letter, normalize_word, wait
 from shiritori.utils import NanoIdField
 from shiritori.utils.abstract_model import AbstractModel
 
 
+def _bot_turn_at(turn_deadline: datetime | None, turn_time: int, bot_difficulty: str | None) -> Optional[datetime]:
+    if bot_difficulty is None or turn_deadline is None:
+        return None
+    think_time = min(BOT_THINK_TIME.get(bot_difficulty, 0), turn_time // 2)
+    return turn_deadline - timedelta(seconds=turn_time - think_time)
+
+
+@contextlib.contextmanager
+def engine_rules():
+    """
+    Raise the rules the engine says were broken as the ``ValidationError`` the views and consumers report.
+    """
+    try:
+        yield
+    except engine.GameRuleError as e:
+        raise ValidationError(str(e)) from e
+
+
+# The fields of a game only ever written by their own atomic updates.
+ATOMICALLY_UPDATED_FIELDS = ("used_last_letters", "revision")
+
+
 class Game(AbstractModel):
     id = NanoIdField(max_length=5)
     status = models.CharField(
@@ -31,9 +61,20 @@ class Game(AbstractModel):
         null=True,
         blank=True,
     )
-    turn_time_left = models.IntegerField(default=0)
+    turn_deadline = models.DateTimeField(null=True, blank=True)
     last_word = models.CharField(max_length=255, null=True, blank=True, default=generate_random_letter)
     task_id = models.CharField(max_length=255, null=True, blank=True)
+    # The distinct last letters of the words played, so the new-letter bonus needs no query over the words.
+    # Stored as characters rather than a bitmask over an alphabet, so every locale's letters fit.
+    used_last_letters = models.TextField(default="", blank=True)
+    # Counts the game_updated events sent, so clients can tell when they missed one.
+    revision = models.PositiveBigIntegerField(default=0)
+    dictionary_version = models.ForeignKey(
+        "DictionaryVersion",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+    )
 
     class Meta:
         ordering = ("-created_at",)
@@ -62,6 +103,37 @@ class Game(AbstractModel):
         """
         return Game.get_start_able_games().filter(id=game_id)
 
+    # The identity map of the game's player rows, set while a ``player_rows`` block runs.
+    _player_rows: list["Player"] | None = None
+    _player_rows_depth = 0
+
+    @contextlib.contextmanager
+    def player_rows(self):
+        """
+        Load the game's player rows once for the duration of an operation. Inside the block the player properties
+        read from them instead of querying, and the writes the game makes to its players are applied to them.
+        ``players`` is still a QuerySet that queries as usual, ``player_list`` reads the rows.
+        Blocks nest, the rows are dropped when the outermost one exits.
+        """
+        self._player_rows_depth += 1
+        try:
+            yield
+        finally:
+            self._player_rows_depth -= 1
+            if not self._player_rows_depth:
+                self._player_rows = None
+
+    def _get_player_rows(self) -> list["Player"] | None:
+        if not self._player_rows_depth:
+            return None
+        if self._player_rows is None:
+            self._player_rows = list(self.player_set.all())
+        return self._player_rows
+
+    def _invalidate_player_rows(self) -> None:
+        # For writes that add, remove or reorder players, the rows are loaded again on next use.
+        self._player_rows = None
+
     @property
     def players(self) -> "QuerySet[Player]":
         qs = self.player_set.all().exclude(type=PlayerType.SPECTATOR)
@@ -69,44 +141,79 @@ class Game(AbstractModel):
             qs = qs.order_by("order")
         return qs
 
+    @property
+    def player_list(self) -> list["Player"]:
+        """
+        The players of ``players`` as a list, read from the loaded rows inside a ``player_rows`` block.
+        """
+        if (rows := self._get_player_rows()) is None:
+            return list(self.players)
+        players = [player for player in rows if player.type != PlayerType.SPECTATOR]
+        if self.is_started:
+            players.sort(key=lambda player: (player.order is None, player.order or 0))
+        return players
+
     @property
     def words(self) -> "QuerySet[GameWord]":
         return self.gameword_set.all()
 
     @property
     def host(self) -> Optional["Player"]:
+        if (rows := self._get_player_rows()) is not None:
+            return next((player for player in rows if player.is_host), None)
         return self.player_set.filter(is_host=True).first()
 
     @property
     def current_player(self) -> Optional["Player"]:
+        if (rows := self._get_player_rows()) is not None:
+            return next((player for player in rows if player.is_current), None)
         return self.player_set.filter(is_current=True).first()
 
     @property
     def next_player(self) -> Optional["Player"]:
-        return self.players[self.current_turn % self.player_count]
+        players = self.player_list
+        return players[self.current_turn % len(players)]
 
     @property
     def last_player(self) -> Optional["Player"]:
+        if self._get_player_rows() is not None:
+            return next((player for player in reversed(self.player_list) if player.is_connected), None)
         return self.players.filter(is_connected=True).last()
 
     @current_player.setter
     def current_player(self, value: "Player") -> None:
         self.player_set.filter().update(is_current=False)
+        for player in self._player_rows or ():
+            player.is_current = player.id == value.id
         value.is_current = True
         value.save(update_fields=["is_current"])
 
     @property
     def winner(self) -> Optional["Player"]:
+        if (rows := self._get_player_rows()) is not None:
+            return next((player for player in rows if player.type == PlayerType.WINNER), None)
         return self.player_set.filter(type=PlayerType.WINNER).first()
 
     @winner.setter
     def winner(self, value: "Player") -> None:
-        self.player_set.filter(type=PlayerType.WINNER).update(type=PlayerType.HUMAN)
+        self.player_set.filter(type=PlayerType.WINNER).update(
+            type=Case(
+                When(bot_difficulty__isnull=False, then=Value(PlayerType.BOT)),
+                default=Value(PlayerType.HUMAN),
+            )
+        )
+        for player in self._player_rows or ():
+            if player.id == value.id:
+                player.type = PlayerType.WINNER
+            elif player.type == PlayerType.WINNER:
+                player.type = PlayerType.BOT if player.bot_difficulty is not None else PlayerType.HUMAN
         value.type = PlayerType.WINNER
         value.save(update_fields=["type"])
 
     @property
     def player_count(self) -> int:
+        if self._get_player_rows() is not None:
+            return len(self.player_list)
         return self.players.count()
 
     @property
@@ -121,6 +228,19 @@ class Game(AbstractModel):
     def longest_word(self) -> Optional["GameWord"]:
         return self.gameword_set.order_by(Length("word").desc()).first()
 
+    @property
+    def turn_time_left(self) -> float:
+        """
+        The seconds left in the current turn, derived from the turn deadline so the timer never needs to be written.
+        """
+        if self.turn_deadline is None:
+            return 0
+        return max((self.turn_deadline - timezone.now()).total_seconds(), 0)
+
+    @turn_time_left.setter
+    def turn_time_left(self, value: int | float) -> None:
+        self.turn_deadline = timezone.now() + timedelta(seconds=value) if value > 0 else None
+
     @property
     def is_finished(self) -> bool:
         return self.status == GameStatus.FINISHED
@@ -135,23 +255,27 @@ class Game(AbstractModel):
 
     @property
     def leaderboard(self) -> QuerySet["Player"]:
-        return self.players.annotate(
-            total_score=Sum("gameword__score"),
-        ).order_by("-total_score")
+        return self.players.order_by("-total_score", "order")
 
     @property
     def max_turns(self):
         return self.settings.max_turns * self.player_count
 
     @property
-    def used_letters(self) -> "QuerySet[str]":
-        return (
-            self.gameword_set.annotate(
-                last_letter=Right("word", 1),
-            )
-            .values_list("last_letter", flat=True)
-            .distinct()
+    def used_letters(self) -> set[str]:
+        return set(self.used_last_letters)
+
+    def add_used_letter(self, letter: str) -> None:
+        """
+        Record the last letter of a word played, if it is new, without overwriting a concurrent addition.
+        :param letter: str - The letter.
+        """
+        if letter in self.used_last_letters:
+            return
+        Game.objects.filter(id=self.id).exclude(used_last_letters__contains=letter).update(
+            used_last_letters=Concat("used_last_letters", Value(letter))
         )
+        self.used_last_letters += letter
 
     def save(
         self,
@@ -174,8 +298,39 @@ class Game(AbstractModel):
             and "settings" not in update_fields
         ):
             update_fields.append("settings")
+        if update_fields is None and not self._state.adding and not force_insert:
+            # A full save of a game loaded earlier must not roll back the fields written by atomic updates.
+            update_fields = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in ATOMICALLY_UPDATED_FIELDS
+            ]
         super().save(force_insert, force_update, using, update_fields)
 
+    def bump_revision(self) -> int:
+        """
+        Count a game_updated event, in a single statement.
+        While the game is hot its turns are counted in the hot state, so the event is counted there too
+        and the database only follows along, for when the game leaves the hot state.
+        :return: int - The revision of the game the event brings clients to.
+        """
+        from shiritori.game.hot_state import get_hot_game_store_for
+
+        if (hot_game_store := get_hot_game_store_for(self.id)) and (
+            revision := hot_game_store.bump_revision(self.id)
+        ) is not None:
+            Game.objects.filter(id=self.id).update(revision=Greatest("revision", Value(revision)))
+            self.revision = revision
+            return self.revision
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {Game._meta.db_table} SET revision = revision + 1 WHERE id = %s RETURNING revision", [self.id]
+            )
+            # A game deleted along with its last player has nothing left to count.
+            if (row := cursor.fetchone()) is not None:
+                self.revision = row[0]
+        return self.revision
+
     def join(self, player: Union["Player", str], session_key: str = None) -> "Player":
         """Add a player to the game."""
         if self.is_started or self.is_finished:
@@ -195,24 +350,45 @@ class Game(AbstractModel):
             if not player.session_key:
                 player.session_key = session_key
         player.save(update_fields=["name", "game", "type", "session_key", "is_host"])
+        self._invalidate_player_rows()
         return player
 
+    def add_bot(self, difficulty: str = BotDifficulty.MEDIUM, session_key: str = None) -> "Player":
+        """
+        Add a bot player to the game.
+        :param difficulty: str - The BotDifficulty of the bot.
+        :param session_key: str - The session key of the player adding the bot, who must be the host.
+        :return: Player - The bot player.
+        :raises ValidationError: If the game has started or the player is not the host.
+        """
+        if self.is_started or self.is_finished:
+            raise ValidationError("Game has already started or is finished.")
+        if session_key and (not self.host or self.host.session_key != session_key):
+            raise ValidationError("Only the host can add bots.")
+        names = set(self.player_set.values_list("name", flat=True))
+        name = next(name for i in itertools.count(1) if (name := f"Bot{i}") not in names)
+        bot = Player.objects.create(name=name, game=self, type=PlayerType.BOT, bot_difficulty=difficulty)
+        self._invalidate_player_rows()
+        return bot
+
     def leave(self, player: Union["Player", str]) -> None:
         """Remove a player from the game."""
-        if isinstance(player, str):
-            player = self.player_set.get(session_key=player)
-        player.delete()
-        if player.is_host:
-            try:
-                self.recalculate_host()
-            except ValidationError:
-                self.status = GameStatus.FINISHED
-        if self.status == GameStatus.PLAYING:
-            try:
-                self.calculate_current_player(save=False)
-            except ValidationError:
-                self.status = GameStatus.FINISHED
-        self.save(update_fields=["status"])
+        with self.player_rows():
+            if isinstance(player, str):
+                player = self.player_set.get(session_key=player)
+            player.delete()
+            self._invalidate_player_rows()
+            if player.is_host:
+                try:
+                    self.recalculate_host()
+                except ValidationError:
+                    self.status = GameStatus.FINISHED
+            if self.status == GameStatus.PLAYING:
+                try:
+                    self.calculate_current_player(save=False)
+                except ValidationError:
+                    self.status = GameStatus.FINISHED
+            self.save(update_fields=["status"])
 
     def prepare_start(
         self, session_key: str = None, game_settings: Optional["GameSettings"] = None, *, save: bool = True
@@ -227,17 +403,18 @@ class Game(AbstractModel):
         """
         if self.status != GameStatus.WAITING:
             raise ValidationError("Cannot start a game that is not waiting.")
-        if session_key and self.host.session_key != session_key:
-            raise ValidationError("Only the host can start the game.")
-        if self.player_count < 2:
-            raise ValidationError("Cannot start a game with less than 2 players.")
-        self.shuffle_player_order()
-        self.calculate_current_player(save=False)
+        with self.player_rows():
+            if session_key and self.host.session_key != session_key:
+                raise ValidationError("Only the host can start the game.")
+            if self.player_count < 2:
+                raise ValidationError("Cannot start a game with less than 2 players.")
+            self.shuffle_player_order()
+            self.calculate_current_player(save=False)
         if game_settings:
             self.settings = game_settings
         self.turn_time_left = self.settings.turn_time
         if save:
-            update_fields = ["turn_time_left"]
+            update_fields = ["turn_deadline"]
             if game_settings:
                 update_fields.append("settings")
             self.save(update_fields=update_fields)
@@ -245,26 +422,49 @@ class Game(AbstractModel):
     def start(self) -> None:
         """
         Start the game.
+        The game keeps validating words against the dictionary version that is current now,
+        and the first turn starts now.
         """
         self.status = GameStatus.PLAYING
-        self.save(update_fields=["status"])
+        self.dictionary_version_id = Word.get_current_version(self.settings.locale)
+        self.reset_turn_time()
+        self.save(update_fields=["status", "dictionary_version", "turn_deadline"])
 
     def restart(self, session_key: str = None) -> None:
         """
         Restart the game.
         """
+        from shiritori.game.hot_state import get_hot_game_store_for
+
         if session_key:
             is_host = self.players.filter(session_key=session_key, is_host=True).exists()
             if not is_host:
                 raise ValidationError("Only the host can restart the game.")
-        self.players.update(is_current=False, order=None)
-        self.gameword_set.all().delete()
+        with transaction.atomic():
+            self.players.update(is_current=False, order=None, total_score=0)
+            self._invalidate_player_rows()
+            self.gameword_set.all().delete()
         self.status = GameStatus.WAITING
         self.current_turn = 0
-        self.turn_time_left = 0
+        self.turn_deadline = None
         self.task_id = None
+        GameLease.expire(self.id)
+        if hot_game_store := get_hot_game_store_for(self.id):
+            hot_game_store.discard(self.id)
+        self.dictionary_version = None
         self.last_word = generate_random_letter()
-        self.save(update_fields=["status", "current_turn", "turn_time_left", "task_id", "last_word"])
+        self.used_last_letters = ""
+        self.save(
+            update_fields=[
+                "status",
+                "current_turn",
+                "turn_deadline",
+                "task_id",
+                "dictionary_version",
+                "last_word",
+                "used_last_letters",
+            ]
+        )
 
     def finish(self):
         self.status = GameStatus.FINISHED
@@ -278,16 +478,10 @@ class Game(AbstractModel):
         :return: None
         :raises ValidationError: If there are no players in the game.
         """
-        player_count = self.player_count
-        if player_count == 0:
-            raise ValidationError("Cannot calculate current player when there are no players.")
-        if player_count == 1:
-            raise ValidationError("Cannot calculate current player when there is only 1 player.")
-
-        if self.next_player and self.next_player.is_connected is False:
-            self.skip_turn()
-        else:
-            self.current_player = self.next_player
+        players = self.player_list
+        with engine_rules():
+            current = engine.next_player(self.to_state(players, used_words=False))
+        self.current_player = self._get_player(players, current)
 
         if save:
             self.save()
@@ -296,19 +490,54 @@ class Game(AbstractModel):
         """
         Shuffles the order of the players.
         """
-        if self.is_started:
-            raise ValidationError("Cannot shuffle player order when game has started.")
-        if self.is_finished:
-            raise ValidationError("Cannot shuffle player order when game is finished.")
-        if self.player_count < 2:
-            raise ValidationError("Cannot shuffle player order when there are less than 2 players.")
+        players = self.player_list
+        state = engine.GameState(players=[engine.PlayerState(player.id) for player in players], status=self.status)
+        with engine_rules():
+            engine.shuffle_order(state)
         self.players.update(order=None)
-        players = list(self.players.all())
-        random.shuffle(players)
-        for index, player in enumerate(players):
+        for index, player_state in enumerate(state.players):
+            player = self._get_player(players, player_state.id)
             player.order = index
             # Let it be known, that for some reason bulk_update does not work here. ¯\_(ツ)_/¯
             player.save(update_fields=["order"])
+        self._invalidate_player_rows()
+
+    def to_state(self, players: list["Player"] | None = None, *, used_words: bool = True) -> engine.GameState:
+        """
+        Load the game for the rules in ``shiritori.game.engine``.
+        :param players: list[Player] - The players in turn order, loaded if not given.
+        :param used_words: bool - Whether to load the words played so far, which only turns need.
+        :return: GameState - The state of the game.
+        """
+        if players is None:
+            players = self.player_list
+        words = set(self.gameword_set.exclude(word=None).values_list("word", flat=True)) if used_words else set()
+        return engine.GameState(
+            players=[
+                engine.PlayerState(
+                    id=player.id,
+                    is_connected=player.is_connected,
+                    bot_difficulty=player.bot_difficulty,
+                    score=player.total_score,
+                )
+                for player in players
+            ],
+            status=self.status,
+            current=next((player.id for player in players if player.is_current), None),
+            turn=self.current_turn,
+            round=self.current_round,
+            last_word=self.last_word,
+            deadline=self.turn_deadline.timestamp() if self.turn_deadline else None,
+            turn_time=self.settings.turn_time,
+            max_turns=self.settings.max_turns * len(players),
+            word_length=self.settings.word_length,
+            used_words=words,
+            used_letters=self.used_letters,
+        )
+
+    @staticmethod
+    def _get_player(players: list["Player"], player_id: str | None) -> Optional["Player"]:
+        return next((player for player in players if player.id == player_id), None)
 
     def recalculate_host(self, *, save: bool = True) -> None:
         """
@@ -358,22 +587,183 @@ class Game(AbstractModel):
         :return: None
         :raises ValidationError: If the player cannot take a turn.
         """
-        self.can_take_turn(session_key)
-        self._handle_turn(word, save=save)
+        from shiritori.game.hot_state import get_hot_game_store_for
+        from shiritori.game.turn_queue import enqueue_game, enqueue_game_at
+
+        if hot_game_store := get_hot_game_store_for(self.id):
+            state = hot_game_store.take_turn(self.id, session_key, word)
+            enqueue_game_at(self.id, state.next_timer_at(timezone.now()))
+            return
+        with self.player_rows():
+            self.can_take_turn(session_key)
+            self._handle_turn(word, save=save)
+            enqueue_game(self)
+
+    def choose_bot_word(self, difficulty: str = BotDifficulty.MEDIUM) -> str | None:
+        """
+        Choose the word a bot plays for the current turn from the in-memory letter index.
+        :param difficulty: str - The BotDifficulty of the bot.
+        :return: str | None - The word, or None if there is no valid word left.
+        """
+        locale = self.settings.locale
+        letter_index = get_letter_index(locale)
+        is_valid = None
+        if self.dictionary_version_id not in (None, letter_index.index.version):
+
+            def is_valid(word: str) -> bool:
+                return Word.validate(word, locale, self.dictionary_version_id)
+
+        used_words = set(self.gameword_set.exclude(word=None).values_list("word", flat=True))
+        return choose_word(
+            letter_index,
+            self.last_word,
+            self.settings.word_length,
+            used_words,
+            difficulty,
+            used_letters=self.used_letters,
+            duration=self.settings.turn_time - self.turn_time_left,
+            turn_time=self.settings.turn_time,
+            is_valid=is_valid,
+        )
+
+    def bot_turn_at(self, player: "Player") -> Optional[datetime]:
+        """
+        When a bot answers in the current turn, once it has thought for its difficulty's think time.
+        :param player: Player - The current player.
+        :return: datetime | None - When the bot answers, or None if the player is not a bot or the turn has no deadline.
+        """
+        return _bot_turn_at(self.turn_deadline, self.settings.turn_time, player.bot_difficulty)
+
+    def take_bot_turn(self) -> bool:
+        """
+        Take the current turn if it belongs to a bot that has thought for long enough.
+        A bot that finds no word lets its turn time run out like any other player.
+        :return: bool - Whether a turn was taken.
+        """
+        player = self.current_player
+        if self.status != GameStatus.PLAYING or player is None or not player.is_bot:
+            return False
+        if (bot_turn_at := self.bot_turn_at(player)) is not None and timezone.now() < bot_turn_at:
+            return False
+        if (word := self.choose_bot_word(player.bot_difficulty)) is None:
+            return False
+        try:
+            self._handle_turn(word)
+        except ValidationError:
+            return False
+        return True
+
+    def next_timer_at(self) -> Optional[datetime]:
+        """
+        When the current turn next needs its timers run: when a bot answers, or else the turn deadline.
+        :return: datetime | None - The time, or None if the game is not in progress.
+        """
+        if self.status != GameStatus.PLAYING:
+            return None
+        now = timezone.now()
+        if self.turn_deadline is None:
+            return now
+        if (player := self.current_player) and (bot_turn_at := self.bot_turn_at(player)) and bot_turn_at > now:
+            return bot_turn_at
+        return self.turn_deadline
+
+    @staticmethod
+    def run_timers(game_id: str, task_id: str | None) -> Optional[datetime]:
+        """
+        Run whatever is due in a game's current turn: a bot's answer once it has thought for long enough,
+        or the end of the turn once its deadline has passed.
+
+        Checking whether anything is due takes a single query. Only then is the game locked,
+        and it is only acted on while its ``task_id`` still names the caller,
+        so a loop or timer service that lost the game finds nothing to do.
+        Turn queue workers pass None, they only run games that no loop or timer service owns.
+        Hot games go through the same fence before their timers are run from the hot state.
+
+        :param game_id: The id of the game.
+        :param task_id: The id of the turn loop or timer service running the game's timers, None for the turn queue.
+        :return: When the game next needs its timers run, or None if it is finished or no longer run by ``task_id``.
+        """
+        from shiritori.game.events import send_game_timer_updated
+        from shiritori.game.hot_state import get_hot_game_store_for
+
+        if hot_game_store := get_hot_game_store_for(game_id):
+            # Fenced like the database path, the hot state itself only keeps a turn from being applied twice.
+            if not Game.objects.filter(id=game_id, status=GameStatus.PLAYING, task_id=task_id).exists():
+                return None
+            return hot_game_store.run_timers(game_id)
+        # Most ticks have nothing due, so they only read what the fence and the timers need in one query.
+        timers = (
+            Game.objects.filter(id=game_id, status=GameStatus.PLAYING, task_id=task_id)
+            .annotate(
+                current_bot_difficulty=Subquery(
+                    Player.objects.filter(game_id=OuterRef("id"), is_current=True).values("bot_difficulty")[:1]
+                )
+            )
+            .values_list("turn_deadline", "settings__turn_time", "current_bot_difficulty")
+            .first()
+        )
+        if timers is None:
+            return None
+        turn_deadline, turn_time, bot_difficulty = timers
+        now = timezone.now()
+        bot_turn_at = _bot_turn_at(turn_deadline, turn_time, bot_difficulty)
+        if turn_deadline is not None and turn_deadline > now and (bot_turn_at is None or bot_turn_at > now):
+            return bot_turn_at or turn_deadline
+
+        turn_ended = False
+        with transaction.atomic():
+            game = (
+                Game.objects.select_for_update(of=("self",))
+                .select_related("settings")
+                .filter(id=game_id, status=GameStatus.PLAYING, task_id=task_id)
+                .first()
+            )
+            if game is None:
+                return None
+            with game.player_rows():
+                if game.turn_time_left <= 0:
+                    game.end_turn()
+                    turn_ended = True
+                else:
+                    game.take_bot_turn()
+                next_timer_at = game.next_timer_at()
+        if turn_ended:
+            send_game_timer_updated(game.id, game.turn_time_left)
+        return next_timer_at
 
     def _handle_turn(self, word: str | None, *, save: bool = True) -> None:
         """
         Underlying method for taking a turn.
+        The turn is played by ``engine.apply_turn`` on the loaded game, and what it changed is written back.
         :param word: The word the player submitted.
         :param save: bool - Whether to save the game after taking the turn.
         :return: None
         """
-        with transaction.atomic():
-            self.create_word(word)
-            if self.current_turn + 1 > self.max_turns:
+        with transaction.atomic(), self.player_rows():
+            players = self.player_list
+            state = self.to_state(players)
+            now = timezone.now()
+            word = normalize_word(word)
+            # A word that comes in after the turn timed out is recorded, but not checked.
+            current = state.current
+            with engine_rules():
+                if word and engine.turn_time_left(state, now.timestamp()) > 0:
+                    engine.check_word(state, word, self.is_in_dictionary)
+                turn = engine.apply_turn(state, word, now.timestamp())
+            GameWord.objects.create(
+                game=self,
+                player=self._get_player(players, turn.player_id),
+                word=turn.word,
+                score=turn.score,
+                duration=turn.duration,
+            )
+            self.current_turn = state.turn
+            self.current_round = state.round
+            self.last_word = state.last_word
+            if state.status == GameStatus.FINISHED and not self.is_finished:
                 self.finish()
-            self.update_turn()
-            self.calculate_current_player(save=False)
+            if state.current != current:
+                self.current_player = self._get_player(players, state.current)
             self.reset_turn_time()
             if save:
                 self.save(
@@ -381,44 +771,24 @@ class Game(AbstractModel):
                         "current_turn",
                         "current_round",
                         "last_word",
-                        "turn_time_left",
+                        "turn_deadline",
                     ]
                 )
 
-    def create_word(self, word: str) -> GameWord:
+    def is_in_dictionary(self, word: str) -> bool:
         """
-        Create a word for the current turn.
-        :param word: The word the player submitted.
+        Whether a word is in the dictionary version the game started with.
+        :param word: str - The normalized word.
+        :return: bool
         """
-        timed_out = self.turn_time_left <= 0
-        duration = self.settings.turn_time - self.turn_time_left
-        game_word = GameWord.create(
-            game=self,
-            player=self.current_player,
-            word=word,
-            duration=duration,
-            timed_out=timed_out,
-        )
-        if word:
-            self.last_word = game_word.word
-        return game_word
-
-    def update_turn(self):
-        """
-        Update the current turn.
-        This will also update the current round if the current player is the last player.
-        :return: None
-        """
-        self.current_turn += 1
-        if self.current_player == self.last_player:
-            self.current_round += 1
+        return Word.validate(word, self.settings.locale, self.dictionary_version_id)
 
     def reset_turn_time(self):
         """
-        Reset the turn time back to the default turn time.
+        Start a new turn by moving the turn deadline to a full turn time from now.
         :return: None
         """
-        self.turn_time_left = self.settings.turn_time
+        self.turn_deadline = timezone.now() + timedelta(seconds=self.settings.turn_time)
 
     def skip_turn(self):
         """
@@ -429,14 +799,11 @@ class Game(AbstractModel):
 
         :return: None
         """
-        connected_players = self.players.filter(is_connected=True)
-        try:
-            current_player_index = list(connected_players).index(self.current_player)
-        except ValueError as error:
-            raise ValidationError("Current player is not connected.") from error
-        if connected_players.count() >= 2:
-            next_index = (current_player_index + 1) % connected_players.count()
-            self.current_player = connected_players[next_index]
+        players = self.player_list
+        state = self.to_state(players)
+        with engine_rules():
+            engine.skip_turn(state)
+        self.current_player = self._get_player(players, state.current)
 
     def end_turn(self) -> None:
         """
@@ -451,7 +818,7 @@ class Game(AbstractModel):
         self._handle_turn(None)
 
     @staticmethod
-    def run_turn_loop(game_id: str, task_id: str):
+    def run_turn_loop(game_id: str, task_id: str, heartbeat: Callable[[], bool] | None = None):
         """
         Runs the turn loop for a game.
 
@@ -459,18 +826,12 @@ class Game(AbstractModel):
 
         :param game_id: The id of the game to run the turn loop for.
         :param task_id: The id of the task running the turn loop.
+        :param heartbeat: Called every iteration to keep the game's lease, the loop stops once it returns False.
 
         """
-        from shiritori.game.events import send_game_timer_updated
-
-        qs: QuerySet["Game"] = Game.objects.filter(id=game_id)
-        while qs.filter(Q(status=GameStatus.PLAYING) & Q(task_id=task_id)).exists():
-            if qs.filter(turn_time_left__gt=0).exists():
-                qs.update(turn_time_left=F("turn_time_left") - 1)
-                wait()  # sleep for 1.25 seconds to allow for any networking issues
-            else:
-                # if the game timer is 0, end the turn
-                # and start the next turn
-                qs.first().end_turn()
-            if game := qs.values("id", "turn_time_left").first():
-                send_game_timer_updated(game["id"], game["turn_time_left"])
+        while (next_timer_at := Game.run_timers(game_id, task_id)) is not None:
+            if heartbeat is not None and not heartbeat():
+                break
+            # Nothing is written while waiting, clients count down to the deadline themselves.
+            # Waking up at least every interval notices turns taken by players and lost ownership.
+            wait(min(max((next_timer_at - timezone.now()).total_seconds(), 0), TURN_LOOP_INTERVAL))
@@ -0,0 +1,160 @@
+import uuid
+from datetime import timedelta
+from typing import Optional
+
+from django.conf import settings
+from django.db import IntegrityError, models, transaction
+from django.db.models import Case, F, Q, QuerySet, Value, When
+from django.utils import timezone
+
+from shiritori.game.models.text_choices import GameStatus
+
+
+class GameLease(models.Model):
+    """
+    Which turn loop runs a game, for as long as it keeps heartbeating.
+
+    Every time the lease changes hands its ``token`` goes up, and a heartbeat only succeeds for the
+    current owner and token, so a loop that lost its lease finds out on its next heartbeat.
+    The owner is also written to ``Game.task_id``, which ``Game.run_timers`` fences on.
+    """
+
+    game = models.OneToOneField("Game", on_delete=models.CASCADE, primary_key=True, related_name="lease")
+    owner = models.CharField(max_length=255)
+    worker = models.CharField(max_length=255, blank=True, default="")
+    token = models.PositiveBigIntegerField(default=0)
+    acquired_at = models.DateTimeField()
+    heartbeat_at = models.DateTimeField()
+    expires_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        db_table = "game_lease"
+
+    def __str__(self):
+        return f"{self.game_id} by {self.owner} #{self.token}"
+
+    @property
+    def is_expired(self) -> bool:
+        return self.expires_at <= timezone.now()
+
+    @classmethod
+    def acquire(cls, game_id: str, owner: str, worker: str = "") -> Optional["GameLease"]:
+        """
+        Take the lease of a game, unless another owner holds it and keeps heartbeating.
+        :param game_id: str - The id of the game.
+        :param owner: str - The id of the turn loop taking the lease.
+        :param worker: str - The host the turn loop runs on.
+        :return: GameLease | None - The lease, or None if another owner holds it.
+        """
+        from shiritori.game.models.game import Game
+
+        now = timezone.now()
+        try:
+            with transaction.atomic():
+                lease, created = cls.objects.select_for_update().get_or_create(
+                    game_id=game_id,
+                    defaults={"owner": owner, "acquired_at": now, "heartbeat_at": now, "expires_at": now},
+                )
+                if not created and lease.owner != owner and lease.expires_at > now:
+                    return None
+                lease.owner = owner
+                lease.worker = worker
+                lease.token += 1
+                lease.acquired_at = lease.heartbeat_at = now
+                lease.expires_at = now + timedelta(seconds=settings.GAME_LEASE_TTL)
+                lease.save()
+                Game.objects.filter(id=game_id).update(task_id=owner)
+        except IntegrityError:
+            # Another owner created the lease first.
+            return None
+        return lease
+
+    def heartbeat(self) -> bool:
+        """
+        Extend the lease. Only writes once a third of the lease time has passed since the last heartbeat.
+        :return: bool - Whether the lease is still held.
+        """
+        now = timezone.now()
+        if now < self.heartbeat_at + timedelta(seconds=settings.GAME_LEASE_TTL / 3):
+            return True
+        expires_at = now + timedelta(seconds=settings.GAME_LEASE_TTL)
+        held = GameLease.objects.filter(
+            game_id=self.game_id, owner=self.owner, token=self.token, expires_at__gt=now
+        ).update(heartbeat_at=now, expires_at=expires_at)
+        if held:
+            self.heartbeat_at, self.expires_at = now, expires_at
+        return bool(held)
+
+    def release(self) -> None:
+        """
+        Give up the lease so the next owner can take it right away.
+        """
+        from shiritori.game.models.game import Game
+
+        now = timezone.now()
+        GameLease.objects.filter(game_id=self.game_id, owner=self.owner, token=self.token).update(expires_at=now)
+        Game.objects.filter(id=self.game_id, task_id=self.owner).update(task_id=None)
+        self.expires_at = now
+
+    @classmethod
+    def expire(cls, game_id: str) -> None:
+        """
+        End a game's lease without waiting for it to run out, e.g. because the game restarted.
+        :param game_id: str - The id of the game.
+        """
+        cls.objects.filter(game_id=game_id).update(expires_at=timezone.now())
+
+    @staticmethod
+    def get_orphaned_games() -> QuerySet:
+        """
+        Get the games in progress that no turn loop runs: their lease expired, or they never had one
+        and their turn deadline passed ``GAME_LEASE_TTL`` seconds ago.
+        :return: QuerySet[Game] - The games.
+        """
+        from shiritori.game.models.game import Game
+
+        now = timezone.now()
+        return Game.objects.filter(status=GameStatus.PLAYING).filter(
+            Q(lease__expires_at__lte=now)
+            | Q(lease__isnull=True, turn_deadline__lt=now - timedelta(seconds=settings.GAME_LEASE_TTL))
+        )
+
+    @classmethod
+    def reserve_orphaned_games(cls) -> dict[str, str]:
+        """
+        Hand the lease of every orphaned game to a turn loop that is about to be started, before it runs.
+        The lease goes to the id of the loop's task for ``GAME_LEASE_TTL`` seconds, so only that task can acquire it,
+        and the game is only handed out again once that task failed to take it in time.
+        :return: dict[str, str] - The task id to start a turn loop with, for each game reserved by this call.
+        """
+        owners = {game_id: str(uuid.uuid4()) for game_id in cls.get_orphaned_games().values_list("id", flat=True)}
+        if not owners:
+            return {}
+        now = timezone.now()
+        cls.objects.bulk_create(
+            [
+                cls(game_id=game_id, owner=owner, acquired_at=now, heartbeat_at=now, expires_at=now)
+                for game_id, owner in owners.items()
+            ],
+            ignore_conflicts=True,
+        )
+        # Only leases that are still expired are taken, another supervisor or a loop may have got to some first.
+        cls.objects.filter(game_id__in=owners, expires_at__lte=now).update(
+            owner=Case(*(When(game_id=game_id, then=Value(owner)) for game_id, owner in owners.items())),
+            worker="",
+            expires_at=now + timedelta(seconds=settings.GAME_LEASE_TTL),
+        )
+        return dict(cls.objects.filter(game_id__in=owners, owner__in=owners.values()).values_list("game_id", "owner"))
+
+    @staticmethod
+    def get_worker_counts() -> QuerySet:
+        """
+        Count the live leases of every worker, to show how turn loops are spread across them.
+        :return: QuerySet - ``worker`` and ``games`` of each worker with live leases.
+        """
+        return (
+            GameLease.objects.filter(expires_at__gt=timezone.now(), game__status=GameStatus.PLAYING)
+            .values("worker")
+            .annotate(games=models.Count("game"))
+            .order_by(F("games").desc(), "worker")
+        )
@@ -2,12 +2,16 @@ from typing import Optional
 
 from django.core.validators import RegexValidator
 from django.db import models
-from django.db.models import QuerySet
+from django.db.models import F, OuterRef, QuerySet, Subquery, Sum
+from django.db.models.functions import Abs, Coalesce
 
 from shiritori.game.models.game_word import GameWord
-from shiritori.game.models.text_choices import PlayerType
+from shiritori.game.models.text_choices import BotDifficulty, PlayerType
 from shiritori.utils.abstract_model import AbstractModel, NanoIdModel
 
+# How far a total score may drift from the sum of the words' scores, through float rounding, and still match.
+SCORE_TOLERANCE = 1e-6
+
 
 class Player(AbstractModel, NanoIdModel):
     name = models.CharField(
@@ -28,6 +32,11 @@ class Player(AbstractModel, NanoIdModel):
     is_connected = models.BooleanField(default=True)
     session_key = models.CharField(max_length=255, null=True, blank=True)
     order = models.IntegerField(null=True, blank=True)
+    bot_difficulty = models.CharField(max_length=10, choices=BotDifficulty.choices, null=True, blank=True)
+    # The scheduled player_disconnect_task that removes the player, cleared when they reconnect.
+    disconnect_task_id = models.CharField(max_length=255, null=True, blank=True)
+    # The sum of the scores of the player's words, kept up to date as words are saved.
+    total_score = models.FloatField(default=0)
 
     class Meta:
         db_table = "player"
@@ -75,15 +84,60 @@ class Player(AbstractModel, NanoIdModel):
     def __str__(self):
         return self.name
 
+    def save(self, force_insert=False, force_update=False, using=None, update_fields=None):
+        if update_fields is None and not self._state.adding and not force_insert:
+            # A full save of a player loaded earlier must not roll back the scores added by atomic updates.
+            update_fields = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != "total_score"
+            ]
+        super().save(force_insert, force_update, using, update_fields)
+
     @property
     def score(self):
-        result = self.gameword_set.aggregate(models.Sum("score")).get("score__sum") or 0
-        return int(round(result, 0))
+        return int(round(self.total_score, 0))
+
+    @property
+    def is_bot(self) -> bool:
+        # Bots keep their difficulty when they win, so it outlives PlayerType.BOT.
+        return self.bot_difficulty is not None
 
     @property
     def words(self) -> "QuerySet[GameWord]":
         return self.gameword_set.all()
 
+    def add_score(self, score: float) -> None:
+        """
+        Add to the player's total score in the database, without overwriting a concurrent addition.
+        :param score: float - The score of a word.
+        """
+        Player.objects.filter(id=self.id).update(total_score=F("total_score") + score)
+        self.total_score += score
+
+    def recompute_total_score(self) -> None:
+        """
+        Recompute the player's total score from the scores of their words.
+        """
+        word_scores = (
+            GameWord.objects.filter(player=OuterRef("pk")).values("player").annotate(total=Sum("score")).values("total")
+        )
+        Player.objects.filter(id=self.id).update(total_score=Coalesce(Subquery(word_scores), 0.0))
+        self.refresh_from_db(fields=["total_score"])
+
+    @classmethod
+    def get_score_mismatches(cls) -> "QuerySet[Player]":
+        """
+        Get the players whose total score differs from the sum of the scores of their words.
+        :return: QuerySet[Player] - The players, annotated with ``word_score``, the sum of their words' scores.
+        """
+        return (
+            cls.objects.annotate(word_score=Coalesce(Sum("gameword__score"), 0.0))
+            .annotate(drift=Abs(F("total_score") - F("word_score")))
+            .filter(drift__gt=SCORE_TOLERANCE)
+            .order_by("created_at")
+        )
+
     @classmethod
     def get_by_session_key(cls, game_id: str, session_key: str) -> Optional["Player"]:
         """
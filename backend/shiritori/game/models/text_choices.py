@@ -16,3 +16,9 @@ class PlayerType(models.TextChoices):
     BOT = "BOT", "bot"
     SPECTATOR = "SPECTATOR", "spectator"
     WINNER = "WINNER", "winner"
+
+
+class BotDifficulty(models.TextChoices):
+    EASY = "EASY", "Easy"
+    MEDIUM = "MEDIUM", "Medium"
+    HARD = "HARD", "Hard"
@@ -1,13 +1,69 @@
+import dataclasses
+from collections.abc import Callable, Iterator
+
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Min, Q, QuerySet
+
+from shiritori.game.dictionary import (
+    build_dictionary_artifact,
+    get_bloom_filter,
+    get_dictionary_index,
+    get_letter_index,
+    invalidate_dictionary_index,
+)
+from shiritori.game.dictionary.loader import insert_staged_words, remove_unstaged_words, stage_words
+from shiritori.game.fields import NormalizedWordField
+from shiritori.game.models.dictionary_version import DictionaryVersion
+from shiritori.game.models.text_choices import GameLocales, GameStatus
+from shiritori.game.utils import normalize_word
+
+# How many words are read between two progress reports while loading a dictionary.
+LOAD_PROGRESS_INTERVAL = 50_000
+
 
-from shiritori.game.models.text_choices import GameLocales
-from shiritori.game.utils import chunk_list
+@dataclasses.dataclass
+class DictionaryLoadResult:
+    locale: str
+    version: int | None = None
+    unchanged: bool = False
+    read: int = 0
+    created: int = 0
+    removed: int = 0
 
 
 class Word(models.Model):
-    word = models.CharField(max_length=255)
+    word = NormalizedWordField(max_length=255)
     locale = models.CharField(max_length=10, choices=GameLocales.choices, default=GameLocales.EN)
+    added_in = models.ForeignKey(
+        "DictionaryVersion",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="added_words",
+    )
+    removed_in = models.ForeignKey(
+        "DictionaryVersion",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="removed_words",
+    )
+    # The versions a restored word was last missing from, from the one that removed it up to the one restoring it.
+    previously_removed_in = models.ForeignKey(
+        "DictionaryVersion",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+    restored_in = models.ForeignKey(
+        "DictionaryVersion",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="restored_words",
+    )
 
     class Meta:
         db_table = "word"
@@ -24,23 +80,128 @@ class Word(models.Model):
         return f"{self.word} ({self.locale})"
 
     @classmethod
-    def validate(cls, word: str, locale: GameLocales | str = GameLocales.EN) -> bool:
-        """Validate that the word is in the dictionary for the given locale."""
-        return cls.objects.filter(word__iexact=word, locale=locale).exists()
+    def get_words(cls, locale: GameLocales | str, version: int | None = None) -> "QuerySet[Word]":
+        """
+        Get the words of a locale's dictionary.
+        :param locale: GameLocales | str - The locale of the dictionary.
+        :param version: int | None - The dictionary version to look at, defaults to the latest one.
+        :return: QuerySet[Word] - The words in that version of the dictionary.
+        """
+        qs = cls.objects.filter(locale=locale)
+        if version is None:
+            return qs.filter(removed_in__isnull=True)
+        return qs.filter(
+            Q(added_in__isnull=True) | Q(added_in__lte=version),
+            Q(removed_in__isnull=True) | Q(removed_in__gt=version),
+        ).exclude(previously_removed_in__lte=version, restored_in__gt=version)
+
+    @staticmethod
+    def get_current_version(locale: GameLocales | str) -> int | None:
+        """
+        Get the id of the latest version of a locale's dictionary.
+        :param locale: GameLocales | str - The locale of the dictionary.
+        :return: int | None - The version id, or None if the dictionary was never loaded.
+        """
+        return DictionaryVersion.objects.filter(locale=locale).values_list("id", flat=True).first()
+
+    @classmethod
+    def validate(cls, word: str, locale: GameLocales | str = GameLocales.EN, version: int | None = None) -> bool:
+        """
+        Validate that the word is in the dictionary for the given locale.
+        Lookups against the latest version go through the in-memory index,
+        games still on an older version are checked against the word table.
+        """
+        index = get_dictionary_index(locale) if settings.DICTIONARY_INDEX_ENABLED else None
+        is_current = version is None or (index is not None and version == index.version)
+        bloom_filter = get_bloom_filter(locale) if is_current and settings.DICTIONARY_BLOOM_FILTER_ENABLED else None
+        if bloom_filter and not bloom_filter.might_contain(word):
+            return False
+        if is_current and index is not None:
+            exists = word in index
+        else:
+            exists = cls.get_words(locale, None if is_current else version).filter(word=word).exists()
+        if bloom_filter and not exists:
+            bloom_filter.record_false_positive()
+        return exists
 
     @staticmethod
-    def load_dictionary(locale: GameLocales | str = GameLocales.EN) -> list["Word"]:
-        """Load the dictionary for the given locale."""
+    def read_dictionary(
+        locale: GameLocales | str, result: DictionaryLoadResult, progress: Callable[[int], None] | None = None
+    ) -> Iterator[str]:
+        """
+        Lazily read the normalized words of a locale's dictionary file.
+        :param locale: GameLocales | str - The locale of the dictionary.
+        :param result: DictionaryLoadResult - Counts the words read.
+        :param progress: Callable[[int], None] | None - Called with the number of words read so far.
+        :return: Iterator[str] - The words.
+        """
         with open(f"{settings.BASE_DIR}/dictionaries/{locale}.txt", encoding="utf-8") as f:
-            words = f.read().splitlines()
-        created_words = []
-        # Batch insert the words into the database in chunks of 1000
-        for chunk in chunk_list(words, 1000):
-            created_words.extend(
-                Word.objects.bulk_create(
-                    [Word(word=word, locale=locale) for word in chunk],
-                    batch_size=1000,
-                    ignore_conflicts=True,
-                )
-            )
-        return created_words
+            for line in f:
+                if word := normalize_word(line.strip()):
+                    result.read += 1
+                    if progress and result.read % LOAD_PROGRESS_INTERVAL == 0:
+                        progress(result.read)
+                    yield word
+        if progress:
+            progress(result.read)
+
+    @staticmethod
+    def load_dictionary(
+        locale: GameLocales | str = GameLocales.EN, *, progress: Callable[[int], None] | None = None
+    ) -> DictionaryLoadResult:
+        """
+        Load the dictionary for the given locale as a new dictionary version.
+
+        A file whose hash matches the latest version is skipped. Otherwise the file is streamed into
+        a staging table (with COPY on PostgreSQL) and diffed against the word table: new words are inserted
+        and missing ones are marked as removed, so games started on an older version keep validating against it.
+        Removed words are deleted once no unfinished game is pinned to a version that still has them.
+        :param locale: GameLocales | str - The locale of the dictionary.
+        :param progress: Callable[[int], None] | None - Called with the number of words read so far.
+        :return: DictionaryLoadResult - The version and how many words were read, added and removed.
+        """
+        result = DictionaryLoadResult(locale=locale)
+        content_hash = DictionaryVersion.hash_dictionary_file(locale)
+        current = DictionaryVersion.get_current(locale)
+        if current and current.content_hash == content_hash:
+            result.version = current.id
+            result.unchanged = True
+            return result
+        with transaction.atomic():
+            version = DictionaryVersion.objects.create(locale=locale, content_hash=content_hash)
+            stage_words(Word.read_dictionary(locale, result, progress))
+            result.created = insert_staged_words(locale, version.id)
+            result.removed = remove_unstaged_words(locale, version.id)
+            version.added_count = result.created
+            version.removed_count = result.removed
+            version.word_count = Word.get_words(locale).count()
+            version.save(update_fields=["added_count", "removed_count", "word_count"])
+        result.version = version.id
+        Word.prune_removed_words(locale)
+        if settings.DICTIONARY_INDEX_DIR:
+            build_dictionary_artifact(locale)
+        invalidate_dictionary_index(locale)
+        get_letter_index(locale)
+        if settings.DICTIONARY_BLOOM_FILTER_ENABLED:
+            get_bloom_filter(locale)
+        return result
+
+    @staticmethod
+    def prune_removed_words(locale: GameLocales | str) -> int:
+        """
+        Delete removed words that no unfinished game can still see.
+        :param locale: GameLocales | str - The locale of the dictionary.
+        :return: int - The number of words deleted.
+        """
+        from shiritori.game.models.game import Game
+
+        oldest_pinned = (
+            Game.objects.exclude(status=GameStatus.FINISHED)
+            .filter(dictionary_version__locale=locale)
+            .aggregate(oldest=Min("dictionary_version"))["oldest"]
+        )
+        removed = Word.objects.filter(locale=locale, removed_in__isnull=False)
+        if oldest_pinned is not None:
+            removed = removed.filter(removed_in__lte=oldest_pinned)
+        deleted, _ = removed.delete()
+        return deleted
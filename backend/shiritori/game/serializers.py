@@ -1,7 +1,9 @@
+from collections.abc import Collection
+
 from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 
-from shiritori.game.models import Game, GameSettings, GameWord, Player
+from shiritori.game.models import BotDifficulty, Game, GameSettings, GameWord, Player
 
 __all__ = (
     "EmptySerializer",
@@ -9,6 +11,7 @@ __all__ = (
     "ShiritoriGameSettingsSerializer",
     "ShiritoriPlayerSerializer",
     "JoinGameSerializer",
+    "AddBotSerializer",
     "ShiritoriGameSerializer",
     "ShiritoriTurnSerializer",
     "CreateStartGameSerializer",
@@ -75,6 +78,10 @@ class JoinGameSerializer(serializers.ModelSerializer):
         fields = ("name",)
 
 
+class AddBotSerializer(serializers.Serializer):
+    difficulty = serializers.ChoiceField(choices=BotDifficulty.choices, default=BotDifficulty.MEDIUM)
+
+
 class ShiritoriGameSerializer(serializers.ModelSerializer):
     settings = ShiritoriGameSettingsSerializer()
     words = ShiritoriGameWordSerializer(many=True, read_only=True)
@@ -86,10 +93,21 @@ class ShiritoriGameSerializer(serializers.ModelSerializer):
     max_turns = serializers.IntegerField(read_only=True)
     player_count = serializers.IntegerField(read_only=True)
     word_count = serializers.IntegerField(read_only=True)
+    turn_time_left = serializers.FloatField(read_only=True)
 
     class Meta:
         model = Game
-        exclude = ("task_id",)
+        exclude = ("task_id", "dictionary_version", "used_last_letters")
+        read_only_fields = ("revision",)
+
+    def __init__(self, *args, fields: Collection[str] | None = None, **kwargs):
+        """
+        :param fields: Collection[str] | None - The only fields to serialize, all of them if None.
+        """
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
 
     def create(self, validated_data):  # noqa
         settings = validated_data.pop("settings")
@@ -1,7 +1,11 @@
+from collections.abc import Callable, Hashable
+
+from django.db import transaction
 from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 from shiritori.game.events import (
+    get_game_update_fields,
     send_game_updated,
     send_player_joined,
     send_player_left,
@@ -11,18 +15,89 @@ from shiritori.game.events import (
 from shiritori.game.models import Game, GameWord, Player
 
 
+class EventBatch:
+    """
+    The events of one transaction or savepoint, sent once the transaction commits. An event queued again for the same
+    key replaces the earlier one and moves to the end, so a game saved several times in a turn is serialized and sent
+    once, after the events it follows from.
+    """
+
+    def __init__(self):
+        self.events: dict[Hashable, Callable[[], None]] = {}
+
+    def add(self, key: Hashable, send: Callable[[], None]) -> None:
+        previous = self.events.pop(key, None)
+        if isinstance(previous, GameChanges) and isinstance(send, GameChanges):
+            send = previous.merge(send)
+        self.events[key] = send
+
+    def flush(self) -> None:
+        for send in self.events.values():
+            send()
+
+
+def queue_event(key: Hashable, send: Callable[[], None]) -> None:
+    """
+    Send an event once the current transaction commits, or right away outside of one.
+    Each savepoint queues its events in a batch of its own, which Django drops along with its on_commit callback
+    when the savepoint rolls back, so events of a transaction or savepoint that rolls back are never sent.
+    :param key: Hashable - What the event is about, only the last event queued for a key in a batch is sent.
+    :param send: Callable[[], None] - Serializes and sends the event.
+    """
+    connection = transaction.get_connection()
+    active = set(connection.savepoint_ids)
+    # The batches that commit or roll back along with the current savepoint: those of released savepoints inside it
+    # are still registered with the ids of the savepoints they were queued in.
+    batches = [
+        callback.__self__
+        for savepoint_ids, callback, _ in connection.run_on_commit
+        if isinstance(getattr(callback, "__self__", None), EventBatch) and active <= savepoint_ids
+    ]
+    if not batches:
+        batch = EventBatch()
+        batch.add(key, send)
+        transaction.on_commit(batch.flush)
+        return
+    batch = batches[-1]
+    for other in batches[:-1]:
+        if (previous := other.events.pop(key, None)) is not None:
+            batch.add(key, previous)
+    batch.add(key, send)
+
+
+class GameChanges:
+    """
+    A game_updated event with the model fields changed by one or more saves of a game, None when the whole game is sent.
+    """
+
+    def __init__(self, game: Game, fields: set[str] | None):
+        self.game = game
+        self.fields = fields
+
+    def merge(self, later: "GameChanges") -> "GameChanges":
+        if self.fields is None or later.fields is None:
+            return GameChanges(later.game, None)
+        return GameChanges(later.game, self.fields | later.fields)
+
+    def __call__(self) -> None:
+        send_game_updated(self.game, None if self.fields is None else get_game_update_fields(self.fields))
+
+
 @receiver(post_save, sender=Game)
-def game_post_save(sender, instance: Game, created, **kwargs):
-    send_game_updated(instance)
+def game_post_save(sender, instance: Game, created, update_fields=None, **kwargs):
+    # A new status, e.g. a start, finish or restart, changes too much of the game to send only what changed.
+    fields = None if created or update_fields is None or "status" in update_fields else set(update_fields)
+    queue_event((instance.id, "game_updated"), GameChanges(instance, fields))
 
 
 @receiver(post_save, sender=Player)
 def player_post_save(sender, instance: Player, created, **kwargs):
+    game_id = instance.game.id
     if created:
-        send_player_joined(instance.game.id, instance)
+        queue_event((game_id, "player_joined", instance.id), lambda: send_player_joined(game_id, instance))
         return
     else:
-        send_player_updated(instance.game.id, instance)
+        queue_event((game_id, "player_updated", instance.id), lambda: send_player_updated(game_id, instance))
 
 
 @receiver(post_delete, sender=Player)
@@ -34,10 +109,12 @@ def player_post_delete(sender, instance: Player, **kwargs):
     if instance.is_host:
         instance.game.recalculate_host()
 
-    send_player_left(instance.game.id, instance.id)
+    game_id, player_id = instance.game.id, instance.id
+    queue_event((game_id, "player_left", player_id), lambda: send_player_left(game_id, player_id))
 
 
 @receiver(post_save, sender=GameWord)
 def game_word_post_save(sender, instance: GameWord, created, **kwargs):
     if created:
-        send_turn_taken(instance.game.id, instance)
+        game_id = instance.game.id
+        queue_event((game_id, "turn_taken", instance.id), lambda: send_turn_taken(game_id, instance))
@@ -0,0 +1,229 @@
+"""
+Bot-vs-bot games played with the real rules and a real dictionary, without the database or channels,
+to size infrastructure and check scoring changes before shipping them.
+"""
+
+import dataclasses
+import random
+import statistics
+import time
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from shiritori.game import engine, utils
+from shiritori.game.bot import BOT_THINK_TIME, choose_word
+from shiritori.game.dictionary import DictionaryIndex, LetterIndex
+from shiritori.game.models.text_choices import GameStatus
+
+__all__ = (
+    "SimulationSettings",
+    "GameResult",
+    "SimulationReport",
+    "load_letter_index",
+    "simulate_game",
+    "run_simulation",
+    "describe",
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class SimulationSettings:
+    """
+    What to simulate. ``duration_modifiers`` and ``missed_word_penalty`` replace the scoring rules
+    of ``shiritori.game.utils`` in the simulating processes when set.
+    """
+
+    dictionary: str
+    difficulties: tuple[str, ...]
+    turn_time: int = 60
+    max_turns: int = 10
+    word_length: int = 3
+    seed: int | None = None
+    duration_modifiers: dict[int, float] | None = None
+    missed_word_penalty: float | None = None
+
+
+@dataclasses.dataclass
+class GameResult:
+    turns: int
+    words: int
+    dead_ends: int
+    game_time: float
+    elapsed: float
+    scores: list[tuple[str, float]]
+    winner: str
+
+
+@dataclasses.dataclass
+class SimulationReport:
+    games: int
+    turns: int
+    elapsed: float
+    game_turns: list[int]
+    game_times: list[float]
+    dead_ends: int
+    dead_end_games: int
+    scores: dict[str, list[float]]
+    wins: dict[str, int]
+
+    @property
+    def turns_per_second(self) -> float:
+        return self.turns / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def dead_end_rate(self) -> float:
+        """The share of turns in which the bot found no word."""
+        return self.dead_ends / self.turns if self.turns else 0.0
+
+    @classmethod
+    def from_results(cls, results: Sequence[GameResult], elapsed: float) -> "SimulationReport":
+        scores: dict[str, list[float]] = {}
+        wins: dict[str, int] = {}
+        for result in results:
+            for difficulty, score in result.scores:
+                scores.setdefault(difficulty, []).append(score)
+            wins[result.winner] = wins.get(result.winner, 0) + 1
+        return cls(
+            games=len(results),
+            turns=sum(result.turns for result in results),
+            elapsed=elapsed,
+            game_turns=[result.turns for result in results],
+            game_times=[result.game_time for result in results],
+            dead_ends=sum(result.dead_ends for result in results),
+            dead_end_games=sum(1 for result in results if result.dead_ends),
+            scores=scores,
+            wins=wins,
+        )
+
+
+_letter_indexes: dict[str, LetterIndex] = {}
+
+
+def load_letter_index(path: str) -> LetterIndex:
+    """
+    Load a dictionary from a prebuilt ``.idx`` file or a word list with one word per line, once per process.
+    :param path: str - The path of the dictionary.
+    :return: LetterIndex - The letter index of the dictionary.
+    """
+    if (letter_index := _letter_indexes.get(path)) is None:
+        if Path(path).suffix == ".idx":
+            index = DictionaryIndex.open(path)
+        else:
+            with open(path, encoding="utf-8") as f:
+                index = DictionaryIndex.from_words(word for line in f if (word := line.strip()))
+        letter_index = _letter_indexes[path] = LetterIndex.from_dictionary_index(index)
+    return letter_index
+
+
+def simulate_game(letter_index: LetterIndex, settings: SimulationSettings, rng: random.Random) -> GameResult:
+    """
+    Play a game between bots of the given difficulties. A bot answers once it has thought for its think time,
+    and a bot that finds no word lets its turn time run out.
+    :param letter_index: LetterIndex - The dictionary to play with.
+    :param settings: SimulationSettings - What to simulate.
+    :param rng: random.Random - The random number generator of the game.
+    :return: GameResult - The result of the game.
+    """
+    difficulties = {str(index): difficulty for index, difficulty in enumerate(settings.difficulties)}
+    state = engine.GameState(
+        players=[
+            engine.PlayerState(id=player_id, bot_difficulty=difficulty)
+            for player_id, difficulty in difficulties.items()
+        ],
+        turn_time=settings.turn_time,
+        max_turns=settings.max_turns * len(difficulties),
+        word_length=settings.word_length,
+        last_word=rng.choice(letter_index.alphabet),
+    )
+    engine.shuffle_order(state, rng)
+    now = 0.0
+    engine.start(state, now)
+    words = dead_ends = 0
+    started_at = time.perf_counter()
+    while state.status == GameStatus.PLAYING:
+        difficulty = difficulties[state.current]
+        think_time = min(BOT_THINK_TIME.get(difficulty, 0), state.turn_time // 2)
+        word = choose_word(
+            letter_index,
+            state.last_word,
+            state.word_length,
+            state.used_words,
+            difficulty,
+            used_letters=state.used_letters,
+            duration=think_time,
+            turn_time=state.turn_time,
+            rng=rng,
+        )
+        if word is None:
+            now = state.deadline
+            engine.end_turn(state, now)
+            dead_ends += 1
+        else:
+            now += think_time
+            engine.take_turn(state, state.current, word, now)
+            words += 1
+    return GameResult(
+        turns=state.turn,
+        words=words,
+        dead_ends=dead_ends,
+        game_time=now,
+        elapsed=time.perf_counter() - started_at,
+        scores=[(difficulties[player.id], player.score) for player in state.players],
+        winner=difficulties[engine.winner(state)],
+    )
+
+
+def _simulate_games(settings: SimulationSettings, seeds: Sequence[int]) -> list[GameResult]:
+    # The scoring rules are swapped for the games only, and put back after.
+    scoring = utils.DURATION_MODIFIERS, utils.MISSED_WORD_PENALTY
+    if settings.duration_modifiers is not None:
+        utils.DURATION_MODIFIERS = dict(sorted(settings.duration_modifiers.items()))
+    if settings.missed_word_penalty is not None:
+        utils.MISSED_WORD_PENALTY = settings.missed_word_penalty
+    try:
+        letter_index = load_letter_index(settings.dictionary)
+        return [simulate_game(letter_index, settings, random.Random(seed)) for seed in seeds]
+    finally:
+        utils.DURATION_MODIFIERS, utils.MISSED_WORD_PENALTY = scoring
+
+
+def run_simulation(settings: SimulationSettings, games: int, processes: int = 0) -> SimulationReport:
+    """
+    Play games in a pool of processes and collect their results.
+    :param settings: SimulationSettings - What to simulate.
+    :param games: int - The number of games.
+    :param processes: int - The number of processes, 0 to play in this process.
+    :return: SimulationReport - The aggregated results.
+    """
+    first_seed = random.Random(settings.seed).getrandbits(64)
+    seeds = [first_seed + game for game in range(games)]
+    # Loaded before the pool forks, so the workers share it instead of each parsing the dictionary.
+    load_letter_index(settings.dictionary)
+    started_at = time.perf_counter()
+    if processes:
+        batches = [seeds[start::processes] for start in range(processes)]
+        with ProcessPoolExecutor(processes) as pool:
+            results = [
+                result for batch in pool.map(_simulate_games, [settings] * processes, batches) for result in batch
+            ]
+    else:
+        results = _simulate_games(settings, seeds)
+    return SimulationReport.from_results(results, time.perf_counter() - started_at)
+
+
+def describe(values: Sequence[float]) -> str:
+    """
+    Summarize a distribution as its mean, standard deviation and percentiles.
+    :param values: Sequence[float] - The values.
+    :return: str - The summary.
+    """
+    if not values:
+        return "-"
+    if len(values) == 1:
+        return f"{values[0]:.1f}"
+    p10, p50, p90 = (statistics.quantiles(values, n=10)[index] for index in (0, 4, 8))
+    return (
+        f"mean {statistics.fmean(values):.1f} sd {statistics.stdev(values):.1f} "
+        f"min {min(values):.1f} p10 {p10:.1f} p50 {p50:.1f} p90 {p90:.1f} max {max(values):.1f}"
+    )
@@ -1,22 +1,38 @@
-import time
+import uuid
 
-from celery import Task, shared_task
+from celery import Task, current_app, shared_task
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.db import OperationalError
-from django.db.models import Q
 
 from shiritori.game.events import (
     send_game_start_countdown,
     send_game_start_countdown_end,
     send_game_start_countdown_start,
 )
-from shiritori.game.models import Game, GameStatus, Player, Word
+from shiritori.game.hot_state import get_hot_game_store
+from shiritori.game.models import Game, GameLease, GameStatus, Player, Word
+from shiritori.game.turn_queue import enqueue_game
 from shiritori.game.utils import mock_stream_closer
 
-__all__ = ("game_worker_task", "load_dictionary_task", "player_disconnect_task", "start_game_task")
+__all__ = (
+    "game_worker_task",
+    "supervise_game_leases_task",
+    "load_dictionary_task",
+    "player_disconnect_task",
+    "schedule_player_disconnect",
+    "cancel_player_disconnect",
+    "start_game_task",
+    "start_game_countdown_task",
+    "flush_hot_games_task",
+    "flush_hot_game_task",
+)
 
 TASK_TIME_LIMIT = 60 * 60 * 24  # 24 hours
+START_COUNTDOWN = 3
+START_COUNTDOWN_INTERVAL = 1.25  # seconds
+# How long (in seconds) a disconnected player has to reconnect before they are removed from the game.
+PLAYER_DISCONNECT_GRACE_PERIOD = 5 if settings.DEBUG else 60
 
 
 @shared_task(
@@ -27,50 +43,115 @@ TASK_TIME_LIMIT = 60 * 60 * 24  # 24 hours
 )
 def game_worker_task(self: Task, game_id):
     mock_stream_closer()
-    Game.objects.filter(~Q(task_id=self.request.id), id=game_id).update(task_id=self.request.id)
+    lease = GameLease.acquire(game_id, self.request.id, worker=self.request.hostname or "")
+    if lease is None:
+        # Another turn loop runs the game and keeps its lease.
+        return
     try:
-        Game.run_turn_loop(game_id, self.request.id)
-        Game.objects.filter(id=game_id, task_id=self.request.id).update(task_id=None)
+        Game.run_turn_loop(game_id, self.request.id, heartbeat=lease.heartbeat)
+        lease.release()
     except ValidationError:
-        pass
+        lease.release()
     except OperationalError:
         self.retry(countdown=5)
 
 
-@shared_task(
-    time_limit=TASK_TIME_LIMIT,
-    soft_time_limit=TASK_TIME_LIMIT,
-    ignore_result=True,
-)
-def load_dictionary_task(locale: str = "en"):
-    words = Word.load_dictionary(locale)
-    return {"status": "success", "word_count": len(words), "locale": locale}
+@shared_task(ignore_result=True, query_budget=4)
+def supervise_game_leases_task():
+    """
+    Restart the turn loops of games whose lease ran out, e.g. because their worker was killed.
+    Runs every ``GAME_LEASE_SUPERVISOR_INTERVAL`` seconds from celery beat. Each game is reserved for the loop
+    started for it, so it is not enqueued again on every run while the workers are busy.
+    """
+    if settings.TURN_QUEUE_ENABLED or settings.TURN_TIMER_SERVICE_ENABLED:
+        return
+    for game_id, task_id in GameLease.reserve_orphaned_games().items():
+        game_worker_task.apply_async((game_id,), task_id=task_id)
 
 
 @shared_task(
     time_limit=TASK_TIME_LIMIT,
     soft_time_limit=TASK_TIME_LIMIT,
     ignore_result=True,
+    bind=True,
 )
-def player_disconnect_task(player_id: str):
-    time.sleep(5 if settings.DEBUG else 60)
-    if player := Player.objects.filter(id=player_id, is_connected=False).first():
+def load_dictionary_task(self: Task, locale: str = "en"):
+    def report_progress(read: int):
+        if self.request.id:
+            self.update_state(state="PROGRESS", meta={"locale": locale, "read": read})
+
+    result = Word.load_dictionary(locale, progress=report_progress)
+    return {"status": "success", "word_count": result.created, "read": result.read, "locale": locale}
+
+
+@shared_task(ignore_result=True, bind=True, query_budget=15)
+def player_disconnect_task(self: Task, player_id: str):
+    # Only the latest disconnect of a player that has not reconnected removes them.
+    if player := Player.objects.filter(id=player_id, is_connected=False, disconnect_task_id=self.request.id).first():
         player.delete()
 
 
-@shared_task(
-    time_limit=TASK_TIME_LIMIT,
-    soft_time_limit=TASK_TIME_LIMIT,
-    ignore_result=True,
-)
+def schedule_player_disconnect(player_id: str) -> str:
+    """
+    Remove a disconnected player once the grace period ends, unless they reconnect before then.
+    The removal waits in the broker as a countdown task, so no worker is busy in the meantime.
+    :param player_id: str - The id of the player.
+    :return: str - The id of the scheduled task.
+    """
+    task_id = str(uuid.uuid4())
+    Player.objects.filter(id=player_id).update(disconnect_task_id=task_id)
+    player_disconnect_task.apply_async((player_id,), countdown=PLAYER_DISCONNECT_GRACE_PERIOD, task_id=task_id)
+    return task_id
+
+
+def cancel_player_disconnect(player: Player) -> None:
+    """
+    Cancel the removal of a player that reconnected. The player has to be saved afterwards.
+    :param player: Player - The player.
+    """
+    if player.disconnect_task_id:
+        current_app.control.revoke(player.disconnect_task_id)
+        player.disconnect_task_id = None
+
+
+@shared_task(ignore_result=True, query_budget=2)
 def start_game_task(game_id: str):
+    if not Game.objects.filter(id=game_id, status=GameStatus.WAITING).exists():
+        return
+    send_game_start_countdown_start(game_id)
+    start_game_countdown_task.delay(game_id, START_COUNTDOWN)
+
+
+@shared_task(ignore_result=True, query_budget=30)
+def start_game_countdown_task(game_id: str, timer: int):
+    # Each step of the countdown is its own task, scheduled one interval after the last.
     game = Game.objects.filter(id=game_id, status=GameStatus.WAITING).first()
     if not game:
         return
-    send_game_start_countdown_start(game_id)
-    for timer in range(3, 0, -1):
+    if timer > 0:
         send_game_start_countdown(game_id, timer)
-        time.sleep(1.25)
+        start_game_countdown_task.apply_async((game_id, timer - 1), countdown=START_COUNTDOWN_INTERVAL)
+        return
     send_game_start_countdown_end(game_id)
     game.start()
-    game_worker_task.delay(game_id)
+    if settings.HOT_STATE_ENABLED:
+        get_hot_game_store().load(game)
+    if settings.TURN_QUEUE_ENABLED:
+        enqueue_game(game)
+    elif not settings.TURN_TIMER_SERVICE_ENABLED:
+        game_worker_task.delay(game_id)
+
+
+@shared_task(ignore_result=True)
+def flush_hot_games_task():
+    # Runs every HOT_STATE_FLUSH_INTERVAL seconds from celery beat.
+    if not settings.HOT_STATE_ENABLED:
+        return
+    store = get_hot_game_store()
+    for game_id in store.backend.game_ids():
+        store.flush(game_id)
+
+
+@shared_task(ignore_result=True, query_budget=20)
+def flush_hot_game_task(game_id: str):
+    get_hot_game_store().flush(game_id)
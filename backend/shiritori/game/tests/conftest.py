@@ -8,6 +8,7 @@ from pytest_mock import MockerFixture
 from rest_framework.test import APIClient
 
 from shiritori.game.consumers import GameConsumer, GameLobbyConsumer
+from shiritori.game.dictionary import clear_dictionary_indexes
 from shiritori.game.models import Game, GameSettings, GameStatus
 from shiritori.game.tests.factories import GameFactory, PlayerFactory, WordFactory
 
@@ -98,11 +99,18 @@ def mute_signals():
     post_delete.receivers = []
 
 
+@pytest.fixture(autouse=True)
+def clear_dictionaries():
+    clear_dictionary_indexes()
+    yield
+    clear_dictionary_indexes()
+
+
 @pytest.fixture(autouse=True)
 def mock_shuffle(request: pytest.FixtureRequest, mocker: MockerFixture):
     ignore = request.node.get_closest_marker("real_shuffle")
     if ignore is None:
-        mocker.patch("shiritori.game.models.game.random.shuffle")
+        mocker.patch("shiritori.game.engine.random.shuffle")
     else:
         import random
 
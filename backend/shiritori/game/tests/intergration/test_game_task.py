@@ -1,18 +1,123 @@
+from datetime import timedelta
 from unittest.mock import MagicMock
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 
-from shiritori.game.models import Game
+from shiritori.game import tasks
+from shiritori.game.models import BotDifficulty, Game, GameStatus, Player, PlayerType
+from shiritori.game.utils import TURN_LOOP_INTERVAL
+
+
+@pytest.fixture
+def clock(mocker):
+    """
+    Freeze the time the turn loop sees, and make its waits move it forward instead of sleeping.
+    """
+    now = [timezone.now()]
+    mocker.patch("shiritori.game.models.game.timezone.now", side_effect=lambda: now[0])
+
+    def wait(seconds):
+        now[0] += timedelta(seconds=seconds)
+
+    return mocker.patch("shiritori.game.models.game.wait", side_effect=wait)
 
 
 @pytest.mark.django_db
-def test_game_turn_loop(mocker, started_game, sample_words):
+def test_game_turn_loop(mocker, clock: MagicMock, started_game, sample_words):
     game: Game = started_game
     game.task_id = "test_task_id"
+    game.turn_time_left = game.settings.turn_time
     game.save(force_update=True)
-    sleep_mock: MagicMock = mocker.patch("shiritori.game.models.game.wait", return_value=None)
+    mocker.patch("shiritori.game.events.send_game_timer_updated", return_value=None)
+    with CaptureQueriesContext(connection) as queries:
+        game.run_turn_loop(game_id=game.id, task_id="test_task_id")
+    game.refresh_from_db()
+    assert game.is_finished
+    turns = game.word_count
+    assert turns == game.max_turns + 1
+    assert not game.words.exclude(word=None).exists()
+    # every turn ran for its full turn time, in waits of at most one loop interval
+    waited = [call.args[0] for call in clock.call_args_list]
+    assert sum(waited) == pytest.approx(game.settings.turn_time * turns)
+    assert max(waited) <= TURN_LOOP_INTERVAL
+    # the game row is only written when a turn ends, never while waiting
+    game_updates = [query for query in queries if query["sql"].startswith('UPDATE "game"')]
+    assert len(game_updates) <= 2 * turns
+    assert len(waited) > len(game_updates)
+
+
+@pytest.mark.django_db
+def test_game_turn_loop_plays_bot_turns(mocker, clock, started_game, sample_words):
+    game: Game = started_game
+    game.task_id = "test_task_id"
+    game.save(force_update=True)
+    game.settings.word_length = 3
+    game.settings.save()
+    game.players.update(type=PlayerType.BOT, bot_difficulty=BotDifficulty.HARD)
     mocker.patch("shiritori.game.events.send_game_timer_updated", return_value=None)
     game.run_turn_loop(game_id=game.id, task_id="test_task_id")
-    game.is_finished = False
-    game.save(update_fields=["status"])
-    assert sleep_mock.call_count == game.settings.turn_time * game.max_turns
+    played = set(game.words.exclude(word=None).values_list("word", flat=True))
+    assert played & {"test", "toothbrush"}
+    assert played <= set(sample_words)
+
+
+@pytest.mark.django_db
+def test_start_countdown_is_scheduled_not_slept(mocker, unstarted_game: Game):
+    countdown = mocker.patch.object(tasks, "send_game_start_countdown")
+    apply_async = mocker.patch.object(tasks.start_game_countdown_task, "apply_async")
+    tasks.start_game_countdown_task(unstarted_game.id, 3)
+    countdown.assert_called_once_with(unstarted_game.id, 3)
+    apply_async.assert_called_once_with((unstarted_game.id, 2), countdown=tasks.START_COUNTDOWN_INTERVAL)
+    unstarted_game.refresh_from_db()
+    assert unstarted_game.status == GameStatus.WAITING
+
+
+@pytest.mark.django_db
+def test_start_countdown_stops_when_the_game_is_no_longer_waiting(mocker, started_game: Game):
+    countdown = mocker.patch.object(tasks, "send_game_start_countdown")
+    apply_async = mocker.patch.object(tasks.start_game_countdown_task, "apply_async")
+    tasks.start_game_countdown_task(started_game.id, 2)
+    assert not countdown.called
+    assert not apply_async.called
+
+
+@pytest.mark.django_db
+def test_player_disconnect_is_scheduled_with_a_grace_period(mocker, started_game: Game):
+    player = started_game.players.first()
+    apply_async = mocker.patch.object(tasks.player_disconnect_task, "apply_async")
+    task_id = tasks.schedule_player_disconnect(player.id)
+    apply_async.assert_called_once_with((player.id,), countdown=tasks.PLAYER_DISCONNECT_GRACE_PERIOD, task_id=task_id)
+    player.refresh_from_db()
+    assert player.disconnect_task_id == task_id
+
+
+@pytest.mark.django_db
+def test_player_disconnect_task_only_removes_players_that_stayed_away(mocker, started_game: Game):
+    mocker.patch.object(tasks.player_disconnect_task, "apply_async")
+    player = started_game.players.first()
+    Player.objects.filter(id=player.id).update(is_connected=False)
+    first_task_id = tasks.schedule_player_disconnect(player.id)
+    second_task_id = tasks.schedule_player_disconnect(player.id)
+    tasks.player_disconnect_task.apply((player.id,), task_id=first_task_id)
+    assert Player.objects.filter(id=player.id).exists()
+    tasks.player_disconnect_task.apply((player.id,), task_id=second_task_id)
+    assert not Player.objects.filter(id=player.id).exists()
+
+
+@pytest.mark.django_db
+def test_reconnecting_cancels_the_player_disconnect(mocker, started_game: Game):
+    mocker.patch.object(tasks.player_disconnect_task, "apply_async")
+    app = mocker.patch.object(tasks, "current_app")
+    player = started_game.players.first()
+    task_id = tasks.schedule_player_disconnect(player.id)
+    player.refresh_from_db()
+    player.is_connected = True
+    tasks.cancel_player_disconnect(player)
+    player.save()
+    app.control.revoke.assert_called_once_with(task_id)
+    tasks.player_disconnect_task.apply((player.id,), task_id=task_id)
+    player.refresh_from_db()
+    assert player.disconnect_task_id is None
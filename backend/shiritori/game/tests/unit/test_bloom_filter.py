@@ -0,0 +1,52 @@
+import pytest
+
+from shiritori.game.dictionary import BloomFilter, get_bloom_filter, get_bloom_filter_stats
+from shiritori.game.models import Word
+
+
+def test_bloom_filter_has_no_false_negatives():
+    words = [f"word{i}" for i in range(1000)]
+    bloom_filter = BloomFilter.from_words(words, 0.01)
+    assert all(bloom_filter.might_contain(word) for word in words)
+    assert bloom_filter.might_contain("WORD1")
+
+
+def test_bloom_filter_false_positive_rate_is_close_to_target():
+    bloom_filter = BloomFilter.from_words([f"word{i}" for i in range(1000)], 0.01)
+    false_positives = sum(bloom_filter.might_contain(f"other{i}") for i in range(10_000))
+    assert false_positives < 300
+
+
+def test_bloom_filter_rejects_invalid_rate():
+    with pytest.raises(ValueError):
+        BloomFilter.for_capacity(10, 1.5)
+
+
+def test_bloom_filter_counts_lookups():
+    bloom_filter = BloomFilter.from_words(["hello"], 0.01)
+    bloom_filter.might_contain("hello")
+    bloom_filter.might_contain("")
+    bloom_filter.record_false_positive()
+    assert bloom_filter.stats["hits"] == 1
+    assert bloom_filter.stats["misses"] == 1
+    assert bloom_filter.stats["false_positives"] == 1
+
+
+def test_bloom_filter_round_trips_through_file(tmp_path):
+    path = tmp_path / "en.bloom"
+    BloomFilter.from_words(["hello", "world"], 0.01).write(path)
+    bloom_filter = BloomFilter.open(path)
+    assert bloom_filter.might_contain("hello")
+    assert bloom_filter.might_contain("world")
+
+
+@pytest.mark.django_db
+def test_word_validate_rejects_through_bloom_filter(settings, sample_words):
+    settings.DICTIONARY_BLOOM_FILTER_ENABLED = True
+    settings.DICTIONARY_INDEX_ENABLED = False
+    assert Word.validate(sample_words[0])
+    assert not Word.validate("invalid")
+    stats = get_bloom_filter_stats()["en"]
+    assert stats["hits"] + stats["misses"] == 2
+    assert stats["hits"] >= 1
+    assert get_bloom_filter("en").might_contain(sample_words[1])
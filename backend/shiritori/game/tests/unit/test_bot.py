@@ -0,0 +1,137 @@
+import random
+
+import pytest
+from django.core.management import call_command
+
+from shiritori.game.bot import MoveSearch, choose_word
+from shiritori.game.dictionary import DictionaryIndex, LetterIndex
+from shiritori.game.models import BotDifficulty, Game, GameStatus, PlayerType
+
+WORDS = ["tea", "test", "tent", "toothbrush", "hello", "hat", "eat", "trio", "tz"]
+
+
+@pytest.fixture
+def letter_index():
+    return LetterIndex.from_dictionary_index(DictionaryIndex.from_words(WORDS))
+
+
+@pytest.mark.parametrize("difficulty", BotDifficulty.values)
+def test_choose_word_plays_a_valid_unused_word(letter_index, difficulty):
+    rng = random.Random(0)
+    for _ in range(20):
+        word = choose_word(letter_index, "cat", 3, {"tea"}, difficulty, rng=rng)
+        assert word in {"test", "tent", "toothbrush", "trio"}
+
+
+def test_choose_word_respects_min_length(letter_index):
+    assert choose_word(letter_index, "cat", 5, set(), BotDifficulty.EASY) == "toothbrush"
+
+
+def test_choose_word_finds_the_last_unused_word(letter_index):
+    used = {"tea", "tent", "toothbrush", "trio"}
+    assert choose_word(letter_index, "cat", 3, used, BotDifficulty.HARD) == "test"
+
+
+def test_choose_word_gives_up_without_words(letter_index):
+    assert choose_word(letter_index, "cat", 3, {"tea", "test", "tent", "toothbrush", "trio"}) is None
+    assert choose_word(letter_index, "buzz", 3, set()) is None
+    assert choose_word(letter_index, "", 3, set()) is None
+
+
+def test_choose_word_uses_extra_check(letter_index):
+    word = choose_word(letter_index, "cat", 3, set(), is_valid=lambda candidate: candidate == "trio")
+    assert word == "trio"
+
+
+def test_hard_bot_leaves_the_fewest_replies(letter_index):
+    # "trio" ends in o, which no word starts with.
+    for seed in range(5):
+        assert choose_word(letter_index, "cat", 4, set(), BotDifficulty.HARD, rng=random.Random(seed)) in {
+            "trio",
+            "toothbrush",
+        }
+
+
+def test_move_search_steers_into_dead_ends():
+    letter_index = LetterIndex.from_dictionary_index(DictionaryIndex.from_words(["tao", "toothbrush", "hello"]))
+    result = MoveSearch(letter_index, 3, ()).search("t", time_budget=1)
+    assert result.word == "tao"
+    assert result.depth >= 2
+    assert result.nodes > 0
+
+
+def test_move_search_skips_used_words(letter_index):
+    result = MoveSearch(letter_index, 3, {"tea", "tent", "toothbrush", "trio"}).search("t")
+    assert result.word == "test"
+
+
+def test_move_search_stops_at_its_time_budget(letter_index):
+    result = MoveSearch(letter_index, 3, ()).search("t", time_budget=0)
+    assert result.word is not None
+    assert result.depth == 0
+
+
+def test_move_search_without_moves(letter_index):
+    assert MoveSearch(letter_index, 3, ()).search("z").word is None
+
+
+@pytest.mark.django_db
+def test_benchmark_bot_command(sample_words, capsys):
+    call_command("benchmark_bot", "en", "--budget", "0.01")
+    assert "nodes per second" in capsys.readouterr().out
+
+
+@pytest.mark.django_db
+def test_add_bot(unstarted_game: Game):
+    bot = unstarted_game.add_bot(BotDifficulty.HARD)
+    second = unstarted_game.add_bot()
+    assert bot.type == PlayerType.BOT
+    assert bot.is_bot
+    assert bot.bot_difficulty == BotDifficulty.HARD
+    assert bot.name == "Bot1"
+    assert second.name == "Bot2"
+
+
+@pytest.fixture
+def bot_turn_game(started_game: Game, sample_words):
+    bot = started_game.current_player
+    bot.type = PlayerType.BOT
+    bot.bot_difficulty = BotDifficulty.MEDIUM
+    bot.save()
+    started_game.settings.word_length = 3
+    started_game.settings.save()
+    return started_game
+
+
+@pytest.mark.django_db
+def test_bot_waits_before_taking_its_turn(bot_turn_game: Game):
+    bot_turn_game.turn_time_left = bot_turn_game.settings.turn_time
+    assert not bot_turn_game.take_bot_turn()
+    assert bot_turn_game.word_count == 0
+
+
+@pytest.mark.django_db
+def test_bot_takes_its_turn(bot_turn_game: Game):
+    bot = bot_turn_game.current_player
+    bot_turn_game.turn_time_left = bot_turn_game.settings.turn_time - 10
+    assert bot_turn_game.take_bot_turn()
+    word = bot_turn_game.words.get()
+    assert word.player == bot
+    assert word.word in {"test", "toothbrush"}
+    assert bot_turn_game.current_player != bot
+
+
+@pytest.mark.django_db
+def test_human_turns_are_not_taken_by_bots(started_game: Game, sample_words):
+    started_game.turn_time_left = 0
+    assert not started_game.take_bot_turn()
+
+
+@pytest.mark.django_db
+def test_bot_keeps_its_type_after_winning(bot_turn_game: Game):
+    bot = bot_turn_game.current_player
+    bot_turn_game.winner = bot
+    bot_turn_game.winner = bot_turn_game.players.exclude(id=bot.id).first()
+    bot.refresh_from_db()
+    assert bot.type == PlayerType.BOT
+    assert bot_turn_game.status == GameStatus.PLAYING
@@ -0,0 +1,96 @@
+import pytest
+from django.core.management import call_command
+
+from shiritori.game.dictionary import DictionaryIndex, get_dictionary_index, invalidate_dictionary_index
+from shiritori.game.models import Word
+
+
+def test_dictionary_index_contains_words():
+    index = DictionaryIndex.from_words(["hello", "apple", "zebra", "apple"])
+    assert len(index) == 3
+    assert "apple" in index
+    assert "hello" in index
+    assert "zebra" in index
+    assert "missing" not in index
+    assert "" not in index
+    assert None not in index
+
+
+def test_dictionary_index_is_case_insensitive():
+    index = DictionaryIndex.from_words(["Hello"])
+    assert "hello" in index
+    assert "HELLO" in index
+
+
+def test_dictionary_index_supports_non_ascii_words():
+    index = DictionaryIndex.from_words(["café", "naïve", "しりとり"])
+    assert "CAFÉ" in index
+    assert "しりとり" in index
+    assert "cafe" not in index
+
+
+def test_dictionary_index_is_sorted():
+    index = DictionaryIndex.from_words(["b", "c", "a"])
+    assert [index.word_at(i) for i in range(len(index))] == [b"a", b"b", b"c"]
+
+
+@pytest.mark.django_db
+def test_word_validate_uses_index_without_queries(django_assert_num_queries, sample_words):
+    assert Word.validate(sample_words[0])
+    with django_assert_num_queries(0):
+        assert Word.validate(sample_words[1].upper())
+        assert not Word.validate("invalid")
+
+
+@pytest.mark.django_db
+def test_invalidate_dictionary_index_rebuilds_from_word_table(sample_words):
+    assert "invalid" not in get_dictionary_index("en")
+    Word.objects.create(word="invalid")
+    invalidate_dictionary_index("en")
+    assert "invalid" in get_dictionary_index("en")
+
+
+def test_dictionary_index_round_trips_through_file(tmp_path):
+    path = tmp_path / "en.idx"
+    DictionaryIndex.from_words(["hello", "apple", "café"]).write(path)
+    index = DictionaryIndex.open(path)
+    assert len(index) == 3
+    assert "apple" in index
+    assert "Café" in index
+    assert "zebra" not in index
+    assert index.word_at(0) == b"apple"
+
+
+def test_dictionary_index_open_rejects_other_files(tmp_path):
+    path = tmp_path / "en.idx"
+    path.write_bytes(b"not an index")
+    with pytest.raises(ValueError):
+        DictionaryIndex.open(path)
+
+
+@pytest.mark.django_db
+def test_build_dictionary_index_command(settings, tmp_path, sample_words):
+    settings.DICTIONARY_INDEX_DIR = str(tmp_path)
+    call_command("build_dictionary_index", "en")
+    assert (tmp_path / "en.idx").exists()
+    Word.objects.all().delete()
+    assert sample_words[0] in get_dictionary_index("en")
+
+
+@pytest.mark.django_db
+def test_build_dictionary_index_command_from_file(settings, tmp_path):
+    (tmp_path / "dictionaries").mkdir()
+    (tmp_path / "dictionaries" / "en.txt").write_text("apple\nbanana\n", encoding="utf-8")
+    settings.BASE_DIR = tmp_path
+    settings.DICTIONARY_INDEX_DIR = str(tmp_path)
+    assert "apple" not in get_dictionary_index("en")
+    call_command("build_dictionary_index", "en", "--from-file")
+    assert get_dictionary_index("en").version is None
+    assert "apple" in get_dictionary_index("en")
+
+    version = Word.load_dictionary("en").version
+    call_command("build_dictionary_index", "en", "--from-file")
+    assert DictionaryIndex.open(tmp_path / "en.idx").version == version
+    Word.objects.all().delete()
+    assert get_dictionary_index("en").version == version
+    assert Word.validate("banana", version=version)
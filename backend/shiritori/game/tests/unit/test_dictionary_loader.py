@@ -0,0 +1,14 @@
+from shiritori.game.dictionary.loader import WordCopyStream
+
+
+def test_word_copy_stream_reads_in_chunks():
+    stream = WordCopyStream(["apple", "banana", "back\\slash"])
+    data = ""
+    while chunk := stream.read(4):
+        assert len(chunk) <= 4
+        data += chunk
+    assert data == "apple\nbanana\nback\\\\slash\n"
+
+
+def test_word_copy_stream_reads_everything():
+    assert WordCopyStream(["a", "b"]).read() == "a\nb\n"
@@ -0,0 +1,167 @@
+import os
+import random
+import string
+import subprocess
+import sys
+
+import pytest
+
+from shiritori.game import engine
+from shiritori.game.engine import GameState, PlayerState
+
+
+def make_state(players: int = 2, max_turns: int = 10, **kwargs) -> GameState:
+    state = GameState(
+        players=[PlayerState(id=f"p{index}") for index in range(players)],
+        turn_time=60,
+        max_turns=max_turns * players,
+        **kwargs,
+    )
+    engine.start(state, now=0)
+    return state
+
+
+def test_join_and_start():
+    state = GameState(turn_time=30)
+    engine.join(state, PlayerState(id="a"))
+    with pytest.raises(engine.GameRuleError, match="less than 2 players"):
+        engine.start(state, now=0)
+    engine.join(state, PlayerState(id="b"))
+    engine.start(state, now=100)
+    assert (state.status, state.current, state.deadline) == (engine.PLAYING, "a", 130)
+    with pytest.raises(engine.GameRuleError, match="already started"):
+        engine.join(state, PlayerState(id="c"))
+
+
+def test_shuffle_order_uses_the_given_random():
+    state = GameState(players=[PlayerState(id=str(index)) for index in range(5)])
+    engine.shuffle_order(state, random.Random(1))
+    order = [player.id for player in state.players]
+    state = GameState(players=[PlayerState(id=str(index)) for index in range(5)])
+    engine.shuffle_order(state, random.Random(1))
+    assert [player.id for player in state.players] == order
+
+
+def test_take_turn_moves_on_to_the_next_player():
+    state = make_state()
+    turn = engine.take_turn(state, "p0", "Tent", now=10)
+    assert (turn.player_id, turn.word, turn.duration) == ("p0", "tent", 10)
+    assert (state.turn, state.round, state.current, state.last_word) == (1, 0, "p1", "tent")
+    assert state.players[0].score == turn.score > 0
+    assert state.deadline == 70
+    engine.take_turn(state, "p1", "test", now=20)
+    assert (state.turn, state.round, state.current) == (2, 1, "p0")
+
+
+@pytest.mark.parametrize(
+    "player_id, word, now, message",
+    [
+        ("p1", "test", 10, "It is not your turn."),
+        ("p0", "test", 60, "Turn time has expired."),
+        ("p0", "dent", 10, "Word must start with the last letter of the previous word."),
+        ("p0", "tt", 10, "Word must be at least 3 characters long."),
+        ("p0", "tent", 10, "Word already used."),
+    ],
+)
+def test_take_turn_checks_the_rules(player_id: str, word: str, now: float, message: str):
+    state = make_state(last_word="t", used_words={"tent"})
+    with pytest.raises(engine.GameRuleError, match=message):
+        engine.take_turn(state, player_id, word, now)
+    assert state.turn == 0
+
+
+def test_take_turn_checks_the_dictionary():
+    state = make_state(last_word="t")
+    with pytest.raises(engine.GameRuleError, match="Word not found in dictionary."):
+        engine.take_turn(state, "p0", "test", 10, is_in_dictionary=lambda word: False)
+
+
+def test_end_turn_gives_the_penalty():
+    state = make_state()
+    turn = engine.end_turn(state, now=60)
+    assert turn.word is None
+    assert turn.score == -15
+    assert state.current == "p1"
+
+
+def test_disconnected_players_are_skipped():
+    state = make_state(players=3)
+    state.players[1].is_connected = False
+    engine.end_turn(state, now=60)
+    assert state.current == "p2"
+    engine.end_turn(state, now=120)
+    # The round ends with the last connected player.
+    assert state.round == 1
+
+
+def test_skip_turn():
+    state = make_state(players=3)
+    engine.skip_turn(state)
+    assert state.current == "p1"
+    state.players[1].is_connected = False
+    with pytest.raises(engine.GameRuleError, match="Current player is not connected."):
+        engine.skip_turn(state)
+
+
+def test_the_game_finishes_after_max_turns():
+    state = make_state(max_turns=2)
+    for turn in range(4):
+        engine.end_turn(state, now=60 * (turn + 1))
+        assert state.status == engine.PLAYING
+    engine.end_turn(state, now=300)
+    assert state.status == engine.FINISHED
+
+
+def test_leaving_finishes_a_game_of_two():
+    state = make_state(players=3)
+    engine.leave(state, "p0")
+    assert (state.status, state.current) == (engine.PLAYING, "p1")
+    engine.leave(state, "p1")
+    assert state.status == engine.FINISHED
+    assert engine.winner(state) == "p2"
+
+
+def random_word(rng: random.Random, letter: str | None) -> str:
+    return (letter or "") + "".join(rng.choices(string.ascii_lowercase[:6], k=rng.randint(1, 5)))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_fuzz_turns_keep_the_invariants(seed: int):
+    rng = random.Random(seed)
+    state = make_state(players=rng.randint(2, 5), max_turns=rng.randint(1, 15), last_word="a")
+    now = 0.0
+    words = 0
+    while state.status == engine.PLAYING:
+        for player in state.players:
+            if rng.random() < 0.1:
+                player.is_connected = not player.is_connected
+        turn_before, round_before, score_before = state.turn, state.round, sum(p.score for p in state.players)
+        now += rng.uniform(0, 80)
+        player_id = state.current if rng.random() < 0.9 else rng.choice(state.players).id
+        word = random_word(rng, state.last_word[-1]) if rng.random() < 0.8 else rng.choice(["", None, "x"])
+        try:
+            turn = engine.take_turn(state, player_id, word, now)
+        except engine.GameRuleError:
+            assert state.turn == turn_before
+            if engine.turn_time_left(state, now) <= 0:
+                turn = engine.end_turn(state, now)
+            else:
+                continue
+        words += turn.word is not None
+        assert state.turn == turn_before + 1
+        assert state.round in (round_before, round_before + 1)
+        assert sum(p.score for p in state.players) == pytest.approx(score_before + turn.score)
+        assert state.current in {player.id for player in state.players}
+        assert state.deadline == now + state.turn_time
+        if any(player.is_connected for player in state.players):
+            assert state.get_player(state.current).is_connected
+    assert state.turn == state.max_turns + 1
+    assert len(state.used_words) == words
+    assert state.used_letters == {word[-1] for word in state.used_words}
+
+
+def test_engine_imports_without_django_set_up():
+    code = "import sys, shiritori.game.engine; print({'django.db', 'shiritori.game.models'} & set(sys.modules))"
+    env = {key: value for key, value in os.environ.items() if key != "DJANGO_SETTINGS_MODULE"}
+    result = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "set()"
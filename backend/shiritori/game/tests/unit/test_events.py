@@ -4,6 +4,7 @@ import pytest
 import pytest_asyncio
 from asgiref.sync import sync_to_async
 
+from shiritori.game import events
 from shiritori.game.events import (
     send_game_timer_updated,
     send_game_updated,
@@ -82,3 +83,13 @@ async def test_send_turn_taken(event_consumer):
     await sync_to_async(send_turn_taken)(game.id, {"word": "test"})
     data = await consumer.receive_json_from()
     assert data["type"] == "turn_taken"
+
+
+async def test_events_are_encoded_once_when_published(event_consumer, mocker):
+    consumer, game, player_1 = event_consumer
+    encode_event = mocker.spy(events, "encode_event")
+    camelize = mocker.patch("shiritori.game.consumers.camelize")
+    await sync_to_async(send_player_left)(game.id, "abcd")
+    assert await consumer.receive_json_from() == {"type": "player_left", "data": "abcd"}
+    assert encode_event.call_count == 1
+    camelize.assert_not_called()
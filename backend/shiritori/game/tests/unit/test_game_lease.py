@@ -0,0 +1,124 @@
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from shiritori.game import tasks
+from shiritori.game.models import Game, GameLease
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def now(mocker):
+    now = [timezone.now()]
+    mocker.patch("django.utils.timezone.now", side_effect=lambda: now[0])
+    return now
+
+
+def test_acquire_takes_a_free_lease(started_game: Game, now):
+    lease = GameLease.acquire(started_game.id, "loop-1", worker="worker-1")
+    assert lease.token == 1
+    assert lease.expires_at == now[0] + timedelta(seconds=5)
+    started_game.refresh_from_db()
+    assert started_game.task_id == "loop-1"
+
+
+def test_acquire_respects_live_leases(started_game: Game, now):
+    GameLease.acquire(started_game.id, "loop-1")
+    assert GameLease.acquire(started_game.id, "loop-2") is None
+    # The owner may take its own lease again, e.g. when its task is retried.
+    assert GameLease.acquire(started_game.id, "loop-1").token == 2
+
+
+def test_expired_leases_are_taken_over_with_a_new_token(started_game: Game, now):
+    old = GameLease.acquire(started_game.id, "loop-1")
+    now[0] += timedelta(seconds=6)
+    new = GameLease.acquire(started_game.id, "loop-2")
+    assert new.token == old.token + 1
+    assert not old.heartbeat()
+    started_game.refresh_from_db()
+    assert started_game.task_id == "loop-2"
+    # The old loop is fenced out of the game too.
+    assert Game.run_timers(started_game.id, "loop-1") is None
+
+
+def test_heartbeat_extends_the_lease(started_game: Game, now, django_assert_num_queries):
+    lease = GameLease.acquire(started_game.id, "loop-1")
+    with django_assert_num_queries(0):
+        assert lease.heartbeat()
+    now[0] += timedelta(seconds=4)
+    with django_assert_num_queries(1):
+        assert lease.heartbeat()
+    assert GameLease.objects.get(game=started_game).expires_at == now[0] + timedelta(seconds=5)
+
+
+def test_release_frees_the_lease(started_game: Game, now):
+    lease = GameLease.acquire(started_game.id, "loop-1")
+    lease.release()
+    started_game.refresh_from_db()
+    assert started_game.task_id is None
+    assert GameLease.acquire(started_game.id, "loop-2").token == 2
+
+
+def test_restart_expires_the_lease(started_game: Game, now):
+    GameLease.acquire(started_game.id, "loop-1")
+    started_game.restart()
+    assert GameLease.objects.get(game=started_game).is_expired
+
+
+def test_orphaned_games(started_game: Game, finished_game: Game, now):
+    leased = Game.objects.create(status="PLAYING", turn_deadline=now[0] - timedelta(hours=1))
+    GameLease.acquire(leased.id, "loop-1")
+    GameLease.acquire(finished_game.id, "loop-2")
+    Game.objects.filter(id=started_game.id).update(turn_deadline=now[0] + timedelta(seconds=10))
+    never_leased = Game.objects.create(status="PLAYING", turn_deadline=now[0] - timedelta(seconds=10))
+    assert set(GameLease.get_orphaned_games().values_list("id", flat=True)) == {never_leased.id}
+    now[0] += timedelta(seconds=6)
+    assert set(GameLease.get_orphaned_games().values_list("id", flat=True)) == {never_leased.id, leased.id}
+
+
+def test_supervisor_restarts_orphaned_games(started_game: Game, mocker, settings, now):
+    apply_async = mocker.patch.object(tasks.game_worker_task, "apply_async")
+    GameLease.acquire(started_game.id, "loop-1")
+    tasks.supervise_game_leases_task()
+    assert not apply_async.called
+    now[0] += timedelta(seconds=6)
+    tasks.supervise_game_leases_task()
+    apply_async.assert_called_once_with((started_game.id,), task_id=mocker.ANY)
+    settings.TURN_QUEUE_ENABLED = True
+    tasks.supervise_game_leases_task()
+    assert apply_async.call_count == 1
+
+
+def test_supervisor_enqueues_each_orphan_once_per_lease_time(started_game: Game, mocker, now):
+    apply_async = mocker.patch.object(tasks.game_worker_task, "apply_async")
+    started_game.turn_deadline = now[0] - timedelta(seconds=10)
+    started_game.save()
+    tasks.supervise_game_leases_task()
+    tasks.supervise_game_leases_task()
+    assert apply_async.call_count == 1
+    task_id = apply_async.call_args.kwargs["task_id"]
+    assert GameLease.acquire(started_game.id, "loop-1") is None
+    assert GameLease.acquire(started_game.id, task_id).token == 1
+
+    # The game is handed out again once the lease of the task started for it runs out.
+    now[0] += timedelta(seconds=6)
+    tasks.supervise_game_leases_task()
+    assert apply_async.call_count == 2
+    assert apply_async.call_args.kwargs["task_id"] != task_id
+
+
+def test_turn_loop_stops_when_the_lease_is_lost(started_game: Game, mocker, now):
+    mocker.patch("shiritori.game.models.game.wait")
+    lease = GameLease.acquire(started_game.id, "loop-1")
+    heartbeat = mocker.Mock(side_effect=[True, False])
+    Game.run_turn_loop(started_game.id, lease.owner, heartbeat=heartbeat)
+    assert heartbeat.call_count == 2
+
+
+def test_game_leases_command(started_game: Game, capsys, now):
+    GameLease.acquire(started_game.id, "loop-1", worker="worker-1")
+    call_command("game_leases")
+    assert "worker-1: 1 games" in capsys.readouterr().out
@@ -1,7 +1,10 @@
+from datetime import timedelta
+
 import pytest
 from django.core.exceptions import ValidationError
+from django.utils import timezone
 
-from shiritori.game.models import Game, GameStatus, GameWord, Word
+from shiritori.game.models import Game, GameStatus, GameWord, Player, Word
 
 pytestmark = pytest.mark.django_db
 
@@ -209,6 +212,7 @@ def test_word_case_insensitive(started_game: Game, sample_words: list[str]):
 def test_end_turn_updates_current_player_and_turn(started_game):
     first_player, next_player = started_game.players
     started_game.end_turn()
+    first_player.refresh_from_db()
     assert first_player.score == -15
     assert started_game.current_player == next_player
     assert started_game.current_turn == 1
@@ -281,3 +285,92 @@ def test_shuffle_player_order_with_less_than_two_players(game_factory, player_fa
     game.player_set.add(player_factory())
     with pytest.raises(ValidationError):
         game.shuffle_player_order()
+
+
+def test_turn_time_left_is_derived_from_the_deadline(mocker, started_game):
+    now = timezone.now()
+    mocker.patch("shiritori.game.models.game.timezone.now", return_value=now)
+    started_game.turn_deadline = now + timedelta(seconds=12.5)
+    assert started_game.turn_time_left == 12.5
+    started_game.turn_deadline = now - timedelta(seconds=1)
+    assert started_game.turn_time_left == 0
+    started_game.turn_deadline = None
+    assert started_game.turn_time_left == 0
+
+
+def test_start_sets_the_turn_deadline(game, player, human_player_2):
+    game.join(player)
+    game.join(human_player_2)
+    game.prepare_start()
+    game.start()
+    game.refresh_from_db()
+    assert game.turn_time_left == pytest.approx(game.settings.turn_time, abs=1)
+
+
+def test_take_turn_records_the_exact_duration(mocker, started_game, sample_words):
+    now = timezone.now()
+    mocker.patch("shiritori.game.models.game.timezone.now", return_value=now)
+    started_game.turn_deadline = now + timedelta(seconds=started_game.settings.turn_time - 2.5)
+    started_game.take_turn(started_game.current_player.session_key, sample_words[0])
+    assert started_game.words.get().duration == 2.5
+    assert started_game.turn_deadline == now + timedelta(seconds=started_game.settings.turn_time)
+
+
+def test_player_rows_are_loaded_once(started_game, django_assert_num_queries):
+    first, second = started_game.players
+    with started_game.player_rows():
+        with django_assert_num_queries(1):
+            assert started_game.player_count == 2
+            assert started_game.player_list == [first, second]
+            assert started_game.current_player == started_game.next_player == first
+            assert started_game.last_player == second
+            assert started_game.winner is None
+            assert started_game.host is not None
+        # The game's own writes are applied to the rows it holds.
+        with django_assert_num_queries(2):
+            started_game.current_player = second
+        with django_assert_num_queries(0):
+            assert started_game.current_player == second
+    assert started_game.current_player == second
+
+
+def test_take_turn_takes_a_fixed_number_of_queries(mocker, started_game, django_assert_num_queries):
+    mocker.patch("shiritori.game.models.game.Word.validate", return_value=True)
+    started_game.turn_time_left = 30
+    started_game.save()
+    first, second = started_game.players
+    # The players, the used words, the new word and its player's score, the current player twice, the game,
+    # and a savepoint around them. A word ending in a new letter records it too.
+    with django_assert_num_queries(10):
+        started_game.take_turn(first.session_key, started_game.last_word + "ardent")
+    with django_assert_num_queries(9):
+        started_game.take_turn(second.session_key, "tangent")
+    assert started_game.used_letters == {"t"}
+    assert started_game.current_turn == 2
+
+
+def test_used_letters_are_stored_on_the_game(finished_game):
+    assert finished_game.used_letters == {word.word[-1] for word in finished_game.words}
+    game = Game.objects.get(id=finished_game.id)
+    assert game.used_letters == finished_game.used_letters
+    game.restart()
+    assert Game.objects.get(id=game.id).used_letters == set()
+
+
+def test_used_letters_support_any_alphabet(started_game):
+    started_game.add_used_letter("ж")
+    started_game.add_used_letter("ん")
+    started_game.add_used_letter("ж")
+    assert started_game.used_last_letters == "жん"
+    assert Game.objects.get(id=started_game.id).used_letters == {"ж", "ん"}
+
+
+def test_ties_go_to_the_earlier_player_in_turn_order(started_game):
+    first, second = started_game.players
+    started_game.players.update(total_score=5)
+    assert list(started_game.leaderboard) == [first, second]
+    Player.objects.filter(id=first.id).update(order=1)
+    Player.objects.filter(id=second.id).update(order=0)
+    assert list(started_game.leaderboard) == [second, first]
+    started_game.finish()
+    assert started_game.winner == second
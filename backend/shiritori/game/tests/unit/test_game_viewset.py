@@ -3,7 +3,7 @@ from unittest.mock import patch
 import pytest
 from rest_framework.test import APIClient
 
-from shiritori.game.models import Game, GameStatus, Player
+from shiritori.game.models import BotDifficulty, Game, GameStatus, Player
 
 pytestmark = pytest.mark.django_db
 
@@ -56,7 +56,7 @@ def test_leave_game_view(drf: APIClient, game: Game, player: Player):
 
 def test_take_turn_game_view(drf: APIClient, started_game: Game, sample_words: list[str]):
     game = started_game
-    game.turn_time_left = game.settings.turn_time - 5
+    game.turn_time_left = game.settings.turn_time - 4
     game.save()
     player = game.players.first()
     player2 = game.players.last()
@@ -90,6 +90,16 @@ def test_take_turn_game_view(drf: APIClient, started_game: Game, sample_words: l
     assert response.status_code == 400
 
 
+def test_take_turn_game_view_checks_the_game_exists_before_the_hot_state(drf: APIClient, mocker, settings):
+    settings.HOT_STATE_ENABLED = True
+    store = mocker.patch("shiritori.game.hot_state.get_hot_game_store").return_value
+    store.is_hot.return_value = True
+    assert drf.session.session_key
+    response = drf.post("/api/game/missing/turn/", {"word": "test"}, format="json")
+    assert response.status_code == 404
+    store.take_turn.assert_not_called()
+
+
 def test_start_game_view_as_host(drf: APIClient, unstarted_game: Game):
     game = unstarted_game
     player = game.players.first()
@@ -180,6 +190,8 @@ def test_get_game_view(drf: APIClient, finished_game: Game):
         "current_round": game.current_round,
         "max_turns": game.max_turns,
         "turn_time_left": game.turn_time_left,
+        "turn_deadline": None,
+        "revision": game.revision,
         "players": [
             {
                 "id": player.id,
@@ -223,3 +235,18 @@ def test_restart_game_as_non_host(drf: APIClient, finished_game: Game):
     assert response.status_code == 400
     game.refresh_from_db()
     assert game.status == GameStatus.FINISHED
+
+
+def test_add_bot_view(drf: APIClient, unstarted_game: Game):
+    host = unstarted_game.host
+    host.session_key = drf.session.session_key
+    host.save()
+    response = drf.post(f"/api/game/{unstarted_game.id}/bot/", {"difficulty": "EASY"}, format="json")
+    assert response.status_code == 201
+    assert unstarted_game.player_set.get(id=response.data["id"]).bot_difficulty == BotDifficulty.EASY
+
+
+def test_add_bot_view_as_non_host(drf: APIClient, unstarted_game: Game):
+    drf.session._set_session_key(unstarted_game.players.exclude(is_host=True).first().session_key)
+    response = drf.post(f"/api/game/{unstarted_game.id}/bot/", format="json")
+    assert response.status_code == 400
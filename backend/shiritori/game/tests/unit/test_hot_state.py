@@ -0,0 +1,331 @@
+from datetime import timedelta
+
+import pytest
+import redis
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError
+from django.utils import timezone
+
+from shiritori.game.hot_state import (
+    TURN_CHANGED,
+    WORD_USED,
+    HotGameStore,
+    MemoryHotGameBackend,
+    RedisHotGameBackend,
+)
+from shiritori.game.models import BotDifficulty, Game, GameStatus, GameWord, Player
+from shiritori.game.turn_queue import MemoryTurnQueue
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def now(mocker):
+    now = [timezone.now()]
+    mocker.patch("django.utils.timezone.now", side_effect=lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def store(mocker, settings):
+    settings.HOT_STATE_ENABLED = True
+    store = HotGameStore(MemoryHotGameBackend())
+    mocker.patch("shiritori.game.hot_state.get_hot_game_store", return_value=store)
+    for event in ("send_turn_taken", "send_game_updated", "send_game_timer_updated"):
+        mocker.patch(f"shiritori.game.hot_state.{event}")
+    mocker.patch("shiritori.game.hot_state.Word.validate", return_value=True)
+    return store
+
+
+@pytest.fixture(params=["memory", "redis"])
+def backend(request, settings):
+    if request.param == "memory":
+        return MemoryHotGameBackend()
+    backend = RedisHotGameBackend.from_url(settings.HOT_STATE_URL)
+    try:
+        backend.client.ping()
+    except redis.ConnectionError:
+        pytest.skip("Redis is not running")
+    return backend
+
+
+@pytest.fixture
+def flush_task(mocker):
+    return mocker.patch("shiritori.game.tasks.flush_hot_game_task.delay")
+
+
+@pytest.fixture
+def hot_game(started_game: Game, store: HotGameStore, now) -> Game:
+    started_game.last_word = "tent"
+    started_game.turn_deadline = now[0] + timedelta(seconds=started_game.settings.turn_time)
+    started_game.save()
+    store.load(started_game)
+    return started_game
+
+
+def session_key(game: Game, player_id: str) -> str:
+    return game.player_set.get(id=player_id).session_key
+
+
+def test_backend_applies_turns_atomically(started_game: Game, backend):
+    state = HotGameStore(backend).load(started_game)
+    player_id = state.current
+    try:
+        revision = backend.apply(started_game.id, 0, "test", player_id, 2.5, {"word": "test"}, {"turn": "1"})
+        assert revision == state.revision + 1
+        assert (
+            backend.apply(started_game.id, 0, "tent", player_id, 2.5, {"word": "tent"}, {"turn": "1"}) == TURN_CHANGED
+        )
+        assert backend.apply(started_game.id, 1, "test", player_id, 2.5, {"word": "test"}, {"turn": "2"}) == WORD_USED
+        state = backend.read(started_game.id)
+        assert (state.turn, state.used_words, state.used_letters) == (1, {"test"}, {"t"})
+        assert state.scores[player_id] == 2.5
+        assert backend.history(started_game.id) == [{"word": "test"}]
+        assert backend.mark_flushed(started_game.id, 0, 1)
+        assert not backend.mark_flushed(started_game.id, 0, 1)
+        assert backend.bump_revision(started_game.id) == revision + 1
+        assert backend.read(started_game.id).revision == revision + 1
+    finally:
+        backend.delete(started_game.id)
+    assert not backend.exists(started_game.id)
+    assert backend.bump_revision(started_game.id) is None
+    assert not backend.exists(started_game.id)
+
+
+def test_load_copies_the_game(hot_game: Game, store: HotGameStore):
+    state = store.get(hot_game.id)
+    players = list(hot_game.players)
+    assert state.status == GameStatus.PLAYING
+    assert state.current == hot_game.current_player.id
+    assert state.order == [player.id for player in players]
+    assert state.deadline_at == hot_game.turn_deadline
+    assert state.max_turns == hot_game.max_turns
+    assert store.game_json(state)["current_player"] == state.current
+
+
+def test_take_turn_does_not_touch_the_database(
+    hot_game: Game, store: HotGameStore, django_assert_num_queries, flush_task
+):
+    state = store.get(hot_game.id)
+    first, second = state.order
+    first_session_key = session_key(hot_game, first)
+    with django_assert_num_queries(0):
+        state = store.take_turn(hot_game.id, first_session_key, "Test")
+    assert state.turn == 1
+    assert state.current == second
+    assert state.last_word == "test"
+    assert state == store.get(hot_game.id)
+    assert state.scores[first] > 0
+    assert hot_game.word_count == 0
+
+
+@pytest.mark.parametrize(
+    "word, message",
+    [
+        ("dent", "Word must start with the last letter of the previous word."),
+        ("tt", "Word must be at least"),
+    ],
+)
+def test_take_turn_validates_words(hot_game: Game, store: HotGameStore, word: str, message: str):
+    state = store.get(hot_game.id)
+    with pytest.raises(ValidationError, match=message):
+        store.take_turn(hot_game.id, session_key(hot_game, state.current), word)
+
+
+def test_take_turn_rejects_used_words_and_other_players(hot_game: Game, store: HotGameStore):
+    first, second = store.get(hot_game.id).order
+    store.take_turn(hot_game.id, session_key(hot_game, first), "test")
+    with pytest.raises(ValidationError, match="It is not your turn."):
+        store.take_turn(hot_game.id, session_key(hot_game, first), "tent")
+    with pytest.raises(ValidationError, match="Word already used."):
+        store.take_turn(hot_game.id, session_key(hot_game, second), "test")
+
+
+def test_turns_apply_only_once(hot_game: Game, store: HotGameStore):
+    state = store.get(hot_game.id)
+    store.take_turn(hot_game.id, session_key(hot_game, state.current), "test")
+    # A turn planned from the state before the first one was applied is rejected.
+    with pytest.raises(ValidationError):
+        store._apply_turn(state, "tent", timezone.now())
+    assert store.get(hot_game.id).turn == 1
+
+
+def test_game_json_follows_the_turns(hot_game: Game, store: HotGameStore):
+    first, second = store.get(hot_game.id).order
+    state = store.take_turn(hot_game.id, session_key(hot_game, first), "test")
+    data = store.game_json(state)
+    assert data["current_player"] == second
+    assert data["words"][-1]["word"] == "test"
+    assert data["word_count"] == 1
+    assert [player["is_current"] for player in data["players"]] == [False, True]
+
+
+def test_turns_send_their_changes_as_the_next_revision(hot_game: Game, store: HotGameStore):
+    from shiritori.game import hot_state
+
+    first, second = store.get(hot_game.id).order
+    revision = store.get(hot_game.id).revision
+    state = store.take_turn(hot_game.id, session_key(hot_game, first), "test")
+    changes = hot_state.send_game_updated.call_args.args[0]
+    assert changes["revision"] == state.revision == revision + 1
+    assert changes["current_player"] == second
+    assert changes["word_count"] == 1
+    assert "words" not in changes and "players" not in changes
+    assert store.game_json(state)["revision"] == state.revision
+
+
+def test_database_events_count_towards_the_hot_revision(hot_game: Game, store: HotGameStore):
+    first = store.get(hot_game.id).current
+    revision = store.get(hot_game.id).revision
+    assert hot_game.bump_revision() == revision + 1
+    assert Game.objects.get(id=hot_game.id).revision == revision + 1
+    state = store.take_turn(hot_game.id, session_key(hot_game, first), "test")
+    assert state.revision == store.get(hot_game.id).revision == revision + 2
+    store.flush(hot_game.id)
+    assert Game.objects.get(id=hot_game.id).revision == revision + 2
+
+
+def test_run_timers_ends_expired_turns(hot_game: Game, store: HotGameStore, now):
+    first = store.get(hot_game.id).current
+    assert store.run_timers(hot_game.id) == hot_game.turn_deadline
+    now[0] = hot_game.turn_deadline
+    next_timer_at = store.run_timers(hot_game.id)
+    state = store.get(hot_game.id)
+    assert next_timer_at == now[0] + timedelta(seconds=hot_game.settings.turn_time)
+    assert state.turn == 1
+    assert state.scores[first] < 0
+    assert store.backend.history(hot_game.id)[0]["word"] is None
+
+
+def test_game_run_timers_uses_the_hot_state(hot_game: Game, store: HotGameStore, now):
+    now[0] = hot_game.turn_deadline
+    Game.run_timers(hot_game.id, None)
+    assert store.get(hot_game.id).turn == 1
+    assert hot_game.word_count == 0
+
+
+def test_game_run_timers_is_fenced_for_hot_games(hot_game: Game, store: HotGameStore, now):
+    Game.objects.filter(id=hot_game.id).update(task_id="owner")
+    now[0] = hot_game.turn_deadline
+    assert Game.run_timers(hot_game.id, "stale") is None
+    assert Game.run_timers(hot_game.id, None) is None
+    assert store.get(hot_game.id).turn == 0
+    Game.run_timers(hot_game.id, "owner")
+    assert store.get(hot_game.id).turn == 1
+
+
+def test_run_timers_plays_bots(hot_game: Game, store: HotGameStore, mocker, now):
+    bot = hot_game.current_player
+    bot.bot_difficulty = BotDifficulty.EASY
+    bot.save()
+    store.load(hot_game)
+    mocker.patch.object(store, "choose_bot_word", return_value="test")
+    think_time = min(6, hot_game.settings.turn_time // 2)
+    assert store.run_timers(hot_game.id) == now[0] + timedelta(seconds=think_time)
+    now[0] += timedelta(seconds=think_time)
+    store.run_timers(hot_game.id)
+    assert store.get(hot_game.id).last_word == "test"
+
+
+def test_disconnected_players_are_skipped(hot_game: Game, store: HotGameStore, flush_task):
+    hot_game.settings.max_turns = 5
+    hot_game.settings.save()
+    Player.objects.create(game=hot_game, name="Third", session_key="third", order=3)
+    store.load(hot_game)
+    first, second, third = store.get(hot_game.id).order
+    store.set_connected(hot_game.id, second, False)
+    state = store.take_turn(hot_game.id, session_key(hot_game, first), "test")
+    assert state.current == third
+
+
+def test_flush_writes_turns_in_a_batch(
+    hot_game: Game, store: HotGameStore, flush_task, django_capture_on_commit_callbacks
+):
+    first, second = store.get(hot_game.id).order
+    store.take_turn(hot_game.id, session_key(hot_game, first), "test")
+    store.take_turn(hot_game.id, session_key(hot_game, second), "tent")
+    with django_capture_on_commit_callbacks(execute=True):
+        assert store.flush(hot_game.id) == 2
+    assert store.get(hot_game.id).flushed == 2
+    assert store.flush(hot_game.id) == 0
+    hot_game.refresh_from_db()
+    assert list(hot_game.words.values_list("word", flat=True).order_by("word")) == ["tent", "test"]
+    assert hot_game.current_turn == 2
+    assert hot_game.last_word == "tent"
+    assert hot_game.current_player.id == first
+    assert store.is_hot(hot_game.id)
+
+
+def test_flush_only_counts_committed_turns(hot_game: Game, store: HotGameStore, mocker):
+    first = store.get(hot_game.id).current
+    store.take_turn(hot_game.id, session_key(hot_game, first), "test")
+    bulk_create = GameWord.objects.bulk_create
+
+    def fail_after_writing(*args, **kwargs):
+        bulk_create(*args, **kwargs)
+        raise IntegrityError
+
+    mocker.patch.object(GameWord.objects, "bulk_create", side_effect=fail_after_writing)
+    with pytest.raises(IntegrityError):
+        store.flush(hot_game.id)
+    assert not GameWord.objects.filter(game=hot_game).exists()
+    assert store.get(hot_game.id).flushed == 0
+
+
+def test_flush_keeps_the_turns_of_removed_players(
+    hot_game: Game, store: HotGameStore, django_capture_on_commit_callbacks
+):
+    first = store.get(hot_game.id).current
+    store.take_turn(hot_game.id, session_key(hot_game, first), "test")
+    Player.objects.filter(id=first).delete()
+    with django_capture_on_commit_callbacks(execute=True):
+        assert store.flush(hot_game.id) == 1
+    word = GameWord.objects.get(game=hot_game)
+    assert (word.word, word.player_id) == ("test", None)
+    assert store.get(hot_game.id).flushed == 1
+
+
+def test_finished_games_are_flushed_and_dropped(
+    hot_game: Game, store: HotGameStore, flush_task, now, django_capture_on_commit_callbacks
+):
+    for _ in range(hot_game.max_turns + 1):
+        now[0] = store.get(hot_game.id).deadline_at
+        store.run_timers(hot_game.id)
+    assert store.get(hot_game.id).status == GameStatus.FINISHED
+    assert store.run_timers(hot_game.id) is None
+    flush_task.assert_called_once_with(hot_game.id)
+    with django_capture_on_commit_callbacks(execute=True):
+        store.flush(hot_game.id)
+    hot_game.refresh_from_db()
+    assert hot_game.is_finished
+    assert hot_game.winner is not None
+    assert GameWord.objects.filter(game=hot_game).count() == hot_game.max_turns + 1
+    assert not store.is_hot(hot_game.id)
+
+
+def test_game_take_turn_uses_the_hot_state(hot_game: Game, store: HotGameStore):
+    state = store.get(hot_game.id)
+    hot_game.take_turn(session_key(hot_game, state.current), "test")
+    assert store.get(hot_game.id).turn == 1
+    assert hot_game.word_count == 0
+
+
+def test_game_take_turn_requeues_hot_games(
+    hot_game: Game, store: HotGameStore, mocker, settings, now, django_capture_on_commit_callbacks
+):
+    settings.TURN_QUEUE_ENABLED = True
+    queue = MemoryTurnQueue()
+    mocker.patch("shiritori.game.turn_queue.get_turn_queue", return_value=queue)
+    first, second = store.get(hot_game.id).order
+    Player.objects.filter(id=second).update(bot_difficulty=BotDifficulty.EASY)
+    store.load(hot_game)
+    queue.schedule(hot_game.id, hot_game.turn_deadline)
+    with django_capture_on_commit_callbacks(execute=True):
+        hot_game.take_turn(session_key(hot_game, first), "test")
+    think_time = min(6, hot_game.settings.turn_time // 2)
+    assert queue.next_at() == now[0] + timedelta(seconds=think_time)
+
+
+def test_restart_discards_the_hot_state(hot_game: Game, store: HotGameStore):
+    hot_game.restart()
+    assert not store.is_hot(hot_game.id)
@@ -0,0 +1,53 @@
+import pytest
+
+from shiritori.game.dictionary import DictionaryIndex, LetterIndex, get_letter_index, set_dictionary_index
+from shiritori.game.dictionary.letters import MAX_LENGTH_BUCKET
+
+WORDS = ["tea", "test", "toothbrush", "tent", "hello", "hat", "eat", "a"]
+
+
+@pytest.fixture
+def letter_index():
+    return LetterIndex.from_dictionary_index(DictionaryIndex.from_words(WORDS))
+
+
+def test_letter_index_lists_words_by_first_letter_shortest_first(letter_index):
+    assert list(letter_index.words("t")) == ["tea", "tent", "test", "toothbrush"]
+    assert list(letter_index.words("T", min_length=4)) == ["tent", "test", "toothbrush"]
+    assert list(letter_index.words("h", min_length=4)) == ["hello"]
+    assert list(letter_index.words("z")) == []
+
+
+def test_letter_index_counts_words(letter_index):
+    assert letter_index.count("t") == 4
+    assert letter_index.count("t", min_length=5) == 1
+    assert letter_index.count("t", min_length=11) == 0
+    assert letter_index.count("q") == 0
+    assert letter_index.count("") == 0
+
+
+def test_letter_index_filters_words_longer_than_the_last_bucket():
+    long_words = ["x" * MAX_LENGTH_BUCKET, "x" * (MAX_LENGTH_BUCKET + 2)]
+    letter_index = LetterIndex.from_dictionary_index(DictionaryIndex.from_words(long_words))
+    assert letter_index.count("x", min_length=MAX_LENGTH_BUCKET) == 2
+    assert letter_index.count("x", min_length=MAX_LENGTH_BUCKET + 1) == 1
+    assert list(letter_index.words("x", min_length=MAX_LENGTH_BUCKET + 1)) == [long_words[1]]
+
+
+def test_letter_index_counts_transitions(letter_index):
+    assert letter_index.alphabet == ("a", "e", "h", "o", "t")
+    assert letter_index.transitions("t", "t") == 2
+    assert letter_index.transitions("t", "a") == 1
+    assert letter_index.transitions("h", "o") == 1
+    assert letter_index.transitions("a", "a") == 1
+    assert letter_index.transitions("o", "t") == 0
+    assert letter_index.transitions("z", "t") == 0
+    assert letter_index.transitions_from("t") == {"a": 1, "h": 1, "t": 2}
+    assert letter_index.transitions_from("z") == {}
+
+
+@pytest.mark.django_db
+def test_get_letter_index_follows_dictionary_index(sample_words):
+    assert get_letter_index("en").count("t") == 2
+    set_dictionary_index("en", DictionaryIndex.from_words(["tree"]))
+    assert list(get_letter_index("en").words("t")) == ["tree"]
@@ -0,0 +1,62 @@
+import pytest
+from django.core.management import call_command
+
+from shiritori.game.models import Game, Player
+from shiritori.game.serializers import ShiritoriPlayerSerializer
+
+pytestmark = pytest.mark.django_db
+
+
+def test_total_score_adds_up_the_words(finished_game: Game):
+    for player in finished_game.players:
+        words = sum(word.score for word in player.words)
+        assert player.total_score == pytest.approx(words)
+        assert player.score == int(round(words, 0))
+
+
+def test_take_turn_adds_to_the_total_score(mocker, started_game: Game):
+    mocker.patch("shiritori.game.models.game.Word.validate", return_value=True)
+    started_game.turn_time_left = 30
+    started_game.save()
+    first = started_game.current_player
+    started_game.take_turn(first.session_key, started_game.last_word + "ardent")
+    first.refresh_from_db()
+    word = first.words.get()
+    assert first.total_score == word.score > 0
+
+
+def test_full_saves_keep_the_total_score(finished_game: Game):
+    stale = finished_game.players.first()
+    stale.refresh_from_db()
+    Player.objects.filter(id=stale.id).update(total_score=100)
+    stale.name = "Renamed"
+    stale.save()
+    stale.refresh_from_db()
+    assert (stale.name, stale.total_score) == ("Renamed", 100)
+
+
+def test_restart_resets_the_total_score(finished_game: Game):
+    finished_game.restart()
+    assert [player.total_score for player in Player.objects.filter(game=finished_game)] == [0, 0]
+
+
+def test_serializing_players_runs_no_aggregates(finished_game: Game, django_assert_num_queries):
+    players = list(finished_game.players)
+    with django_assert_num_queries(0):
+        players = ShiritoriPlayerSerializer(players, many=True).data
+    assert sorted(player["score"] for player in players) == sorted(player.score for player in finished_game.players)
+
+
+def test_check_player_scores_fixes_mismatches(finished_game: Game, capsys):
+    player = finished_game.players.first()
+    Player.objects.filter(id=player.id).update(total_score=1000)
+    call_command("check_player_scores")
+    assert "1 players have a mismatched total score" in capsys.readouterr().out
+    player.refresh_from_db()
+    assert player.total_score == 1000
+
+    call_command("check_player_scores", "--fix")
+    player.refresh_from_db()
+    assert player.total_score == pytest.approx(sum(word.score for word in player.words))
+    call_command("check_player_scores")
+    assert "Every total score matches its words" in capsys.readouterr().out
@@ -0,0 +1,69 @@
+import logging
+
+import pytest
+from rest_framework.test import APIClient
+
+from shiritori.game import tasks
+from shiritori.game.models import Game, Player
+from shiritori.utils.query_budget import QueryBudgetExceeded, query_budget
+
+pytestmark = pytest.mark.django_db
+
+
+def test_query_budget_counts_queries():
+    with query_budget("test", 2) as record:
+        list(Game.objects.all())
+        list(Player.objects.all())
+    assert record.count == 2
+    assert len(record.statements) == 2
+
+
+def test_query_budget_raises_over_budget():
+    with pytest.raises(QueryBudgetExceeded, match="ran 2 queries, over its budget of 1"):
+        with query_budget("test", 1):
+            list(Game.objects.all())
+            list(Player.objects.all())
+
+
+def test_query_budget_reports_repeated_queries(game: Game, settings):
+    settings.QUERY_BUDGET_REPEAT_LIMIT = 3
+    with pytest.raises(QueryBudgetExceeded, match="ran the same query 4 times"):
+        with query_budget("test", 10):
+            for _ in range(4):
+                Game.objects.filter(id=game.id).first()
+
+
+def test_query_budget_without_budget_only_records():
+    with query_budget("test") as record:
+        for _ in range(20):
+            list(Game.objects.all())
+    assert record.count == 20
+
+
+def test_query_budget_logs_when_not_strict(settings, caplog):
+    settings.QUERY_BUDGET_RAISE = False
+    with caplog.at_level(logging.WARNING, logger="shiritori.utils.query_budget"):
+        with query_budget("test", 0):
+            list(Game.objects.all())
+    assert "test ran 1 queries, over its budget of 0" in caplog.text
+
+
+def test_nested_query_budgets_count_towards_the_outer_one():
+    with query_budget("outer") as outer:
+        list(Game.objects.all())
+        with query_budget("inner", 1) as inner:
+            list(Player.objects.all())
+    assert inner.count == 1
+    assert outer.count == 2
+
+
+def test_viewset_actions_are_checked_against_their_budget(drf: APIClient, game: Game, mocker):
+    mocker.patch.dict("shiritori.game.views.game.GameViewSet.query_budgets", {"retrieve": 0})
+    with pytest.raises(QueryBudgetExceeded, match="GameViewSet.retrieve ran"):
+        drf.get(f"/api/game/{game.id}/")
+
+
+def test_tasks_are_checked_against_their_budget(mocker):
+    mocker.patch.object(tasks.start_game_task, "query_budget", 0)
+    with pytest.raises(QueryBudgetExceeded, match="start_game_task ran 1 queries"):
+        tasks.start_game_task("missing")
@@ -0,0 +1,127 @@
+import json
+
+import pytest
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from shiritori.game import signals
+from shiritori.game.models import Game, GameWord, Player
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def sent(mute_signals, mocker):
+    # Requested after the game fixtures, so the events of setting them up are not part of the test.
+    post_save.connect(signals.game_post_save, sender=Game)
+    post_save.connect(signals.player_post_save, sender=Player)
+    post_save.connect(signals.game_word_post_save, sender=GameWord)
+    post_delete.connect(signals.player_post_delete, sender=Player)
+    sent = []
+    for name in ("send_game_updated", "send_player_joined", "send_player_updated", "send_turn_taken"):
+        mocker.patch.object(signals, name, side_effect=lambda *args, name=name: sent.append(name))
+    mocker.patch.object(signals, "send_player_left", side_effect=lambda *args: sent.append("send_player_left"))
+    return sent
+
+
+def test_a_turn_sends_each_event_once_after_commit(
+    mocker, started_game: Game, sent, django_capture_on_commit_callbacks
+):
+    mocker.patch("shiritori.game.models.game.Word.validate", return_value=True)
+    first = started_game.current_player
+    started_game.turn_time_left = 30
+    started_game.save()
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        started_game.take_turn(first.session_key, started_game.last_word + "ardent")
+        assert sent == []
+    assert len(callbacks) == 1
+    assert sorted(sent) == ["send_game_updated", "send_player_updated", "send_turn_taken"]
+    # The game is sent last, once everything it shows has happened.
+    assert sent[-1] == "send_game_updated"
+
+
+def test_events_of_a_rolled_back_savepoint_are_not_sent(started_game: Game, sent, django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        with transaction.atomic():
+            started_game.save()
+            with pytest.raises(RuntimeError):
+                with transaction.atomic():
+                    started_game.current_player.save()
+                    raise RuntimeError
+    assert sent == ["send_game_updated"]
+
+
+def test_events_of_a_rolled_back_transaction_are_not_sent(game: Game, sent, django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        with pytest.raises(RuntimeError):
+            with transaction.atomic():
+                game.save()
+                raise RuntimeError
+    assert sent == []
+    with django_capture_on_commit_callbacks(execute=True):
+        game.save()
+        game.save()
+    assert sent == ["send_game_updated"]
+
+
+def test_events_are_sent_in_the_order_of_their_last_change(game: Game, sent, django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        game.save()
+        player = game.join("John")
+        game.save()
+        player.save()
+    assert sent == ["send_player_joined", "send_game_updated", "send_player_updated"]
+
+
+def test_game_updated_sends_only_what_changed(mocker, started_game: Game, django_capture_on_commit_callbacks):
+    mocker.patch("shiritori.game.models.game.Word.validate", return_value=True)
+    send = mocker.patch("shiritori.game.events.send_message_to_layer")
+    started_game.turn_time_left = 30
+    started_game.save(update_fields=["turn_deadline"])
+    revision = Game.objects.get(id=started_game.id).revision
+    mocker.patch.object(signals, "send_turn_taken")
+    mocker.patch.object(signals, "send_player_updated")
+    post_save.connect(signals.game_post_save, sender=Game)
+    post_save.connect(signals.game_word_post_save, sender=GameWord)
+    with django_capture_on_commit_callbacks(execute=True):
+        started_game.take_turn(started_game.current_player.session_key, started_game.last_word + "ardent")
+    [(group, message)] = [call.args for call in send.call_args_list]
+    event = json.loads(message["text"])
+    assert event["type"] == message["type"] == "game_updated"
+    assert set(event["data"]) == {
+        "id",
+        "revision",
+        "currentTurn",
+        "currentRound",
+        "currentPlayer",
+        "wordCount",
+        "longestWord",
+        "lastWord",
+        "turnDeadline",
+        "turnTimeLeft",
+    }
+    assert event["data"]["revision"] == revision + 1 == Game.objects.get(id=started_game.id).revision
+
+
+def test_a_new_status_sends_the_whole_game(mocker, started_game: Game, django_capture_on_commit_callbacks):
+    send = mocker.patch("shiritori.game.events.send_message_to_layer")
+    post_save.connect(signals.game_post_save, sender=Game)
+    with django_capture_on_commit_callbacks(execute=True):
+        started_game.finish()
+    event = json.loads(send.call_args.args[1]["text"])
+    assert "players" in event["data"] and "words" in event["data"]
+    assert event["data"]["revision"] == 1
+
+
+def test_bump_revision_is_a_single_query(game: Game, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        assert game.bump_revision() == 1
+    assert Game.objects.get(id=game.id).revision == 1
+
+
+def test_full_saves_keep_the_revision(game: Game):
+    stale = Game.objects.get(id=game.id)
+    game.bump_revision()
+    stale.last_word = "a"
+    stale.save()
+    assert Game.objects.get(id=game.id).revision == 1
@@ -0,0 +1,53 @@
+import dataclasses
+import random
+
+import pytest
+
+from shiritori.game import utils
+from shiritori.game.models import BotDifficulty
+from shiritori.game.simulation import SimulationSettings, load_letter_index, run_simulation, simulate_game
+
+WORDS = ["apple", "eagle", "egg", "gate", "tent", "test", "toothbrush", "hello", "orange", "elephant", "tiger", "rat"]
+
+
+@pytest.fixture
+def dictionary(tmp_path) -> str:
+    path = tmp_path / "words.txt"
+    path.write_text("\n".join(WORDS) + "\n", encoding="utf-8")
+    return str(path)
+
+
+def test_simulate_game_plays_by_the_rules(dictionary: str):
+    settings = SimulationSettings(dictionary, (BotDifficulty.EASY, BotDifficulty.MEDIUM), max_turns=3)
+    result = simulate_game(load_letter_index(dictionary), settings, random.Random(1))
+    assert result.turns == 7
+    assert result.words + result.dead_ends == result.turns
+    assert sorted(difficulty for difficulty, _ in result.scores) == [BotDifficulty.EASY, BotDifficulty.MEDIUM]
+    assert result.winner in (BotDifficulty.EASY, BotDifficulty.MEDIUM)
+
+
+def test_small_dictionaries_run_into_dead_ends(dictionary: str):
+    settings = SimulationSettings(dictionary, (BotDifficulty.MEDIUM,) * 2, max_turns=20, seed=1)
+    report = run_simulation(settings, games=5)
+    assert report.games == 5
+    assert report.turns == 5 * 41
+    assert report.dead_end_games == 5
+    assert 0 < report.dead_end_rate < 1
+    assert len(report.scores[BotDifficulty.MEDIUM]) == 10
+
+
+def test_simulations_are_reproducible(dictionary: str):
+    settings = SimulationSettings(dictionary, (BotDifficulty.EASY, BotDifficulty.MEDIUM), seed=7)
+    first, second = run_simulation(settings, games=3), run_simulation(settings, games=3, processes=2)
+    assert sorted(first.scores[BotDifficulty.EASY]) == sorted(second.scores[BotDifficulty.EASY])
+    assert sorted(first.game_times) == sorted(second.game_times)
+
+
+def test_scoring_rules_can_be_replaced(dictionary: str):
+    settings = SimulationSettings(
+        dictionary, (BotDifficulty.MEDIUM,) * 2, max_turns=20, seed=1, missed_word_penalty=-10
+    )
+    harsh = run_simulation(settings, games=3)
+    lenient = run_simulation(dataclasses.replace(settings, missed_word_penalty=0), games=3)
+    assert sum(harsh.scores[BotDifficulty.MEDIUM]) < sum(lenient.scores[BotDifficulty.MEDIUM])
+    assert utils.MISSED_WORD_PENALTY == -0.25
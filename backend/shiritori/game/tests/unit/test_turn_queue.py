@@ -0,0 +1,122 @@
+import uuid
+from datetime import timedelta
+
+import pytest
+import redis
+from django.utils import timezone
+
+from shiritori.game.models import Game
+from shiritori.game.turn_queue import MemoryTurnQueue, RedisTurnQueue, TurnQueueWorker, enqueue_game
+
+
+@pytest.fixture(params=["memory", "redis"])
+def turn_queue(request, settings):
+    if request.param == "memory":
+        yield MemoryTurnQueue()
+        return
+    queue = RedisTurnQueue.from_url(settings.TURN_QUEUE_URL, key=f"shiritori:test-turn-queue:{uuid.uuid4().hex}")
+    try:
+        queue.client.ping()
+    except redis.ConnectionError:
+        pytest.skip("Redis is not running")
+    yield queue
+    queue.client.delete(queue.key)
+
+
+@pytest.fixture
+def now(mocker):
+    now = timezone.now()
+    mocker.patch("django.utils.timezone.now", return_value=now)
+    mocker.patch("shiritori.game.events.send_game_timer_updated", return_value=None)
+    return now
+
+
+def test_turn_queue_orders_games_by_time(turn_queue):
+    now = timezone.now()
+    assert turn_queue.next_at() is None
+    turn_queue.schedule("later", now + timedelta(seconds=10))
+    turn_queue.schedule("sooner", now + timedelta(seconds=5))
+    assert len(turn_queue) == 2
+    assert turn_queue.next_at() == now + timedelta(seconds=5)
+    turn_queue.schedule("sooner", now + timedelta(seconds=20))
+    assert turn_queue.next_at() == now + timedelta(seconds=10)
+    turn_queue.cancel("later")
+    turn_queue.cancel("missing")
+    assert len(turn_queue) == 1
+
+
+def test_turn_queue_claims_due_games_once(turn_queue):
+    now = timezone.now()
+    for i in range(5):
+        turn_queue.schedule(f"game{i}", now - timedelta(seconds=i))
+    turn_queue.schedule("future", now + timedelta(seconds=5))
+    first = turn_queue.claim(now, lease=2, limit=3)
+    second = turn_queue.claim(now, lease=2, limit=3)
+    assert first == ["game4", "game3", "game2"]
+    assert second == ["game1", "game0"]
+    assert turn_queue.claim(now, lease=2, limit=3) == []
+    assert len(turn_queue) == 6
+
+
+def test_turn_queue_returns_games_of_dead_workers(turn_queue):
+    now = timezone.now()
+    turn_queue.schedule("game", now)
+    assert turn_queue.claim(now, lease=2, limit=10) == ["game"]
+    # The worker dies without rescheduling the game.
+    assert turn_queue.claim(now + timedelta(seconds=1), lease=2, limit=10) == []
+    assert turn_queue.claim(now + timedelta(seconds=2), lease=2, limit=10) == ["game"]
+
+
+@pytest.mark.django_db
+def test_worker_ends_expired_turns(started_game: Game, now):
+    Game.objects.filter(id=started_game.id).update(turn_deadline=now - timedelta(seconds=1))
+    queue = MemoryTurnQueue()
+    queue.schedule(started_game.id, now - timedelta(seconds=1))
+    assert TurnQueueWorker(queue).tick() == 1
+    assert started_game.word_count == 1
+    assert queue.next_at() == now + timedelta(seconds=started_game.settings.turn_time)
+
+
+@pytest.mark.django_db
+def test_workers_share_the_queue(started_game: Game, now):
+    Game.objects.filter(id=started_game.id).update(turn_deadline=now - timedelta(seconds=1))
+    queue = MemoryTurnQueue()
+    queue.schedule(started_game.id, now)
+    first, second = TurnQueueWorker(queue), TurnQueueWorker(queue)
+    assert first.tick() + second.tick() == 1
+    assert started_game.word_count == 1
+
+
+@pytest.mark.django_db
+def test_worker_drops_games_it_does_not_run(started_game: Game, finished_game: Game, now):
+    Game.objects.filter(id=started_game.id).update(task_id="loop", turn_deadline=now - timedelta(seconds=1))
+    queue = MemoryTurnQueue()
+    queue.schedule(started_game.id, now)
+    queue.schedule(finished_game.id, now)
+    assert TurnQueueWorker(queue).tick() == 2
+    assert len(queue) == 0
+    assert started_game.word_count == 0
+
+
+@pytest.mark.django_db
+def test_taking_a_turn_enqueues_the_game(started_game: Game, now, mocker, settings, django_capture_on_commit_callbacks):
+    settings.TURN_QUEUE_ENABLED = True
+    queue = MemoryTurnQueue()
+    mocker.patch("shiritori.game.turn_queue.get_turn_queue", return_value=queue)
+    mocker.patch("shiritori.game.models.game.Word.validate", return_value=True)
+    Game.objects.filter(id=started_game.id).update(turn_deadline=now + timedelta(seconds=5))
+    started_game.refresh_from_db()
+    with django_capture_on_commit_callbacks(execute=True):
+        started_game.take_turn(started_game.current_player.session_key, started_game.last_word + "est")
+    assert queue.next_at() == now + timedelta(seconds=started_game.settings.turn_time)
+
+
+@pytest.mark.django_db
+def test_enqueue_game_cancels_finished_games(finished_game: Game, mocker, settings, django_capture_on_commit_callbacks):
+    settings.TURN_QUEUE_ENABLED = True
+    queue = MemoryTurnQueue()
+    queue.schedule(finished_game.id, timezone.now())
+    mocker.patch("shiritori.game.turn_queue.get_turn_queue", return_value=queue)
+    with django_capture_on_commit_callbacks(execute=True):
+        enqueue_game(finished_game)
+    assert len(queue) == 0
@@ -0,0 +1,128 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from shiritori.game.models import BotDifficulty, Game, GameStatus, PlayerType
+from shiritori.game.timers import TurnTimerService
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def now(mocker):
+    now = timezone.now()
+    mocker.patch("django.utils.timezone.now", return_value=now)
+    mocker.patch("shiritori.game.events.send_game_timer_updated", return_value=None)
+    return now
+
+
+@pytest.fixture
+def owned_game(started_game: Game, now):
+    started_game.task_id = "owner"
+    started_game.turn_deadline = now + timedelta(seconds=10)
+    started_game.save()
+    return started_game
+
+
+def test_run_timers_waits_for_the_deadline(owned_game: Game):
+    assert Game.run_timers(owned_game.id, "owner") == owned_game.turn_deadline
+    assert owned_game.word_count == 0
+
+
+def test_run_timers_idle_tick_is_one_query(owned_game: Game, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        assert Game.run_timers(owned_game.id, "owner") == owned_game.turn_deadline
+    with django_assert_num_queries(1):
+        assert Game.run_timers(owned_game.id, "stale") is None
+
+
+def test_run_timers_ends_expired_turns(owned_game: Game, now):
+    first_player = owned_game.current_player
+    Game.objects.filter(id=owned_game.id).update(turn_deadline=now - timedelta(seconds=1))
+    next_timer_at = Game.run_timers(owned_game.id, "owner")
+    owned_game.refresh_from_db()
+    assert next_timer_at == now + timedelta(seconds=owned_game.settings.turn_time)
+    assert owned_game.word_count == 1
+    assert owned_game.current_player != first_player
+
+
+def test_run_timers_is_fenced_by_task_id(owned_game: Game, now):
+    Game.objects.filter(id=owned_game.id).update(turn_deadline=now - timedelta(seconds=1))
+    assert Game.run_timers(owned_game.id, "stale") is None
+    assert owned_game.word_count == 0
+
+
+def test_run_timers_stops_for_finished_games(owned_game: Game):
+    Game.objects.filter(id=owned_game.id).update(status=GameStatus.FINISHED)
+    assert Game.run_timers(owned_game.id, "owner") is None
+
+
+def test_run_timers_wakes_up_for_bots(owned_game: Game, now, django_assert_num_queries):
+    bot = owned_game.current_player
+    bot.type = PlayerType.BOT
+    bot.bot_difficulty = BotDifficulty.EASY
+    bot.save()
+    Game.objects.filter(id=owned_game.id).update(turn_deadline=now + timedelta(seconds=owned_game.settings.turn_time))
+    think_time = timedelta(seconds=min(6, owned_game.settings.turn_time // 2))
+    with django_assert_num_queries(1):
+        assert Game.run_timers(owned_game.id, "owner") == now + think_time
+
+
+def test_service_claims_unowned_and_abandoned_games(started_game: Game, finished_game: Game, owned_game: Game, now):
+    abandoned = Game.objects.create(status=GameStatus.PLAYING, task_id="dead", turn_deadline=now - timedelta(hours=1))
+    unowned = Game.objects.create(status=GameStatus.PLAYING, turn_deadline=now + timedelta(seconds=10))
+    service = TurnTimerService("service")
+    service.poll()
+    assert set(Game.objects.filter(task_id="service").values_list("id", flat=True)) == {abandoned.id, unowned.id}
+    assert service.pop_due(now) == sorted([abandoned.id, unowned.id])
+    assert len(service) == 0
+
+
+def test_service_fires_due_games(owned_game: Game, now):
+    service = TurnTimerService("owner")
+    service.poll()
+    Game.objects.filter(id=owned_game.id).update(turn_deadline=now - timedelta(seconds=1))
+    assert service.fire_due() == 1
+    assert owned_game.word_count == 1
+    assert service.next_at() == now + timedelta(seconds=owned_game.settings.turn_time)
+    assert service.fire_due() == 0
+
+
+def test_service_reschedules_games_whose_deadline_moved(owned_game: Game, now):
+    service = TurnTimerService("owner")
+    service.poll()
+    service.fire_due()
+    assert service.next_at() == owned_game.turn_deadline
+    Game.objects.filter(id=owned_game.id).update(turn_deadline=now + timedelta(seconds=30))
+    service.poll()
+    assert service.next_at() == now
+
+
+def test_service_drops_games_it_lost(owned_game: Game, now):
+    service = TurnTimerService("owner")
+    service.poll()
+    Game.objects.filter(id=owned_game.id).update(task_id="other", turn_deadline=now - timedelta(seconds=1))
+    service.fire_due()
+    assert owned_game.word_count == 0
+    assert service.next_at() is None
+
+
+def test_service_releases_its_games(owned_game: Game):
+    service = TurnTimerService("owner")
+    service.poll()
+    assert service.release() == 1
+    owned_game.refresh_from_db()
+    assert owned_game.task_id is None
+    assert len(service) == 0
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test_start_game_countdown_leaves_timers_to_the_service(unstarted_game: Game, mocker, settings, enabled: bool):
+    from shiritori.game import tasks
+
+    settings.TURN_TIMER_SERVICE_ENABLED = enabled
+    mocker.patch.object(tasks, "send_game_start_countdown_end")
+    delay = mocker.patch.object(tasks.game_worker_task, "delay")
+    tasks.start_game_countdown_task(unstarted_game.id, 0)
+    assert delay.called is not enabled
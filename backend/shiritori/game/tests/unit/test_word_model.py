@@ -0,0 +1,160 @@
+import importlib
+
+import pytest
+from django.apps import apps
+from django.db import connection
+
+from shiritori.game.models import DictionaryVersion, GameWord, Word
+
+pytestmark = pytest.mark.django_db
+
+
+def test_word_is_stored_normalized():
+    word = Word.objects.create(word="HeLLo")
+    word.refresh_from_db()
+    assert word.word == "hello"
+
+
+def test_word_lookup_is_normalized():
+    Word.objects.create(word="hello")
+    assert Word.objects.filter(word="HELLO").exists()
+    assert "UPPER" not in str(Word.objects.filter(word="HELLO").query)
+
+
+def test_bulk_created_words_are_normalized():
+    Word.objects.bulk_create([Word(word="ＡＢＣ"), Word(word="Test")])
+    assert set(Word.objects.values_list("word", flat=True)) == {"abc", "test"}
+
+
+def test_word_validate_without_index(settings):
+    settings.DICTIONARY_INDEX_ENABLED = False
+    Word.objects.create(word="hello")
+    assert Word.validate("Hello")
+    assert not Word.validate("world")
+
+
+def test_game_word_duplicate_check_is_normalized(started_game, sample_words):
+    GameWord.objects.create(word="TEST", game=started_game)
+    assert started_game.gameword_set.filter(word="test").exists()
+    assert started_game.gameword_set.get().word == "test"
+
+
+def test_normalize_words_migration_keeps_duplicate_turns(started_game):
+    migration = importlib.import_module("shiritori.game.migrations.0006_normalize_words")
+    Word.objects.bulk_create([Word(word="test"), Word(word="other")])
+    first = GameWord.objects.create(word="test", game=started_game, score=5)
+    second = GameWord.objects.create(word="other", game=started_game, score=3)
+    with connection.cursor() as cursor:
+        cursor.execute("UPDATE word SET word = 'Test' WHERE word = 'other'")
+        cursor.execute("UPDATE game_word SET word = 'Test' WHERE id = %s", [second.id])
+    migration.normalize_words(apps, None)
+    assert list(Word.objects.values_list("word", flat=True)) == ["test"]
+    assert GameWord.objects.get(id=first.id).word == "test"
+    assert GameWord.objects.get(id=second.id).word == "Test"
+
+
+@pytest.fixture()
+def dictionary_file(settings, tmp_path):
+    (tmp_path / "dictionaries").mkdir()
+    path = tmp_path / "dictionaries" / "en.txt"
+    path.write_text("apple\nBanana\n\ncherry\napple\n", encoding="utf-8")
+    settings.BASE_DIR = tmp_path
+    yield path
+
+
+def test_load_dictionary_returns_counts(dictionary_file):
+    reported = []
+    result = Word.load_dictionary("en", progress=reported.append)
+    assert result.read == 4
+    assert result.created == 3
+    assert reported[-1] == 4
+    assert set(Word.objects.values_list("word", flat=True)) == {"apple", "banana", "cherry"}
+
+
+def test_load_unchanged_dictionary_is_skipped(dictionary_file, django_assert_max_num_queries):
+    first = Word.load_dictionary("en")
+    with django_assert_max_num_queries(1):
+        result = Word.load_dictionary("en")
+    assert result.unchanged
+    assert result.version == first.version
+    assert result.created == 0
+    assert DictionaryVersion.objects.count() == 1
+    assert Word.objects.count() == 3
+
+
+def test_load_changed_dictionary_applies_diff(dictionary_file):
+    first = Word.load_dictionary("en")
+    dictionary_file.write_text("apple\nbanana\ndate\n", encoding="utf-8")
+    result = Word.load_dictionary("en")
+    assert result.version != first.version
+    assert result.created == 1
+    assert result.removed == 1
+    assert set(Word.get_words("en").values_list("word", flat=True)) == {"apple", "banana", "date"}
+    version = DictionaryVersion.get_current("en")
+    assert (version.word_count, version.added_count, version.removed_count) == (3, 1, 1)
+
+
+def test_load_dictionary_restores_removed_words(dictionary_file, started_game):
+    Word.load_dictionary("en")
+    started_game.start()
+    dictionary_file.write_text("apple\n", encoding="utf-8")
+    Word.load_dictionary("en")
+    dictionary_file.write_text("apple\ncherry\n", encoding="utf-8")
+    result = Word.load_dictionary("en")
+    assert result.created == 1
+    assert Word.validate("cherry")
+    assert not Word.validate("banana")
+
+
+def test_restored_word_keeps_its_original_version(dictionary_file, started_game):
+    first = Word.load_dictionary("en")
+    started_game.start()
+    dictionary_file.write_text("apple\nbanana\n", encoding="utf-8")
+    Word.load_dictionary("en")
+    dictionary_file.write_text("apple\nbanana\ncherry\n", encoding="utf-8")
+    Word.load_dictionary("en")
+    assert Word.objects.get(word="cherry").added_in_id == first.version
+    assert Word.validate("cherry", version=first.version)
+    assert Word.validate("cherry")
+
+
+def test_restored_word_stays_out_of_the_versions_it_was_removed_in(dictionary_file, started_game):
+    first = Word.load_dictionary("en")
+    started_game.start()
+    dictionary_file.write_text("apple\nbanana\n", encoding="utf-8")
+    removed = Word.load_dictionary("en")
+    dictionary_file.write_text("apple\nbanana\ncherry\n", encoding="utf-8")
+    restored = Word.load_dictionary("en")
+    assert Word.validate("cherry", version=first.version)
+    assert not Word.validate("cherry", version=removed.version)
+    assert Word.validate("cherry", version=restored.version)
+    assert Word.validate("cherry")
+
+
+def test_in_flight_game_keeps_its_dictionary_version(dictionary_file, started_game):
+    Word.load_dictionary("en")
+    started_game.start()
+    dictionary_file.write_text("apple\nbanana\ndate\n", encoding="utf-8")
+    Word.load_dictionary("en")
+    old_version = started_game.dictionary_version_id
+    assert Word.validate("cherry", version=old_version)
+    assert not Word.validate("date", version=old_version)
+    assert not Word.validate("cherry")
+    assert Word.validate("date")
+
+
+def test_removed_words_are_pruned_once_no_game_needs_them(dictionary_file, started_game):
+    Word.load_dictionary("en")
+    started_game.start()
+    dictionary_file.write_text("apple\nbanana\n", encoding="utf-8")
+    Word.load_dictionary("en")
+    assert Word.objects.filter(word="cherry").exists()
+    started_game.finish()
+    assert Word.prune_removed_words("en") == 1
+    assert not Word.objects.filter(word="cherry").exists()
+
+
+def test_load_dictionary_refreshes_index(dictionary_file):
+    assert not Word.validate("banana")
+    Word.load_dictionary("en")
+    assert Word.validate("banana")
@@ -0,0 +1,167 @@
+import asyncio
+import heapq
+import logging
+import uuid
+from datetime import datetime, timedelta
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+from django.db.models import Q
+from django.utils import timezone
+
+from shiritori.game.models import Game, GameStatus
+
+__all__ = ("TurnTimerService",)
+
+logger = logging.getLogger(__name__)
+
+
+class TurnTimerService:
+    """
+    Runs the turn timers of every game it owns from a single asyncio event loop,
+    instead of one blocking ``game_worker_task`` per game.
+
+    Each game is a single entry in a heap ordered by the time it next needs its timers run,
+    so the service sleeps until the earliest one and only touches a game when a turn ends or a bot answers.
+    Every ``TURN_TIMER_POLL_INTERVAL`` seconds it claims games that have no owner, or whose owner stopped
+    ending their turns ``TURN_TIMER_CLAIM_GRACE`` seconds ago, by writing its token into ``Game.task_id``.
+    The same ``task_id`` fencing as the turn loop applies: ``Game.run_timers`` only acts on a game whose
+    ``task_id`` is still the service's token, so a service that lost a game drops it the next time it fires.
+
+    Database work runs in Django's sync thread, one game at a time.
+    """
+
+    def __init__(self, token: str | None = None):
+        self.token = token or f"timers:{uuid.uuid4().hex}"
+        self._heap: list[tuple[datetime, str]] = []
+        self._scheduled: dict[str, datetime] = {}
+        self._deadlines: dict[str, datetime | None] = {}
+
+    def __len__(self) -> int:
+        return len(self._scheduled)
+
+    def schedule(self, game_id: str, at: datetime) -> None:
+        """
+        Run a game's timers at the given time, replacing the time it was scheduled for.
+        :param game_id: str - The id of the game.
+        :param at: datetime - When to run the game's timers.
+        """
+        if self._scheduled.get(game_id) == at:
+            return
+        self._scheduled[game_id] = at
+        heapq.heappush(self._heap, (at, game_id))
+
+    def unschedule(self, game_id: str) -> None:
+        """
+        Stop running a game's timers.
+        :param game_id: str - The id of the game.
+        """
+        self._scheduled.pop(game_id, None)
+        self._deadlines.pop(game_id, None)
+
+    def next_at(self) -> datetime | None:
+        """
+        When the earliest scheduled game needs its timers run.
+        :return: datetime | None - The time, or None if no game is scheduled.
+        """
+        while self._heap and self._scheduled.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)  # replaced or unscheduled
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: datetime) -> list[str]:
+        """
+        Take every game whose timers are due off the heap.
+        :param now: datetime - The current time.
+        :return: list[str] - The ids of the due games.
+        """
+        due = []
+        while (at := self.next_at()) is not None and at <= now:
+            _, game_id = heapq.heappop(self._heap)
+            del self._scheduled[game_id]
+            due.append(game_id)
+        return due
+
+    def poll(self) -> None:
+        """
+        Claim unowned and abandoned games, and reschedule owned games whose turn deadline moved,
+        e.g. because a player took their turn.
+        """
+        close_old_connections()
+        now = timezone.now()
+        abandoned_before = now - timedelta(seconds=settings.TURN_TIMER_CLAIM_GRACE)
+        claimed = (
+            Game.objects.filter(status=GameStatus.PLAYING)
+            .filter(Q(task_id__isnull=True) | Q(turn_deadline__lt=abandoned_before))
+            .exclude(task_id=self.token)
+            .update(task_id=self.token)
+        )
+        if claimed:
+            logger.info("Claimed %s games", claimed)
+        owned = dict(
+            Game.objects.filter(status=GameStatus.PLAYING, task_id=self.token).values_list("id", "turn_deadline")
+        )
+        for game_id in self._deadlines.keys() - owned.keys():
+            self.unschedule(game_id)
+        for game_id, deadline in owned.items():
+            if game_id not in self._deadlines or self._deadlines[game_id] != deadline:
+                self._deadlines[game_id] = deadline
+                self.schedule(game_id, now)
+
+    def fire(self, game_id: str) -> None:
+        """
+        Run a game's due timers and schedule it for the next time it needs them.
+        :param game_id: str - The id of the game.
+        """
+        try:
+            next_timer_at = Game.run_timers(game_id, self.token)
+        except Exception:
+            logger.exception("Running the timers of game %s failed", game_id)
+            next_timer_at = timezone.now() + timedelta(seconds=settings.TURN_TIMER_POLL_INTERVAL)
+        if next_timer_at is None:
+            self.unschedule(game_id)
+            return
+        self._deadlines[game_id] = Game.objects.filter(id=game_id).values_list("turn_deadline", flat=True).first()
+        self.schedule(game_id, next_timer_at)
+
+    def fire_due(self) -> int:
+        """
+        Run the timers of every game that is due.
+        :return: int - The number of games whose timers ran.
+        """
+        due = self.pop_due(timezone.now())
+        for game_id in due:
+            self.fire(game_id)
+        return len(due)
+
+    def release(self) -> int:
+        """
+        Give up every owned game so another service can claim it right away.
+        :return: int - The number of games released.
+        """
+        self._heap.clear()
+        self._scheduled.clear()
+        self._deadlines.clear()
+        return Game.objects.filter(task_id=self.token).update(task_id=None)
+
+    async def run(self, stop: asyncio.Event | None = None) -> None:
+        """
+        Run timers until ``stop`` is set, then release the owned games.
+        :param stop: asyncio.Event | None - Set to stop the service.
+        """
+        stop = stop or asyncio.Event()
+        poll_interval = settings.TURN_TIMER_POLL_INTERVAL
+        next_poll = timezone.now()
+        try:
+            while not stop.is_set():
+                if timezone.now() >= next_poll:
+                    await sync_to_async(self.poll)()
+                    next_poll = timezone.now() + timedelta(seconds=poll_interval)
+                await sync_to_async(self.fire_due)()
+                wake_at = min(filter(None, (self.next_at(), next_poll)))
+                try:
+                    await asyncio.wait_for(stop.wait(), max((wake_at - timezone.now()).total_seconds(), 0))
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            await sync_to_async(self.release)()
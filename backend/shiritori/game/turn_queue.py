@@ -0,0 +1,229 @@
+import functools
+import logging
+import threading
+import uuid
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+
+import redis
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+
+from shiritori.game.models import Game
+
+__all__ = (
+    "TURN_QUEUE_KEY",
+    "RedisTurnQueue",
+    "MemoryTurnQueue",
+    "get_turn_queue",
+    "enqueue_game",
+    "enqueue_game_at",
+    "TurnQueueWorker",
+)
+
+logger = logging.getLogger(__name__)
+
+TURN_QUEUE_KEY = "shiritori:turn-queue"
+
+# Takes the due entries and pushes them a lease into the future in one step,
+# so no two workers claim the same entry, and an entry whose worker dies becomes due again.
+CLAIM_SCRIPT = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, tonumber(ARGV[3]))
+for _, game_id in ipairs(due) do
+    redis.call('ZADD', KEYS[1], ARGV[2], game_id)
+end
+return due
+"""
+
+
+def _to_score(at: datetime) -> float:
+    return at.timestamp()
+
+
+def _from_score(score: float) -> datetime:
+    return datetime.fromtimestamp(score, tz=dt_timezone.utc)
+
+
+class RedisTurnQueue:
+    """
+    A sorted set of game ids scored by the time the game next needs its timers run,
+    shared by every turn queue worker.
+    """
+
+    def __init__(self, client: redis.Redis, key: str = TURN_QUEUE_KEY):
+        self.client = client
+        self.key = key
+        self._claim = client.register_script(CLAIM_SCRIPT)
+
+    @classmethod
+    def from_url(cls, url: str, key: str = TURN_QUEUE_KEY) -> "RedisTurnQueue":
+        return cls(redis.Redis.from_url(url, decode_responses=True), key)
+
+    def __len__(self) -> int:
+        return self.client.zcard(self.key)
+
+    def schedule(self, game_id: str, at: datetime) -> None:
+        """
+        Run a game's timers at the given time, replacing the time it was scheduled for.
+        :param game_id: str - The id of the game.
+        :param at: datetime - When to run the game's timers.
+        """
+        self.client.zadd(self.key, {game_id: _to_score(at)})
+
+    def cancel(self, game_id: str) -> None:
+        """
+        Stop running a game's timers.
+        :param game_id: str - The id of the game.
+        """
+        self.client.zrem(self.key, game_id)
+
+    def next_at(self) -> datetime | None:
+        """
+        When the earliest game in the queue needs its timers run.
+        :return: datetime | None - The time, or None if the queue is empty.
+        """
+        first = self.client.zrange(self.key, 0, 0, withscores=True)
+        return _from_score(first[0][1]) if first else None
+
+    def claim(self, now: datetime, lease: float, limit: int) -> list[str]:
+        """
+        Claim the games that are due. A claimed game is due again once the lease runs out,
+        unless the claiming worker reschedules or cancels it first.
+        :param now: datetime - The current time.
+        :param lease: float - The seconds a worker has to handle the claimed games.
+        :param limit: int - The maximum number of games to claim.
+        :return: list[str] - The ids of the claimed games.
+        """
+        return self._claim(keys=[self.key], args=[_to_score(now), _to_score(now) + lease, limit])
+
+
+class MemoryTurnQueue:
+    """
+    An in-process stand-in for ``RedisTurnQueue`` with the same claim semantics,
+    for tests and single process development servers.
+    """
+
+    def __init__(self):
+        self._scores: dict[str, datetime] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def schedule(self, game_id: str, at: datetime) -> None:
+        with self._lock:
+            self._scores[game_id] = at
+
+    def cancel(self, game_id: str) -> None:
+        with self._lock:
+            self._scores.pop(game_id, None)
+
+    def next_at(self) -> datetime | None:
+        with self._lock:
+            return min(self._scores.values(), default=None)
+
+    def claim(self, now: datetime, lease: float, limit: int) -> list[str]:
+        with self._lock:
+            due = sorted((at, game_id) for game_id, at in self._scores.items() if at <= now)[:limit]
+            for _, game_id in due:
+                self._scores[game_id] = now + timedelta(seconds=lease)
+            return [game_id for _, game_id in due]
+
+
+@functools.cache
+def get_turn_queue() -> RedisTurnQueue | MemoryTurnQueue:
+    """
+    Get the turn queue of this process, set by ``TURN_QUEUE_URL``. ``memory://`` uses an in-process queue.
+    :return: RedisTurnQueue | MemoryTurnQueue - The turn queue.
+    """
+    if settings.TURN_QUEUE_URL == "memory://":
+        return MemoryTurnQueue()
+    return RedisTurnQueue.from_url(settings.TURN_QUEUE_URL)
+
+
+def enqueue_game(game: Game) -> None:
+    """
+    Put a game in the turn queue for the next time it needs its timers run, once the current transaction commits.
+    Does nothing unless ``TURN_QUEUE_ENABLED`` is set.
+    :param game: Game - The game.
+    """
+    if not settings.TURN_QUEUE_ENABLED:
+        return
+    enqueue_game_at(game.id, game.next_timer_at())
+
+
+def enqueue_game_at(game_id: str, next_timer_at: datetime | None) -> None:
+    """
+    Put a game in the turn queue for a given time once the current transaction commits, e.g. for a hot game,
+    whose next timer is read from the hot state. Does nothing unless ``TURN_QUEUE_ENABLED`` is set.
+    :param game_id: str - The id of the game.
+    :param next_timer_at: datetime | None - When the game next needs its timers run, None to take it out of the queue.
+    """
+    if not settings.TURN_QUEUE_ENABLED:
+        return
+
+    def enqueue():
+        queue = get_turn_queue()
+        if next_timer_at is None:
+            queue.cancel(game_id)
+        else:
+            queue.schedule(game_id, next_timer_at)
+
+    transaction.on_commit(enqueue)
+
+
+class TurnQueueWorker:
+    """
+    Runs the timers of the games in the turn queue. Workers are stateless, so any number of them can share a queue.
+
+    Each tick a worker claims up to ``TURN_QUEUE_BATCH`` due games, runs their timers and puts them back
+    for the next time they need them. A worker that dies leaves its claimed games in the queue,
+    where they are due again after ``TURN_QUEUE_LEASE`` seconds and the next tick of any worker takes them.
+    Games run this way have no ``task_id``, and ``Game.run_timers`` locks the game,
+    so a game claimed twice after a slow tick still only has its turn ended once.
+    """
+
+    def __init__(self, queue: RedisTurnQueue | MemoryTurnQueue | None = None, name: str | None = None):
+        self.queue = queue or get_turn_queue()
+        self.name = name or f"turn-queue:{uuid.uuid4().hex}"
+
+    def run_game(self, game_id: str) -> None:
+        """
+        Run a claimed game's timers and put it back in the queue for the next time it needs them.
+        :param game_id: str - The id of the game.
+        """
+        try:
+            next_timer_at = Game.run_timers(game_id, None)
+        except Exception:
+            # Leave the game claimed, it is retried once the lease runs out.
+            logger.exception("Running the timers of game %s failed", game_id)
+            return
+        if next_timer_at is None:
+            self.queue.cancel(game_id)
+        else:
+            self.queue.schedule(game_id, next_timer_at)
+
+    def tick(self) -> int:
+        """
+        Run the timers of the games that are due.
+        :return: int - The number of games whose timers ran.
+        """
+        close_old_connections()
+        game_ids = self.queue.claim(timezone.now(), settings.TURN_QUEUE_LEASE, settings.TURN_QUEUE_BATCH)
+        for game_id in game_ids:
+            self.run_game(game_id)
+        return len(game_ids)
+
+    def run(self, stop: threading.Event) -> None:
+        """
+        Run ticks until ``stop`` is set, sleeping until the next game is due but at most one tick interval.
+        :param stop: threading.Event - Set to stop the worker.
+        """
+        while not stop.is_set():
+            if self.tick() >= settings.TURN_QUEUE_BATCH:
+                continue
+            timeout = settings.TURN_QUEUE_TICK
+            if (next_at := self.queue.next_at()) is not None:
+                timeout = min(max((next_at - timezone.now()).total_seconds(), 0), timeout)
+            stop.wait(timeout)
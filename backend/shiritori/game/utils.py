@@ -8,7 +8,7 @@ from asgiref.sync import async_to_sync
 from channels.layers import get_channel_layer
 
 if typing.TYPE_CHECKING:
-    from shiritori.game.events import EventDict
+    from shiritori.game.events import EncodedEventDict
 
 LENGTH_MODIFIER = 1.25
 UNUSED_LETTER_MODIFIER = 1.5
@@ -16,6 +16,8 @@ MISSED_WORD_PENALTY = -0.25
 # The modifiers are applied in order, so the first one that matches is used.
 # The duration is in seconds. The score is multiplied by the modifier.
 DURATION_MODIFIERS = {5: 1.8, 10: 1.5, 15: 1.2}
+# The longest the turn loop sleeps before checking the game again, in seconds.
+TURN_LOOP_INTERVAL = 1.25
 
 
 def case_insensitive_equal(a: str, b: str) -> bool:
@@ -78,20 +80,20 @@ def generate_random_letter():
     return random.choice(string.ascii_lowercase)
 
 
-def send_message_to_layer(channel_name: str, message: "EventDict"):
+def send_message_to_layer(channel_name: str, message: "EncodedEventDict"):
     """
     Send a message to a channel layer.
     :param channel_name: str - The channel name to send the message to.
-    :param message: dict - The message to send.
+    :param message: dict - The message to send, encoded by ``encode_event``.
     """
     return async_to_sync(asend_message_to_layer)(channel_name, message)
 
 
-async def asend_message_to_layer(channel_name: str, message: "EventDict"):
+async def asend_message_to_layer(channel_name: str, message: "EncodedEventDict"):
     """
     Send a message to a channel layer.
     :param channel_name: str - The channel name to send the message to.
-    :param message: dict - The message to send.
+    :param message: dict - The message to send, encoded by ``encode_event``.
     """
     if channel_layer := get_channel_layer():
         try:
@@ -101,8 +103,8 @@ async def asend_message_to_layer(channel_name: str, message: "EventDict"):
             print(f"Error sending message to channel layer: {error}")
 
 
-def wait():
-    time.sleep(1.25)
+def wait(seconds: float = TURN_LOOP_INTERVAL):
+    time.sleep(seconds)
 
 
 def mock_stream_closer():
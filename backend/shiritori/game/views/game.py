@@ -11,6 +11,7 @@ from rest_framework.viewsets import ReadOnlyModelViewSet
 from shiritori.game.auth import RequiresSessionAuth
 from shiritori.game.models import Game
 from shiritori.game.serializers import (
+    AddBotSerializer,
     CreateStartGameSerializer,
     EmptySerializer,
     JoinGameSerializer,
@@ -18,15 +19,27 @@ from shiritori.game.serializers import (
     ShiritoriTurnSerializer,
 )
 from shiritori.game.tasks import start_game_task
+from shiritori.utils.query_budget import QueryBudgetViewSetMixin
 
 __all__ = ("GameViewSet",)
 
 
-class GameViewSet(ReadOnlyModelViewSet):
+class GameViewSet(QueryBudgetViewSetMixin, ReadOnlyModelViewSet):
     queryset = Game.objects.all()
     serializer_class = ShiritoriGameSerializer
     authentication_classes = []
     permission_classes = []
+    # Listing serializes every game, so it has no fixed budget.
+    query_budgets = {
+        "create": 25,
+        "retrieve": 15,
+        "start": 35,
+        "restart": 25,
+        "join": 15,
+        "bot": 15,
+        "turn": 25,
+        "leave": 15,
+    }
 
     def handle_exception(self, exc: Exception) -> Response:
         if isinstance(exc, ValidationError):
@@ -50,6 +63,8 @@ class GameViewSet(ReadOnlyModelViewSet):
                 return ShiritoriTurnSerializer
             case "join":
                 return JoinGameSerializer
+            case "bot":
+                return AddBotSerializer
             case "leave":
                 return EmptySerializer
             case _:
@@ -98,11 +113,21 @@ class GameViewSet(ReadOnlyModelViewSet):
             headers=headers,
         )
 
+    @extend_schema(responses={201: inline_serializer("Bot", {"id": CharField(read_only=True)})})
     @action(detail=True, methods=["post"], authentication_classes=[RequiresSessionAuth])
-    def turn(self, request, pk=None):
+    def bot(self, request, pk=None):
         game = self.get_object()
+        serializer: AddBotSerializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        player = game.add_bot(serializer.validated_data["difficulty"], session_key=request.session.session_key)
+        return Response(data={"id": player.id}, status=status.HTTP_201_CREATED)
+
+    @action(detail=True, methods=["post"], authentication_classes=[RequiresSessionAuth])
+    def turn(self, request, pk=None):
         serializer: ShiritoriTurnSerializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
+        # Hot games are played from the hot state by Game.take_turn, only the game row is read here.
+        game = self.get_object()
         game.take_turn(request.session.session_key, **serializer.validated_data)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
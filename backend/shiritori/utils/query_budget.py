@@ -0,0 +1,162 @@
+"""
+Counts the SQL queries of each HTTP action, websocket handler and Celery task, and checks them against a budget.
+
+Every database connection gets an execute wrapper that adds its queries to the ``QueryRecord`` of the current context.
+The record lives in a context variable, so queries run through ``sync_to_async`` from a websocket handler still count
+towards the handler. A record over its budget, or with one statement repeated more than ``QUERY_BUDGET_REPEAT_LIMIT``
+times (the shape of an N+1), logs a warning, or raises ``QueryBudgetExceeded`` when ``QUERY_BUDGET_RAISE`` is set,
+as it is in tests.
+"""
+
+import contextlib
+import contextvars
+import dataclasses
+import logging
+import time
+from collections import Counter
+
+from celery import Task
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+__all__ = (
+    "QueryBudgetExceeded",
+    "QueryRecord",
+    "query_budget",
+    "QueryBudgetViewSetMixin",
+    "QueryBudgetConsumerMixin",
+    "QueryBudgetTask",
+)
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetExceeded(Exception):
+    pass
+
+
+@dataclasses.dataclass
+class QueryRecord:
+    name: str
+    budget: int | None = None
+    count: int = 0
+    time: float = 0.0
+    statements: Counter = dataclasses.field(default_factory=Counter)
+
+    def get_problems(self) -> list[str]:
+        """
+        What is wrong with the queries, nothing unless the record has a budget.
+        :return: list[str] - The problems.
+        """
+        if self.budget is None:
+            return []
+        problems = []
+        if self.count > self.budget:
+            problems.append(f"ran {self.count} queries, over its budget of {self.budget}")
+        for sql, count in self.statements.most_common():
+            if count <= settings.QUERY_BUDGET_REPEAT_LIMIT:
+                break
+            problems.append(f"ran the same query {count} times, likely an N+1: {sql[:200]}")
+        return problems
+
+    def check(self) -> None:
+        """
+        Log the queries, and report them if they broke the budget.
+        :raises QueryBudgetExceeded: If they broke the budget and ``QUERY_BUDGET_RAISE`` is set.
+        """
+        logger.debug("%s ran %d queries in %.1fms", self.name, self.count, self.time * 1000)
+        if not (problems := self.get_problems()):
+            return
+        message = f"{self.name} {'; '.join(problems)} ({self.time * 1000:.1f}ms)"
+        if settings.QUERY_BUDGET_RAISE:
+            raise QueryBudgetExceeded(message)
+        logger.warning(message)
+
+
+_current_record: contextvars.ContextVar[QueryRecord | None] = contextvars.ContextVar("query_record", default=None)
+
+
+def _record_query(execute, sql, params, many, context):
+    if (record := _current_record.get()) is None:
+        return execute(sql, params, many, context)
+    started_at = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        record.count += 1
+        record.time += time.perf_counter() - started_at
+        record.statements[sql] += 1
+
+
+@receiver(connection_created)
+def install_query_recorder(sender, connection, **kwargs):
+    if _record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record_query)
+
+
+@contextlib.contextmanager
+def query_budget(name: str, budget: int | None = None):
+    """
+    Record the queries run inside the block, and check them against a budget once it exits without an error.
+    The queries of a nested block count towards the enclosing block too.
+    :param name: str - What runs the queries, for the log.
+    :param budget: int | None - The most queries allowed, None to only record them.
+    :return: QueryRecord - The record, its name and budget can still be changed inside the block.
+    :raises QueryBudgetExceeded: If the block broke the budget and ``QUERY_BUDGET_RAISE`` is set.
+    """
+    parent = _current_record.get()
+    record = QueryRecord(name, budget)
+    token = _current_record.set(record)
+    try:
+        yield record
+    finally:
+        _current_record.reset(token)
+        if parent is not None:
+            parent.count += record.count
+            parent.time += record.time
+            parent.statements.update(record.statements)
+    record.check()
+
+
+class QueryBudgetViewSetMixin:
+    """
+    Checks every action of a viewset against its budget in ``query_budgets``, by action name.
+    """
+
+    query_budgets: dict[str, int] = {}
+
+    def dispatch(self, request, *args, **kwargs):
+        with query_budget(type(self).__name__) as record:
+            response = super().dispatch(request, *args, **kwargs)
+            # The action is only known once the request was initialized.
+            record.name = f"{type(self).__name__}.{self.action}"
+            record.budget = self.query_budgets.get(self.action)
+        return response
+
+
+class QueryBudgetConsumerMixin:
+    """
+    Checks every handler of a consumer against its budget in ``query_budgets``, by message type,
+    or against ``default_query_budget`` for the message types not listed there.
+    """
+
+    query_budgets: dict[str, int | None] = {}
+    default_query_budget: int | None = None
+
+    async def dispatch(self, message):
+        budget = self.query_budgets.get(message["type"], self.default_query_budget)
+        with query_budget(f"{type(self).__name__}.{message['type']}", budget):
+            await super().dispatch(message)
+
+
+class QueryBudgetTask(Task):
+    """
+    The base of every Celery task. A task declares its budget with ``@shared_task(query_budget=...)``.
+    """
+
+    query_budget: int | None = None
+
+    def __call__(self, *args, **kwargs):
+        with query_budget(f"task {self.name}", self.query_budget):
+            return super().__call__(*args, **kwargs)
@@ -85,6 +85,9 @@ export interface components {
             status: "WAITING" | "PLAYING" | "FINISHED";
             currentTurn: number;
             lastWord?: string | null;
+            /** Format: date-time */
+            turnDeadline?: string | null;
+            readonly revision: number;
         };
         ShiritoriGameSettings: {
             /**
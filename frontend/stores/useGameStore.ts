@@ -14,11 +14,14 @@ export const useGameStore = defineStore("game", () => {
         apiGameRestartCreate,
         apiCsrfCookieCreate,
         apiGameTurnCreate,
+        apiGameRetrieve,
     } = useApi();
     const game = ref<components["schemas"]["ShiritoriGame"]>();
     const myId = ref<string>();
     const isJoining = ref<boolean | undefined>();
     const gameTurnTimeLeft = ref<number>(0);
+    const turnDeadline = ref<number>(0);
+    let turnTimer: ReturnType<typeof setInterval> | undefined;
     const initialSettings =
         ref<components["schemas"]["ShiritoriGameSettings"]>();
     const isGameStarting = ref<boolean>(false);
@@ -238,6 +241,47 @@ export const useGameStore = defineStore("game", () => {
         setTurnTimeLeft(g.turnTimeLeft);
     };
 
+    const refreshGame = async () => {
+        const { data, error } = await apiGameRetrieve({ id: game.value!.id });
+        if (error.value) {
+            throw error.value;
+        }
+        setGame(data.value!);
+    };
+
+    const updateGame = async (
+        changes: Partial<components["schemas"]["ShiritoriGame"]>
+    ) => {
+        if (!game.value) {
+            setGame(changes as components["schemas"]["ShiritoriGame"]);
+            return;
+        }
+        // An update that arrived after a newer one, or after a refresh that already included it.
+        if (
+            changes.revision !== undefined &&
+            changes.revision <= game.value.revision
+        ) {
+            return;
+        }
+        // The whole game, e.g. when its status changed.
+        if (changes.players) {
+            setGame(changes as components["schemas"]["ShiritoriGame"]);
+            return;
+        }
+        if (changes.revision === undefined) {
+            return;
+        }
+        // Missed an update, so the changes cannot be applied on top of what we have.
+        if (changes.revision !== game.value.revision + 1) {
+            await refreshGame();
+            return;
+        }
+        Object.assign(game.value, changes);
+        if (changes.turnTimeLeft !== undefined) {
+            setTurnTimeLeft(changes.turnTimeLeft);
+        }
+    };
+
     const setMe = (m: string) => {
         myId.value = m;
     };
@@ -246,9 +290,28 @@ export const useGameStore = defineStore("game", () => {
         isJoining.value = i;
     };
 
+    const tickTurnTimer = () => {
+        const timeLeft = Math.max(
+            0,
+            Math.ceil((turnDeadline.value - Date.now()) / 1000)
+        );
+        gameTurnTimeLeft.value = timeLeft;
+        if (timeLeft === 0 && turnTimer) {
+            clearInterval(turnTimer);
+            turnTimer = undefined;
+        }
+    };
+
     const setTurnTimeLeft = (t: number) => {
         if (t) {
-            gameTurnTimeLeft.value = t;
+            // The server only sends the time left when a turn changes,
+            // so count down to the turn deadline locally.
+            // Using the time left instead of the deadline itself keeps clock skew out of it.
+            turnDeadline.value = Date.now() + t * 1000;
+            tickTurnTimer();
+            if (!turnTimer) {
+                turnTimer = setInterval(tickTurnTimer, 250);
+            }
         }
     };
 
@@ -256,7 +319,7 @@ export const useGameStore = defineStore("game", () => {
         const eventData = JSON.parse(e.data);
         switch (eventData.type) {
             case "game_updated":
-                setGame(eventData.data);
+                updateGame(eventData.data);
                 break;
             case "game_timer_updated":
                 setTurnTimeLeft(eventData.data);